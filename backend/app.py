@@ -1,11 +1,23 @@
 """Application factory and FastAPI app instance."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 
-from .config import APP_DESCRIPTION, APP_TITLE, APP_VERSION, STATIC_DIR
-from .routes import router
+from .config import APP_DESCRIPTION, APP_TITLE, APP_VERSION
+from . import routes
+from .static_files import PrecompressedStaticFiles, resolve_static_dir
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await routes.save_store.start()
+    try:
+        yield
+    finally:
+        await routes.save_store.stop()
+
 
-app = FastAPI(title=APP_TITLE, description=APP_DESCRIPTION, version=APP_VERSION)
-app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
-app.include_router(router)
+app = FastAPI(title=APP_TITLE, description=APP_DESCRIPTION, version=APP_VERSION, lifespan=lifespan)
+app.mount("/static", PrecompressedStaticFiles(directory=resolve_static_dir()), name="static")
+app.include_router(routes.router)
@@ -2,6 +2,7 @@
 Backend configuration for Summan Data Clicker.
 """
 
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -9,6 +10,22 @@ FRONTEND_DIR = BASE_DIR / "frontend"
 TEMPLATES_DIR = FRONTEND_DIR / "templates"
 STATIC_DIR = FRONTEND_DIR / "static"
 
+# Output of `python -m backend.static_build`: hashed + precompressed copy of STATIC_DIR.
+STATIC_BUILD_DIR = BASE_DIR / "build" / "static"
+STATIC_MANIFEST_NAME = "asset-manifest.json"
+
+# Building/upgrade/achievement/prestige definitions: authored in CONTENT_SOURCE_DIR,
+# compiled by `python -m backend.content` into CONTENT_DATA_PATH for the game and Python tools.
+CONTENT_SOURCE_DIR = FRONTEND_DIR / "content"
+CONTENT_DATA_PATH = STATIC_DIR / "data" / "content.json"
+
+# Server-side save sync (SQLite, WAL mode).
+SAVES_DB_PATH = Path(os.environ.get("SUMMAN_SAVES_DB", BASE_DIR / "data" / "saves.sqlite3"))
+SAVE_FLUSH_INTERVAL_SECONDS = 2.0
+MAX_SAVE_BYTES = 256 * 1024
+
 APP_VERSION = "0.2.4"
+DEFAULT_LANGUAGE = "es"
+SUPPORTED_LANGUAGES = ("es", "en")
 APP_TITLE = "Summan Data Clicker"
 APP_DESCRIPTION = "An incremental game themed around Summan's digital transformation"
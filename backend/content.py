@@ -0,0 +1,132 @@
+"""Build step for the shared game content.
+
+The building, upgrade, achievement and prestige definitions are authored as
+JSON in ``frontend/content``. This module validates them and writes
+``frontend/static/data/content.json``: the four definition lists plus lookup
+indexes (positions into those lists: by id, and upgrades by effect type,
+target building and requirement type), so neither the browser nor Python tools
+have to scan the lists at runtime.
+
+The game fetches the file through the ``/static`` mount, which serves its
+hashed URL as immutable. Run with ``python -m backend.content`` after editing
+anything in ``frontend/content``.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from .config import CONTENT_DATA_PATH, CONTENT_SOURCE_DIR
+
+# Output key -> source file in CONTENT_SOURCE_DIR.
+SOURCES = {
+    "buildings": "buildings.json",
+    "upgrades": "upgrades.json",
+    "achievements": "achievements.json",
+    "prestigeUpgrades": "prestige-upgrades.json",
+}
+
+
+class ContentError(ValueError):
+    """Raised when the content sources are inconsistent."""
+
+
+def load_sources(source_dir: Path = CONTENT_SOURCE_DIR) -> dict:
+    source_dir = Path(source_dir)
+    content = {}
+    for key, filename in SOURCES.items():
+        with open(source_dir / filename, encoding="utf-8") as handle:
+            content[key] = json.load(handle)
+    return content
+
+
+def _index_by_id(definitions: list[dict], kind: str) -> dict[str, int]:
+    index = {}
+    for position, definition in enumerate(definitions):
+        if definition["id"] in index:
+            raise ContentError(f"duplicate {kind} id {definition['id']!r}")
+        index[definition["id"]] = position
+    return index
+
+
+def _upgrade_targets(upgrade: dict) -> list[str]:
+    """Buildings whose production an upgrade changes."""
+    effect = upgrade["effect"]
+    targets = list(effect.get("targets") or [])
+    if effect.get("target"):
+        targets.insert(0, effect["target"])
+    return targets
+
+
+def build_indexes(content: dict) -> dict:
+    """Compute the lookup indexes and check that every cross-reference resolves."""
+    buildings = _index_by_id(content["buildings"], "building")
+    upgrades = _index_by_id(content["upgrades"], "upgrade")
+    achievements = _index_by_id(content["achievements"], "achievement")
+    prestige_upgrades = _index_by_id(content["prestigeUpgrades"], "prestige upgrade")
+
+    def require(known: dict, reference: str | None, owner: str) -> None:
+        if reference is not None and reference not in known:
+            raise ContentError(f"{owner} refers to unknown id {reference!r}")
+
+    by_effect_type: dict[str, list[int]] = {}
+    by_target: dict[str, list[int]] = {}
+    by_requirement_type: dict[str, list[int]] = {}
+    for position, upgrade in enumerate(content["upgrades"]):
+        owner = f"upgrade {upgrade['id']!r}"
+        by_effect_type.setdefault(upgrade["effect"]["type"], []).append(position)
+        for target in _upgrade_targets(upgrade):
+            require(buildings, target, owner)
+            by_target.setdefault(target, []).append(position)
+        require(buildings, upgrade["effect"].get("per"), owner)
+
+        requirement = upgrade.get("requirement")
+        if requirement:
+            if requirement["type"] == "building_count":
+                require(buildings, requirement.get("target"), owner)
+                require(buildings, requirement.get("target2"), owner)
+            elif requirement["type"] == "upgrade":
+                require(upgrades, requirement.get("target"), owner)
+            by_requirement_type.setdefault(requirement["type"], []).append(position)
+
+    for achievement in content["achievements"]:
+        require(buildings, achievement.get("building"), f"achievement {achievement['id']!r}")
+
+    return {
+        "buildingsById": buildings,
+        "upgradesById": upgrades,
+        "achievementsById": achievements,
+        "prestigeUpgradesById": prestige_upgrades,
+        "upgradesByEffectType": by_effect_type,
+        "upgradesByTarget": by_target,
+        "upgradesByRequirementType": by_requirement_type,
+    }
+
+
+def render(content: dict) -> bytes:
+    """Serialize ``content`` with its indexes as compact UTF-8 JSON."""
+    document = {**content, "indexes": build_indexes(content)}
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def build(source_dir: Path = CONTENT_SOURCE_DIR, output_path: Path = CONTENT_DATA_PATH) -> bytes:
+    """Write ``content.json`` from the sources and return its bytes."""
+    data = render(load_sources(source_dir))
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(data)
+    return data
+
+
+def main() -> int:
+    try:
+        data = build()
+    except ContentError as error:
+        print(f"Invalid content: {error}", file=sys.stderr)
+        return 1
+    print(f"Wrote {CONTENT_DATA_PATH} ({len(data)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Render-once response bodies with strong ETags and conditional GET support."""
+
+import hashlib
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+
+from fastapi import Request
+from fastapi.responses import Response
+
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """A fully rendered response body and its strong validator."""
+
+    body: bytes
+    etag: str
+    media_type: str
+
+    @classmethod
+    def from_bytes(cls, body: bytes, media_type: str) -> "CachedBody":
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        return cls(body=body, etag=f'"{digest}"', media_type=media_type)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate ``If-None-Match`` against ``etag`` (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def conditional_response(
+    request: Request,
+    cached: CachedBody,
+    *,
+    vary: Iterable[str] = (),
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> Response:
+    """Return ``cached`` as a 200, or a bodiless 304 when the client copy is current."""
+    headers = {"ETag": cached.etag, "Cache-Control": cache_control}
+    vary = ", ".join(vary)
+    if vary:
+        headers["Vary"] = vary
+
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type=cached.media_type, headers=headers)
+
+
+class ResponseCache:
+    """Memoizes rendered bodies by key; entries live for the life of the process."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, CachedBody] = {}
+
+    def get_or_render(self, key: Hashable, render: Callable[[], CachedBody]) -> CachedBody:
+        cached = self._entries.get(key)
+        if cached is None:
+            cached = self._entries[key] = render()
+        return cached
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,19 +1,118 @@
 """FastAPI routes for Summan Data Clicker."""
 
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+import json
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 
-from .config import APP_VERSION, TEMPLATES_DIR
+from .config import (
+    APP_VERSION,
+    DEFAULT_LANGUAGE,
+    MAX_SAVE_BYTES,
+    SAVE_FLUSH_INTERVAL_SECONDS,
+    SAVES_DB_PATH,
+    SUPPORTED_LANGUAGES,
+    TEMPLATES_DIR,
+)
+from .response_cache import CachedBody, ResponseCache, conditional_response
+from .saves import SaveConflictError, SaveStore, is_valid_player_id
+from .static_files import static_url
 
 templates = Jinja2Templates(directory=TEMPLATES_DIR)
+templates.env.globals["static_url"] = static_url
 router = APIRouter()
+response_cache = ResponseCache()
+save_store = SaveStore(SAVES_DB_PATH, flush_interval=SAVE_FLUSH_INTERVAL_SECONDS)
+
+SAVE_CACHE_CONTROL = "private, no-cache"
+
+GAME_CONFIG = {
+    "version": APP_VERSION,
+    "autosave_interval_seconds": 30,
+    "tick_rate_ms": 33,
+    "render_interval_ms": 0,
+    "default_language": DEFAULT_LANGUAGE,
+    "branding": {
+        "primary_green": "#9ac31c",
+        "primary_orange": "#f18a00",
+        "accent_purple": "#483F91",
+        "accent_teal": "#55B8B2",
+        "genai_blue": "#517BBD",
+        "devops_red": "#E7481D",
+    },
+}
+
+
+def negotiate_language(accept_language: str | None) -> str:
+    """Pick the best supported language from an ``Accept-Language`` header."""
+    best_language, best_quality = DEFAULT_LANGUAGE, 0.0
+    for part in (accept_language or "").split(","):
+        tag, _, params = part.strip().partition(";")
+        language = tag.strip().lower().split("-")[0]
+        if language not in SUPPORTED_LANGUAGES:
+            continue
+
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                continue
+        if quality > best_quality:
+            best_language, best_quality = language, quality
+    return best_language
+
+
+def parse_version_tag(value: str | None) -> int | None:
+    """Parse an ``If-Match`` header carrying a save version ETag (``"12"``)."""
+    if not value or value.strip() == "*":
+        return None
+    try:
+        return int(value.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Malformed If-Match header")
+
+
+def require_player_id(player_id: str) -> None:
+    if not is_valid_player_id(player_id):
+        raise HTTPException(status_code=400, detail="Invalid player id")
+
+
+async def read_save_body(request: Request, max_bytes: int = MAX_SAVE_BYTES) -> dict:
+    """Read and decode a JSON object request body, enforcing the save size limit."""
+    declared_length = request.headers.get("content-length")
+    if declared_length and declared_length.isdigit() and int(declared_length) > max_bytes:
+        raise HTTPException(status_code=413, detail="Save too large")
+
+    body = await request.body()
+    if len(body) > max_bytes:
+        raise HTTPException(status_code=413, detail="Save too large")
+
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Save must be valid JSON")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Save must be a JSON object")
+    return data
+
+
+def render_index(language: str) -> CachedBody:
+    html = templates.get_template("index.html").render(lang=language)
+    return CachedBody.from_bytes(html.encode("utf-8"), "text/html; charset=utf-8")
 
 
 @router.get("/", response_class=HTMLResponse)
 async def index(request: Request):
-    """Serve the main game page."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    """Serve the main game page (rendered once per version and language)."""
+    language = negotiate_language(request.headers.get("accept-language"))
+    cached = response_cache.get_or_render(
+        ("index", APP_VERSION, language),
+        lambda: render_index(language),
+    )
+    return conditional_response(request, cached, vary=("Accept-Language",))
 
 
 @router.get("/api/health")
@@ -23,19 +122,65 @@ async def health_check():
 
 
 @router.get("/api/config")
-async def game_config():
+async def game_config(request: Request):
     """Return game configuration for the frontend."""
-    return {
-        "version": APP_VERSION,
-        "autosave_interval_seconds": 30,
-        "tick_rate_ms": 33,
-        "default_language": "es",
-        "branding": {
-            "primary_green": "#9ac31c",
-            "primary_orange": "#f18a00",
-            "accent_purple": "#483F91",
-            "accent_teal": "#55B8B2",
-            "genai_blue": "#517BBD",
-            "devops_red": "#E7481D",
-        },
-    }
+    cached = response_cache.get_or_render(
+        ("config", APP_VERSION),
+        lambda: CachedBody.from_bytes(
+            json.dumps(GAME_CONFIG, separators=(",", ":")).encode("utf-8"),
+            "application/json",
+        ),
+    )
+    return conditional_response(request, cached)
+
+
+@router.get("/api/saves/{player_id}")
+async def get_save(player_id: str, request: Request):
+    """Return a player's server-side save; 304 when the client already has this version."""
+    require_player_id(player_id)
+    record = await save_store.get(player_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="No save for this player")
+
+    cached = CachedBody(body=record.payload, etag=record.etag, media_type="application/json")
+    return conditional_response(request, cached, cache_control=SAVE_CACHE_CONTROL)
+
+
+@router.put("/api/saves/{player_id}")
+async def put_save(player_id: str, request: Request):
+    """Store a full save. ``If-Match: "<version>"`` rejects uploads based on a stale version."""
+    require_player_id(player_id)
+    expected_version = parse_version_tag(request.headers.get("if-match"))
+    data = await read_save_body(request)
+
+    try:
+        record = await save_store.put(player_id, data, expected_version)
+    except SaveConflictError as exc:
+        raise HTTPException(
+            status_code=412,
+            detail="Save was updated elsewhere",
+            headers={"ETag": f'"{exc.current_version}"'},
+        )
+
+    return JSONResponse({"version": record.version}, headers={"ETag": record.etag})
+
+
+@router.patch("/api/saves/{player_id}")
+async def patch_save(player_id: str, request: Request):
+    """Apply a JSON merge patch (RFC 7386) to the version named by the required ``If-Match``."""
+    require_player_id(player_id)
+    base_version = parse_version_tag(request.headers.get("if-match"))
+    if base_version is None:
+        raise HTTPException(status_code=428, detail="Delta uploads require If-Match")
+    patch = await read_save_body(request)
+
+    try:
+        record = await save_store.patch(player_id, patch, base_version)
+    except SaveConflictError as exc:
+        raise HTTPException(
+            status_code=412,
+            detail="Delta base is not the current save",
+            headers={"ETag": f'"{exc.current_version}"'},
+        )
+
+    return JSONResponse({"version": record.version}, headers={"ETag": record.etag})
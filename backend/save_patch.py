@@ -0,0 +1,22 @@
+"""JSON Merge Patch (RFC 7386) for delta-encoded save uploads.
+
+Patches are applied without mutating their target: untouched sub-objects are
+shared with the original, so applying a small delta to a large save only
+copies the dicts on the patched paths.
+"""
+
+from typing import Any
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """Return ``target`` with ``patch`` applied; ``null`` members delete keys."""
+    if not isinstance(patch, dict):
+        return patch
+
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
@@ -0,0 +1,320 @@
+"""Server-side save storage for Summan Data Clicker.
+
+Saves are kept in a local SQLite database in WAL mode. Uploads only update an
+in-memory record and mark the player dirty; a background task writes every
+dirty player in one transaction per flush interval, so a burst of autosaves
+costs one commit instead of one fsync per request.
+
+Uploads are either full snapshots or JSON merge patches against the previous
+version. Patches are persisted as small rows in ``save_deltas``; every
+``snapshot_every`` deltas the full document is rewritten and the deltas dropped.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+from .save_patch import apply_merge_patch
+
+logger = logging.getLogger(__name__)
+
+PLAYER_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    player_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS save_deltas (
+    player_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    patch TEXT NOT NULL,
+    PRIMARY KEY (player_id, version)
+) WITHOUT ROWID;
+"""
+
+
+class SaveConflictError(Exception):
+    """Raised when an upload's expected version does not match the stored one."""
+
+    def __init__(self, current_version: int) -> None:
+        super().__init__(f"save is at version {current_version}")
+        self.current_version = current_version
+
+
+def encode_json(data) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class SaveRecord:
+    """One player's latest save. Treated as immutable; ``payload`` is encoded on demand."""
+
+    player_id: str
+    version: int
+    data: dict
+    deltas_since_snapshot: int = 0
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+    @cached_property
+    def payload(self) -> bytes:
+        return encode_json(self.data)
+
+
+def is_valid_player_id(player_id: str) -> bool:
+    return bool(PLAYER_ID_PATTERN.match(player_id))
+
+
+class SaveStore:
+    """SQLite-backed save store with an LRU of recent records and batched writes."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        flush_interval: float = 2.0,
+        cache_size: int = 4096,
+        snapshot_every: int = 20,
+    ) -> None:
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.cache_size = cache_size
+        self.snapshot_every = snapshot_every
+
+        self._records: OrderedDict[str, SaveRecord] = OrderedDict()
+        self._dirty: set[str] = set()
+        # Per dirty player: either a full snapshot is due, or a list of (version, patch) rows.
+        self._needs_snapshot: set[str] = set()
+        self._pending_deltas: dict[str, list[tuple[int, bytes]]] = {}
+        self._connection: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def open(self) -> None:
+        if self._connection is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL only syncs on checkpoints; a crash can lose the last flush, never corrupt.
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        connection.commit()
+        self._connection = connection
+
+    async def start(self) -> None:
+        """Open the database and start the background flusher."""
+        self.open()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._run_flusher())
+
+    async def stop(self) -> None:
+        """Stop the flusher, write any pending saves and close the database."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except sqlite3.Error:
+                logger.exception("Failed to flush saves; will retry")
+
+    # -- reads / writes ----------------------------------------------------
+
+    async def get(self, player_id: str) -> SaveRecord | None:
+        record = self._records.get(player_id)
+        if record is not None:
+            self._records.move_to_end(player_id)
+            return record
+
+        record = await asyncio.to_thread(self._read, player_id)
+        # A write may have landed while we were reading; the in-memory copy wins.
+        cached = self._records.get(player_id)
+        if cached is not None:
+            return cached
+        if record is not None:
+            self._remember(record)
+        return record
+
+    async def put(self, player_id: str, data: dict, expected_version: int | None = None) -> SaveRecord:
+        """Store ``data`` as the player's next version and schedule it for writing."""
+        await self.get(player_id)
+        current = self._records.get(player_id)
+        current_version = current.version if current else 0
+
+        if expected_version is not None and expected_version != current_version:
+            raise SaveConflictError(current_version)
+
+        record = SaveRecord(player_id=player_id, version=current_version + 1, data=data)
+        self._mark_snapshot(player_id)
+        self._remember(record)
+        return record
+
+    async def patch(self, player_id: str, patch: dict, base_version: int) -> SaveRecord:
+        """Apply a JSON merge patch on top of ``base_version`` (which must be current)."""
+        await self.get(player_id)
+        current = self._records.get(player_id)
+        current_version = current.version if current else 0
+
+        if current is None or base_version != current_version:
+            raise SaveConflictError(current_version)
+
+        data = apply_merge_patch(current.data, patch)
+        version = current_version + 1
+        deltas = current.deltas_since_snapshot + 1
+
+        if player_id in self._needs_snapshot or deltas >= self.snapshot_every:
+            # The pending snapshot is taken from the latest record, so it covers this patch.
+            record = SaveRecord(player_id=player_id, version=version, data=data)
+            self._mark_snapshot(player_id)
+        else:
+            record = SaveRecord(
+                player_id=player_id,
+                version=version,
+                data=data,
+                deltas_since_snapshot=deltas,
+            )
+            self._pending_deltas.setdefault(player_id, []).append((version, encode_json(patch)))
+            self._dirty.add(player_id)
+
+        self._remember(record)
+        return record
+
+    async def flush(self) -> int:
+        """Write every dirty player in a single transaction. Returns the batch size."""
+        async with self._flush_lock:
+            if not self._dirty:
+                return 0
+
+            snapshots = [self._records[player_id] for player_id in self._needs_snapshot]
+            deltas = [
+                (player_id, version, patch)
+                for player_id, rows in self._pending_deltas.items()
+                for version, patch in rows
+            ]
+            dirty, needs_snapshot, pending = self._dirty, self._needs_snapshot, self._pending_deltas
+            self._dirty, self._needs_snapshot, self._pending_deltas = set(), set(), {}
+
+            try:
+                await asyncio.to_thread(self._write_batch, snapshots, deltas)
+            except Exception:
+                self._restore_pending(dirty, needs_snapshot, pending)
+                raise
+            return len(dirty)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._dirty)
+
+    # -- internals ---------------------------------------------------------
+
+    def _mark_snapshot(self, player_id: str) -> None:
+        self._dirty.add(player_id)
+        self._needs_snapshot.add(player_id)
+        self._pending_deltas.pop(player_id, None)
+
+    def _restore_pending(self, dirty, needs_snapshot, pending) -> None:
+        """Re-queue a failed batch underneath anything written since it was taken."""
+        for player_id in needs_snapshot:
+            self._mark_snapshot(player_id)
+        for player_id, rows in pending.items():
+            if player_id in self._needs_snapshot:
+                continue
+            self._pending_deltas[player_id] = rows + self._pending_deltas.get(player_id, [])
+        self._dirty |= dirty
+
+    def _remember(self, record: SaveRecord) -> None:
+        self._records[record.player_id] = record
+        self._records.move_to_end(record.player_id)
+
+        excess = len(self._records) - self.cache_size
+        if excess <= 0:
+            return
+
+        # Evict the oldest clean records; dirty ones must survive until they are flushed.
+        victims = []
+        for player_id in self._records:
+            if player_id not in self._dirty:
+                victims.append(player_id)
+                if len(victims) == excess:
+                    break
+        for player_id in victims:
+            del self._records[player_id]
+
+    def _read(self, player_id: str) -> SaveRecord | None:
+        self.open()
+        with self._db_lock:
+            row = self._connection.execute(
+                "SELECT version, data FROM saves WHERE player_id = ?",
+                (player_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            version, payload = row
+            delta_rows = self._connection.execute(
+                "SELECT version, patch FROM save_deltas"
+                " WHERE player_id = ? AND version > ? ORDER BY version",
+                (player_id, version),
+            ).fetchall()
+
+        data = json.loads(payload)
+        for version, patch in delta_rows:
+            data = apply_merge_patch(data, json.loads(patch))
+        return SaveRecord(
+            player_id=player_id,
+            version=version,
+            data=data,
+            deltas_since_snapshot=len(delta_rows),
+        )
+
+    def _write_batch(self, snapshots: list[SaveRecord], deltas: list[tuple[str, int, bytes]]) -> None:
+        self.open()
+        now = time.time()
+        with self._db_lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO save_deltas (player_id, version, patch) VALUES (?, ?, ?)",
+                [(player_id, version, patch.decode("utf-8")) for player_id, version, patch in deltas],
+            )
+            self._connection.executemany(
+                "DELETE FROM save_deltas WHERE player_id = ? AND version <= ?",
+                [(record.player_id, record.version) for record in snapshots],
+            )
+            self._connection.executemany(
+                """
+                INSERT INTO saves (player_id, version, data, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (player_id) DO UPDATE SET
+                    version = excluded.version,
+                    data = excluded.data,
+                    updated_at = excluded.updated_at
+                WHERE excluded.version > saves.version
+                """,
+                [(r.player_id, r.version, r.payload.decode("utf-8"), now) for r in snapshots],
+            )
@@ -0,0 +1,20 @@
+"""Headless economy simulator for balance work.
+
+Reads the same definitions as the game (``frontend/static/data/content.json``)
+and runs thousands of games at once with NumPy. Run
+``python -m backend.sim --help`` for the command line.
+"""
+
+from .content import Content, load_content
+from .engine import BatchState, Engine
+from .runner import SimulationConfig, SimulationResult, simulate
+
+__all__ = [
+    "BatchState",
+    "Content",
+    "Engine",
+    "SimulationConfig",
+    "SimulationResult",
+    "load_content",
+    "simulate",
+]
@@ -0,0 +1,39 @@
+"""Command line entry point: ``python -m backend.sim``."""
+
+import argparse
+import json
+
+from .runner import BUY_POLICIES, SimulationConfig, simulate
+
+
+def parse_args(argv=None) -> SimulationConfig:
+    parser = argparse.ArgumentParser(description="Simulate many Summan Data Clicker runs and print percentiles.")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--hours", type=float, default=1.0, help="game time per run")
+    parser.add_argument("--tick", type=float, default=5.0, help="seconds of game time per step")
+    parser.add_argument("--cps", type=float, default=5.0, help="mean clicks per second")
+    parser.add_argument("--cps-spread", type=float, default=0.0, help="uniform spread around --cps")
+    parser.add_argument("--policy", choices=BUY_POLICIES, default="payback")
+    parser.add_argument("--prestige-at", type=int, default=None, help="prestige once this many points are pending")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    return SimulationConfig(
+        runs=args.runs,
+        duration_seconds=args.hours * 3600,
+        tick_seconds=args.tick,
+        clicks_per_second=args.cps,
+        click_rate_spread=args.cps_spread,
+        buy_policy=args.policy,
+        prestige_at_points=args.prestige_at,
+        seed=args.seed,
+    )
+
+
+def main(argv=None) -> None:
+    result = simulate(parse_args(argv))
+    print(json.dumps(result.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
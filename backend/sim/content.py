@@ -0,0 +1,70 @@
+"""Game definitions for the simulator, loaded from the generated ``content.json``.
+
+Per-building numbers become NumPy arrays in definition order, so a building's
+position in :attr:`Content.building_ids` is its column in every batch array.
+"""
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from ..config import CONTENT_DATA_PATH
+
+
+@dataclass(frozen=True, eq=False)
+class Content:
+    building_ids: tuple[str, ...]
+    base_cost: np.ndarray
+    base_dps: np.ndarray
+    growth_rate: np.ndarray
+    unlock_at: np.ndarray
+    upgrades: tuple[dict, ...]
+    achievements: tuple[dict, ...]
+    prestige_upgrades: tuple[dict, ...]
+    indexes: dict
+
+    @property
+    def building_count(self) -> int:
+        return len(self.building_ids)
+
+    def building_index(self, building_id: str) -> int:
+        return self.indexes["buildingsById"][building_id]
+
+    def upgrade_index(self, upgrade_id: str) -> int:
+        return self.indexes["upgradesById"][upgrade_id]
+
+    def achievement_index(self, achievement_id: str) -> int:
+        return self.indexes["achievementsById"][achievement_id]
+
+    def prestige_index(self, upgrade_id: str) -> int:
+        return self.indexes["prestigeUpgradesById"][upgrade_id]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Content":
+        buildings = data["buildings"]
+
+        def column(key: str) -> np.ndarray:
+            values = np.array([building[key] for building in buildings], dtype=np.float64)
+            values.flags.writeable = False
+            return values
+
+        return cls(
+            building_ids=tuple(building["id"] for building in buildings),
+            base_cost=column("baseCost"),
+            base_dps=column("baseDps"),
+            growth_rate=column("growthRate"),
+            unlock_at=column("unlockAt"),
+            upgrades=tuple(data["upgrades"]),
+            achievements=tuple(data["achievements"]),
+            prestige_upgrades=tuple(data["prestigeUpgrades"]),
+            indexes=data["indexes"],
+        )
+
+
+@lru_cache(maxsize=None)
+def load_content(path: Path = CONTENT_DATA_PATH) -> Content:
+    with open(path, encoding="utf-8") as handle:
+        return Content.from_dict(json.load(handle))
@@ -0,0 +1,372 @@
+"""NumPy port of the economy formulas, batched over many independent runs.
+
+Every per-run quantity is an array whose first axis is the run; per-building
+quantities are ``(runs, buildings)`` matrices. Owned upgrades, achievements and
+prestige upgrades are boolean masks, so multiplier products become matrix
+products over log-multipliers.
+
+Mirrors ``core/economy.js``, ``core/progression-system.js``,
+``infra/number-formatters.js`` and the ``content/`` modules. Timed effects
+(golden data, random events) are not modelled.
+"""
+
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from .content import Content
+
+INNOVATION_DATA_UNIT = 1e9
+INNOVATION_PRODUCTION_BONUS = 0.05
+
+# Columns of the stat matrix that upgrade requirements and achievements are checked against.
+STAT_TOTAL_DATA = 0
+STAT_CLICKS = 1
+STAT_DPS = 2
+STAT_MAX_BUILDING = 3
+STAT_TOTAL_BUILDINGS = 4
+STAT_PRESTIGES = 5
+STAT_NEVER = 6
+STAT_ALWAYS = 7
+STAT_FIRST_BUILDING = 8
+
+
+def building_cost(base_cost, owned, growth_rate=1.15):
+    """``Utils.calculateBuildingCost``: ceil(baseCost * growthRate^owned)."""
+    return np.ceil(base_cost * np.power(growth_rate, owned))
+
+
+def bulk_cost(base_cost: float, owned: int, count: int, growth_rate: float = 1.15) -> float:
+    """``Utils.calculateBulkCost``: rounding is applied per unit, as in the game."""
+    steps = np.arange(owned, owned + count)
+    return float(building_cost(base_cost, steps, growth_rate).sum())
+
+
+def max_affordable(base_cost: float, owned: int, budget: float, growth_rate: float = 1.15) -> tuple[int, float]:
+    """``Utils.maxAffordable``: how many units ``budget`` buys, and their total cost."""
+    if not np.isfinite(budget):
+        raise ValueError("budget must be finite")
+    first = base_cost * growth_rate**owned
+    # Without per-unit rounding the series is geometric; rounding only makes it dearer,
+    # so this is an upper bound on the count.
+    estimate = np.floor(np.log1p(max(budget, 0) * (growth_rate - 1) / first) / np.log(growth_rate))
+    limit = int(estimate) + 1
+
+    totals = np.cumsum(building_cost(base_cost, np.arange(owned, owned + limit), growth_rate))
+    count = int(np.searchsorted(totals, budget, side="right"))
+    return count, float(totals[count - 1]) if count else 0.0
+
+
+def innovation_points(total_data_all_time):
+    """``Prestige.calculateInnovationPoints``: floor(sqrt(lifetime data / 1e9))."""
+    total = np.asarray(total_data_all_time, dtype=np.float64)
+    return np.where(total < INNOVATION_DATA_UNIT, 0, np.floor(np.sqrt(total / INNOVATION_DATA_UNIT))).astype(np.int64)
+
+
+def base_multiplier(total_innovation_earned):
+    """``Prestige.getBaseMultiplier``: +5% production per innovation point earned."""
+    return 1 + np.asarray(total_innovation_earned) * INNOVATION_PRODUCTION_BONUS
+
+
+@dataclass
+class BatchState:
+    """The simulated part of the game state for ``runs`` independent games."""
+
+    data_points: np.ndarray
+    total_data_earned: np.ndarray
+    total_data_all_time: np.ndarray
+    total_clicks: np.ndarray
+    dps: np.ndarray
+    buildings: np.ndarray
+    upgrades: np.ndarray
+    achievements: np.ndarray
+    prestige_upgrades: np.ndarray
+    innovation_points: np.ndarray
+    total_innovation_earned: np.ndarray
+    times_prestiged: np.ndarray
+
+    @classmethod
+    def new(cls, content: Content, runs: int) -> "BatchState":
+        def zeros(*shape, dtype=np.float64):
+            return np.zeros((runs, *shape), dtype=dtype)
+
+        return cls(
+            data_points=zeros(),
+            total_data_earned=zeros(),
+            total_data_all_time=zeros(),
+            total_clicks=zeros(),
+            dps=zeros(),
+            buildings=zeros(content.building_count, dtype=np.int64),
+            upgrades=zeros(len(content.upgrades), dtype=bool),
+            achievements=zeros(len(content.achievements), dtype=bool),
+            prestige_upgrades=zeros(len(content.prestige_upgrades), dtype=bool),
+            innovation_points=zeros(dtype=np.int64),
+            total_innovation_earned=zeros(dtype=np.int64),
+            times_prestiged=zeros(dtype=np.int64),
+        )
+
+    @property
+    def runs(self) -> int:
+        return len(self.data_points)
+
+    def copy(self) -> "BatchState":
+        return BatchState(**{f.name: getattr(self, f.name).copy() for f in fields(self)})
+
+
+@dataclass(frozen=True)
+class PrestigeEffects:
+    """``Prestige.getAggregatedEffects`` for the economy-relevant effects, per run."""
+
+    click_mult: np.ndarray
+    production_mult: np.ndarray
+    building_discount: np.ndarray
+    start_bonus: np.ndarray
+
+
+class Engine:
+    """Vectorised economy formulas for one set of content definitions."""
+
+    def __init__(self, content: Content) -> None:
+        self.content = content
+        upgrade_count = len(content.upgrades)
+
+        self.upgrade_cost = np.array([upgrade["cost"] for upgrade in content.upgrades], dtype=np.float64)
+        self._building_log_mult = np.zeros((upgrade_count, content.building_count))
+        self._global_log_mult = np.zeros(upgrade_count)
+        self._click_log_mult = np.zeros(upgrade_count)
+        self._click_add = np.zeros(upgrade_count)
+        self._click_dps_percent = np.zeros(upgrade_count)
+        self._synergy_per: list[tuple[int, int, int, float]] = []
+
+        for index, upgrade in enumerate(content.upgrades):
+            effect = upgrade["effect"]
+            kind, value = effect["type"], effect["value"]
+            if kind == "building_mult" and effect.get("target"):
+                self._building_log_mult[index, content.building_index(effect["target"])] += np.log(value)
+            elif kind == "synergy" and effect.get("targets"):
+                for target in effect["targets"]:
+                    self._building_log_mult[index, content.building_index(target)] += np.log(value)
+            elif kind == "synergy_per" and effect.get("target") and effect.get("per"):
+                self._synergy_per.append(
+                    (index, content.building_index(effect["target"]), content.building_index(effect["per"]), value)
+                )
+            elif kind == "global_mult":
+                self._global_log_mult[index] = np.log(value)
+            elif kind == "click_mult":
+                self._click_log_mult[index] = np.log(value)
+            elif kind == "click_add":
+                self._click_add[index] = value
+            elif kind == "click_dps_percent":
+                self._click_dps_percent[index] = value
+
+        self._init_requirements()
+        self._init_achievements()
+        self._init_prestige()
+
+    # -- content tables ----------------------------------------------------
+
+    def _init_requirements(self) -> None:
+        """Encode ``Upgrades.isUnlocked`` as two stat thresholds plus a required upgrade."""
+        content = self.content
+        count = len(content.upgrades)
+        self._req_stat = np.full((count, 2), STAT_ALWAYS)
+        self._req_value = np.zeros((count, 2))
+        self._req_upgrade = np.full(count, -1)
+
+        for index, upgrade in enumerate(content.upgrades):
+            requirement = upgrade.get("requirement")
+            if not requirement:
+                continue
+            kind = requirement["type"]
+            if kind == "building_count":
+                self._req_stat[index, 0] = STAT_FIRST_BUILDING + content.building_index(requirement["target"])
+                self._req_value[index, 0] = requirement["value"]
+                if requirement.get("target2"):
+                    self._req_stat[index, 1] = STAT_FIRST_BUILDING + content.building_index(requirement["target2"])
+                    self._req_value[index, 1] = requirement["value2"]
+            elif kind == "total_data":
+                self._req_stat[index, 0] = STAT_TOTAL_DATA
+                self._req_value[index, 0] = requirement["value"]
+            elif kind == "click_count":
+                self._req_stat[index, 0] = STAT_CLICKS
+                self._req_value[index, 0] = requirement["value"]
+            elif kind == "upgrade":
+                self._req_upgrade[index] = content.upgrade_index(requirement["target"])
+            else:
+                self._req_stat[index, 0] = STAT_NEVER
+
+    def _init_achievements(self) -> None:
+        """Encode ``Achievements.checkAll`` as one stat threshold per achievement."""
+        content = self.content
+        # Like checkAll, a missing checkType means 'production' (this includes the click ones).
+        by_check_type = {
+            "production": STAT_TOTAL_DATA,
+            "any_building": STAT_MAX_BUILDING,
+            "total_buildings": STAT_TOTAL_BUILDINGS,
+            "dps": STAT_DPS,
+            "prestige_count": STAT_PRESTIGES,
+        }
+        columns = []
+        for achievement in content.achievements:
+            check_type = achievement.get("checkType") or "production"
+            if check_type == "specific_building":
+                columns.append(STAT_FIRST_BUILDING + content.building_index(achievement["building"]))
+            else:
+                # 'event' achievements depend on golden data / random events, which are not simulated.
+                columns.append(by_check_type.get(check_type, STAT_NEVER))
+
+        self._achievement_stat = np.array(columns, dtype=np.int64)
+        self._achievement_threshold = np.array([a["threshold"] for a in content.achievements], dtype=np.float64)
+        self._achievement_bonus = np.array([a["bonus"] for a in content.achievements], dtype=np.float64)
+
+    def _init_prestige(self) -> None:
+        upgrades = self.content.prestige_upgrades
+        self.prestige_cost = np.array([upgrade["cost"] for upgrade in upgrades], dtype=np.int64)
+
+        def log_values(kind: str) -> np.ndarray:
+            return np.array([np.log(u["effect"]["value"]) if u["effect"]["type"] == kind else 0.0 for u in upgrades])
+
+        self._prestige_click_log = log_values("click_mult")
+        self._prestige_production_log = log_values("production_mult")
+        self._prestige_discount_log = log_values("building_discount")
+        self._prestige_start_bonus = np.array(
+            [u["effect"]["value"] if u["effect"]["type"] == "start_bonus" else 0.0 for u in upgrades]
+        )
+
+    # -- formulas ----------------------------------------------------------
+
+    def stats(self, state: BatchState) -> np.ndarray:
+        """The ``(runs, stats)`` matrix indexed by the ``STAT_*`` columns."""
+        fixed = np.column_stack(
+            [
+                state.total_data_earned,
+                state.total_clicks,
+                state.dps,
+                state.buildings.max(axis=1),
+                state.buildings.sum(axis=1),
+                state.times_prestiged,
+                np.full(state.runs, -np.inf),
+                np.full(state.runs, np.inf),
+            ]
+        )
+        return np.concatenate([fixed, state.buildings], axis=1)
+
+    def prestige_effects(self, state: BatchState) -> PrestigeEffects:
+        owned = state.prestige_upgrades
+        return PrestigeEffects(
+            click_mult=np.exp(owned @ self._prestige_click_log),
+            production_mult=np.exp(owned @ self._prestige_production_log),
+            building_discount=np.exp(owned @ self._prestige_discount_log),
+            start_bonus=np.where(owned, self._prestige_start_bonus, 0.0).max(axis=1, initial=0.0),
+        )
+
+    def upgrade_multipliers(self, state: BatchState) -> np.ndarray:
+        """Per-building multipliers from ``building_mult`` and ``synergy`` upgrades only.
+
+        These change only when upgrades are bought, so callers may reuse them.
+        """
+        return np.exp(state.upgrades @ self._building_log_mult)
+
+    def building_multipliers(self, state: BatchState, upgrade_multipliers: np.ndarray | None = None) -> np.ndarray:
+        """``state.buildingMultipliers`` as a ``(runs, buildings)`` matrix."""
+        if upgrade_multipliers is None:
+            multipliers = self.upgrade_multipliers(state)
+        else:
+            multipliers = upgrade_multipliers.copy()
+        for upgrade, target, per, value in self._synergy_per:
+            per_count = state.buildings[:, per]
+            active = state.upgrades[:, upgrade] & (per_count > 0)
+            multipliers[:, target] *= np.where(active, 1 + value * per_count, 1.0)
+        return multipliers
+
+    def achievement_bonus(self, state: BatchState) -> np.ndarray:
+        """``Achievements.getTotalBonus``."""
+        return 1 + state.achievements @ self._achievement_bonus
+
+    def production_multiplier(self, state: BatchState, effects: PrestigeEffects | None = None) -> np.ndarray:
+        """Everything ``recalculateDps`` applies on top of the per-building sum."""
+        effects = effects or self.prestige_effects(state)
+        return (
+            np.exp(state.upgrades @ self._global_log_mult)
+            * self.achievement_bonus(state)
+            * effects.production_mult
+            * base_multiplier(state.total_innovation_earned)
+        )
+
+    def recalculate_dps(
+        self,
+        state: BatchState,
+        effects: PrestigeEffects | None = None,
+        upgrade_multipliers: np.ndarray | None = None,
+    ) -> np.ndarray:
+        multipliers = self.building_multipliers(state, upgrade_multipliers)
+        per_building = self.content.base_dps * state.buildings * multipliers
+        state.dps = per_building.sum(axis=1) * self.production_multiplier(state, effects)
+        return state.dps
+
+    def click_value(self, state: BatchState, effects: PrestigeEffects | None = None) -> np.ndarray:
+        """``calculateClickValue``; uses the current ``state.dps``."""
+        effects = effects or self.prestige_effects(state)
+        click_mult = np.exp(state.upgrades @ self._click_log_mult) * effects.click_mult
+        click_add = state.upgrades @ self._click_add
+        dps_percent = state.upgrades @ self._click_dps_percent
+        return (1 + click_add) * click_mult + state.dps * dps_percent
+
+    def next_building_costs(self, state: BatchState, effects: PrestigeEffects | None = None) -> np.ndarray:
+        """Price of the next unit of every building, with the prestige discount applied."""
+        effects = effects or self.prestige_effects(state)
+        base_cost = self.content.base_cost * effects.building_discount[:, None]
+        return building_cost(base_cost, state.buildings, self.content.growth_rate)
+
+    def visible_buildings(self, state: BatchState) -> np.ndarray:
+        """``Buildings.getVisible`` as a ``(runs, buildings)`` mask."""
+        return state.total_data_earned[:, None] >= self.content.unlock_at
+
+    def unlocked_upgrades(
+        self,
+        state: BatchState,
+        stats: np.ndarray | None = None,
+        columns: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """``Upgrades.getAvailable``: unlocked and not yet owned, as a ``(runs, upgrades)`` mask.
+
+        With ``columns``, only those upgrades are checked (and returned, in that order).
+        """
+        stats = self.stats(state) if stats is None else stats
+        columns = slice(None) if columns is None else columns
+        required = self._req_upgrade[columns]
+
+        met = (stats[:, self._req_stat[columns]] >= self._req_value[columns]).all(axis=2)
+        has_required = np.where(required >= 0, state.upgrades[:, np.maximum(required, 0)], True)
+        return met & has_required & ~state.upgrades[:, columns]
+
+    def check_achievements(self, state: BatchState, stats: np.ndarray | None = None) -> np.ndarray:
+        """``Achievements.checkAll``: unlock and return the newly earned achievements."""
+        stats = self.stats(state) if stats is None else stats
+        reached = stats[:, self._achievement_stat] >= self._achievement_threshold
+        newly = reached & ~state.achievements
+        state.achievements |= newly
+        return newly
+
+    def pending_innovation_points(self, state: BatchState) -> np.ndarray:
+        """``getInnovationPointsPreview``."""
+        return innovation_points(state.total_data_all_time) - state.total_innovation_earned
+
+    def prestige(self, state: BatchState, mask: np.ndarray) -> np.ndarray:
+        """``performPrestige`` for the runs in ``mask`` that have points to gain."""
+        points = self.pending_innovation_points(state)
+        mask = mask & (points > 0)
+        if not mask.any():
+            return mask
+
+        start_bonus = self.prestige_effects(state).start_bonus
+        state.innovation_points += np.where(mask, points, 0)
+        state.total_innovation_earned += np.where(mask, points, 0)
+        state.times_prestiged += mask
+        state.buildings[mask] = 0
+        state.upgrades[mask] = False
+        state.total_clicks[mask] = 0
+        state.data_points[mask] = start_bonus[mask]
+        state.total_data_earned[mask] = start_bonus[mask]
+        self.recalculate_dps(state)
+        return mask
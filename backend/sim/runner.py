@@ -0,0 +1,207 @@
+"""Batch simulation of full runs: clicking, buying and prestiging on a fixed tick."""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .content import Content, load_content
+from .engine import BatchState, Engine, PrestigeEffects, building_cost
+
+BUY_POLICIES = ("cheapest", "payback")
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """Player behaviour shared by every run in a batch.
+
+    ``clicks_per_second`` is drawn uniformly per run from
+    ``clicks_per_second ± click_rate_spread``. With ``prestige_at_points`` set,
+    a run prestiges as soon as it would gain at least that many innovation
+    points, then spends them on prestige upgrades cheapest first.
+    """
+
+    runs: int = 1000
+    duration_seconds: float = 3600.0
+    tick_seconds: float = 5.0
+    clicks_per_second: float = 5.0
+    click_rate_spread: float = 0.0
+    buy_policy: str = "payback"
+    prestige_at_points: int | None = None
+    max_purchases_per_tick: int = 50
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.buy_policy not in BUY_POLICIES:
+            raise ValueError(f"buy_policy must be one of {BUY_POLICIES}, not {self.buy_policy!r}")
+        if self.runs <= 0 or self.tick_seconds <= 0:
+            raise ValueError("runs and tick_seconds must be positive")
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    config: SimulationConfig
+    state: BatchState
+    ticks: int
+    wall_seconds: float
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.config.runs / self.wall_seconds if self.wall_seconds else float("inf")
+
+    def summary(self) -> dict:
+        """Percentiles (p10/p50/p90) of the end-of-run numbers across the batch."""
+        state = self.state
+
+        def percentiles(values: np.ndarray) -> dict:
+            p10, p50, p90 = np.percentile(values, [10, 50, 90])
+            return {"p10": float(p10), "p50": float(p50), "p90": float(p90)}
+
+        return {
+            "runs": self.config.runs,
+            "ticks": self.ticks,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "runs_per_second": round(self.runs_per_second, 1),
+            "dps": percentiles(state.dps),
+            "total_data_all_time": percentiles(state.total_data_all_time),
+            "total_innovation_earned": percentiles(state.total_innovation_earned),
+            "times_prestiged": percentiles(state.times_prestiged),
+            "buildings_owned": percentiles(state.buildings.sum(axis=1)),
+            "upgrades_owned": percentiles(state.upgrades.sum(axis=1)),
+            "achievements_unlocked": percentiles(state.achievements.sum(axis=1)),
+        }
+
+
+def buy_upgrades(engine: Engine, state: BatchState, stats: np.ndarray | None = None) -> bool:
+    """Buy every unlocked, affordable upgrade, cheapest first. Returns whether any run bought one."""
+    # Only upgrades some run could pay for and does not own yet are worth checking.
+    columns = np.flatnonzero((engine.upgrade_cost <= state.data_points.max()) & ~state.upgrades.all(axis=0))
+    if not len(columns):
+        return False
+
+    bought = False
+
+    available = engine.unlocked_upgrades(state, stats, columns)
+    for position in np.argsort(engine.upgrade_cost[columns], kind="stable"):
+        index = columns[position]
+        cost = engine.upgrade_cost[index]
+        buy = available[:, position] & (state.data_points >= cost)
+        state.data_points -= np.where(buy, cost, 0.0)
+        state.upgrades[:, index] |= buy
+        bought = bought or bool(buy.any())
+    return bought
+
+
+def buy_buildings(
+    engine: Engine,
+    state: BatchState,
+    policy: str,
+    max_purchases: int,
+    effects: PrestigeEffects | None = None,
+    upgrade_multipliers: np.ndarray | None = None,
+) -> None:
+    """Repeatedly buy the building the policy prefers, while it is affordable.
+
+    ``cheapest`` takes the lowest price; ``payback`` the lowest price per unit of
+    added production. A run that cannot afford its preferred building saves up
+    for it instead of buying something else.
+    """
+    content = engine.content
+    effects = effects or engine.prestige_effects(state)
+    discount = effects.building_discount
+
+    costs = engine.next_building_costs(state, effects)
+    if policy == "payback":
+        # Multipliers as of the start of the purchase round; close enough for ranking.
+        gain = content.base_dps * engine.building_multipliers(state, upgrade_multipliers)
+        score = costs / gain
+    else:
+        score = costs.copy()
+    score[~engine.visible_buildings(state)] = np.inf
+
+    # Runs drop out as soon as they cannot afford their pick; only bought cells are repriced.
+    active = np.arange(state.runs)
+    for _ in range(max_purchases):
+        choice = score[active].argmin(axis=1)
+        price = costs[active, choice]
+        buy = np.isfinite(score[active, choice]) & (state.data_points[active] >= price)
+        if not buy.any():
+            break
+
+        active, choice, price = active[buy], choice[buy], price[buy]
+        state.data_points[active] -= price
+        state.buildings[active, choice] += 1
+
+        new_costs = building_cost(
+            content.base_cost[choice] * discount[active],
+            state.buildings[active, choice],
+            content.growth_rate[choice],
+        )
+        costs[active, choice] = new_costs
+        score[active, choice] = new_costs / gain[active, choice] if policy == "payback" else new_costs
+
+
+def buy_prestige_upgrades(engine: Engine, state: BatchState, mask: np.ndarray) -> None:
+    """Spend innovation points on prestige upgrades, cheapest first."""
+    for index in np.argsort(engine.prestige_cost, kind="stable"):
+        cost = engine.prestige_cost[index]
+        buy = mask & ~state.prestige_upgrades[:, index] & (state.innovation_points >= cost)
+        state.innovation_points -= np.where(buy, cost, 0)
+        state.prestige_upgrades[:, index] |= buy
+
+
+def simulate(config: SimulationConfig, content: Content | None = None) -> SimulationResult:
+    """Run ``config.runs`` games side by side for ``config.duration_seconds`` of game time."""
+    engine = Engine(content or load_content())
+    state = BatchState.new(engine.content, config.runs)
+    rng = np.random.default_rng(config.seed)
+
+    spread = config.click_rate_spread
+    clicks_per_second = np.maximum(
+        rng.uniform(config.clicks_per_second - spread, config.clicks_per_second + spread, config.runs),
+        0.0,
+    )
+    clicks_per_tick = clicks_per_second * config.tick_seconds
+    ticks = int(np.ceil(config.duration_seconds / config.tick_seconds))
+
+    # Both only change when (prestige) upgrades are bought, so they are reused until then.
+    effects = engine.prestige_effects(state)
+    upgrade_multipliers = engine.upgrade_multipliers(state)
+
+    started = time.perf_counter()
+    for _ in range(ticks):
+        produced = state.dps * config.tick_seconds + clicks_per_tick * engine.click_value(state, effects)
+        state.data_points += produced
+        state.total_data_earned += produced
+        state.total_data_all_time += produced
+        state.total_clicks += clicks_per_tick
+
+        stats = engine.stats(state)
+        engine.check_achievements(state, stats)
+        if buy_upgrades(engine, state, stats):
+            upgrade_multipliers = engine.upgrade_multipliers(state)
+        buy_buildings(
+            engine,
+            state,
+            config.buy_policy,
+            config.max_purchases_per_tick,
+            effects,
+            upgrade_multipliers,
+        )
+        engine.recalculate_dps(state, effects, upgrade_multipliers)
+
+        if config.prestige_at_points is not None:
+            ready = engine.pending_innovation_points(state) >= config.prestige_at_points
+            if ready.any():
+                prestiged = engine.prestige(state, ready)
+                buy_prestige_upgrades(engine, state, prestiged)
+                effects = engine.prestige_effects(state)
+                upgrade_multipliers = engine.upgrade_multipliers(state)
+                engine.recalculate_dps(state, effects, upgrade_multipliers)
+
+    return SimulationResult(
+        config=config,
+        state=state,
+        ticks=ticks,
+        wall_seconds=time.perf_counter() - started,
+    )
@@ -0,0 +1,88 @@
+"""Build step for the `/static` mount.
+
+Copies ``frontend/static`` into ``STATIC_BUILD_DIR`` and, for every file, writes:
+
+- a content-hashed copy (``css/style.css`` -> ``css/style.<hash>.css``),
+- ``.br`` and ``.gz`` precompressed siblings when they are meaningfully smaller,
+- an entry in ``asset-manifest.json`` mapping the logical path to the hashed one.
+
+Unhashed copies are kept so relative ES-module imports and absolute asset URLs
+inside the bundle keep resolving. Run with ``python -m backend.static_build``.
+"""
+
+import gzip
+import hashlib
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import brotli
+
+from .config import STATIC_BUILD_DIR, STATIC_DIR, STATIC_MANIFEST_NAME
+
+HASH_LENGTH = 10
+# Only keep a compressed variant when it saves at least 10% of the original size.
+MIN_COMPRESSION_RATIO = 0.9
+COMPRESSED_SUFFIXES = (".br", ".gz")
+
+
+def content_hash(data: bytes) -> str:
+    """Return the short content hash used in fingerprinted file names."""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(relative_path: str, digest: str) -> str:
+    """Insert ``digest`` before the file extension: ``js/a.js`` -> ``js/a.<digest>.js``."""
+    path = Path(relative_path)
+    return path.with_name(f"{path.stem}.{digest}{path.suffix}").as_posix()
+
+
+def _write_compressed_variants(target: Path, data: bytes) -> None:
+    variants = {
+        ".br": brotli.compress(data, quality=11),
+        # mtime=0 keeps the gzip output (and therefore builds) reproducible.
+        ".gz": gzip.compress(data, compresslevel=9, mtime=0),
+    }
+    for suffix, compressed in variants.items():
+        if len(compressed) <= len(data) * MIN_COMPRESSION_RATIO:
+            target.with_name(target.name + suffix).write_bytes(compressed)
+
+
+def build(source_dir: Path = STATIC_DIR, output_dir: Path = STATIC_BUILD_DIR) -> dict:
+    """Build the static bundle and return the logical -> hashed path manifest."""
+    source_dir = Path(source_dir)
+    output_dir = Path(output_dir)
+
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+
+    manifest = {}
+    for source in sorted(source_dir.rglob("*")):
+        if not source.is_file():
+            continue
+
+        relative = source.relative_to(source_dir).as_posix()
+        data = source.read_bytes()
+        fingerprinted = hashed_name(relative, content_hash(data))
+        manifest[relative] = fingerprinted
+
+        for name in (relative, fingerprinted):
+            target = output_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+            _write_compressed_variants(target, data)
+
+    manifest_path = output_dir / STATIC_MANIFEST_NAME
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return manifest
+
+
+def main() -> int:
+    manifest = build()
+    print(f"Built {len(manifest)} static assets into {STATIC_BUILD_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""`StaticFiles` variant that serves the output of `backend.static_build`.
+
+- Negotiates ``Accept-Encoding`` and serves the ``.br``/``.gz`` sibling of a file
+  when one exists, still through `FileResponse` (sendfile / pathsend).
+- Marks fingerprinted URLs from the asset manifest as ``immutable``; everything
+  else is revalidated against its ETag on every use.
+"""
+
+import json
+import mimetypes
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from .config import STATIC_BUILD_DIR, STATIC_DIR, STATIC_MANIFEST_NAME
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Preferred order when the client accepts several encodings equally.
+ENCODING_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+
+def resolve_static_dir() -> Path:
+    """Serve the built bundle when it exists, otherwise the raw sources."""
+    if (STATIC_BUILD_DIR / STATIC_MANIFEST_NAME).is_file():
+        return STATIC_BUILD_DIR
+    return STATIC_DIR
+
+
+@lru_cache(maxsize=None)
+def load_manifest(directory: Path) -> dict:
+    """Return the logical -> hashed path manifest for ``directory`` (empty if unbuilt)."""
+    manifest_path = Path(directory) / STATIC_MANIFEST_NAME
+    if not manifest_path.is_file():
+        return {}
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def static_url(path: str, directory: Path | None = None) -> str:
+    """Return the public URL for a logical static path, fingerprinted when built."""
+    manifest = load_manifest(directory or resolve_static_dir())
+    return f"/static/{manifest.get(path, path)}"
+
+
+def accepted_encodings(header: str | None) -> set[str]:
+    """Parse an ``Accept-Encoding`` header into the set of codings with q > 0."""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Static files with precompressed variants and fingerprint-aware caching."""
+
+    def __init__(self, *, directory: Path, **kwargs) -> None:
+        super().__init__(directory=directory, **kwargs)
+        self.immutable_paths = frozenset(load_manifest(Path(directory)).values())
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        request_headers = Headers(scope=scope)
+        relative = Path(full_path).relative_to(Path(self.directory).resolve()).as_posix()
+        media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+
+        headers = {
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL
+            if relative in self.immutable_paths
+            else REVALIDATE_CACHE_CONTROL,
+        }
+
+        variants = [
+            (coding, f"{full_path}{suffix}")
+            for coding, suffix in ENCODING_SUFFIXES
+            if os.path.isfile(f"{full_path}{suffix}")
+        ]
+        if variants:
+            headers["Vary"] = "Accept-Encoding"
+
+        accepted = accepted_encodings(request_headers.get("accept-encoding"))
+        for coding, variant_path in variants:
+            if coding in accepted:
+                headers["Content-Encoding"] = coding
+                full_path = variant_path
+                stat_result = os.stat(variant_path)
+                break
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            media_type=media_type,
+            headers=headers,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,71 @@
+/* ==========================================================================
+   Summan Data Clicker - Content Data
+   ========================================================================== */
+
+/**
+ * Building, upgrade, achievement and prestige definitions plus lookup indexes.
+ * Generated from frontend/content/*.json by `python -m backend.content`; edit
+ * the sources, not static/data/content.json.
+ *
+ * The page preloads the fingerprinted URL (<link id="content-data">); other
+ * contexts fall back to the path relative to this module.
+ */
+function resolveContentUrl() {
+    const link = globalThis.document?.getElementById?.('content-data');
+    return link?.href || new URL('../../data/content.json', import.meta.url).href;
+}
+
+const response = await fetch(resolveContentUrl());
+if (!response.ok) {
+    throw new Error(`Failed to load content data (${response.status})`);
+}
+
+const ContentData = await response.json();
+
+const EMPTY_GROUP = Object.freeze([]);
+
+function rejectWrite() {
+    throw new TypeError('Content indexes are read-only');
+}
+
+function freezeMap(map) {
+    map.set = rejectWrite;
+    map.delete = rejectWrite;
+    map.clear = rejectWrite;
+    return Object.freeze(map);
+}
+
+/**
+ * Read-only Map id -> definition, from a precomputed id -> position index.
+ */
+export function createIdIndex(definitions, positionsById) {
+    return freezeMap(new Map(
+        Object.entries(positionsById).map(([id, position]) => [id, definitions[position]]),
+    ));
+}
+
+/**
+ * Read-only Map key -> frozen array of definitions, from a precomputed key -> positions index.
+ */
+export function createGroupIndex(definitions, positionsByKey) {
+    return freezeMap(new Map(
+        Object.entries(positionsByKey).map(([key, positions]) => [
+            key,
+            Object.freeze(positions.map((position) => definitions[position])),
+        ]),
+    ));
+}
+
+/**
+ * Look up a group, returning a shared empty array for unknown keys.
+ */
+export function getGroup(index, key) {
+    return index.get(key) || EMPTY_GROUP;
+}
+
+export const buildings = ContentData.buildings;
+export const upgrades = ContentData.upgrades;
+export const achievements = ContentData.achievements;
+export const prestigeUpgrades = ContentData.prestigeUpgrades;
+export const indexes = ContentData.indexes;
+export default ContentData;
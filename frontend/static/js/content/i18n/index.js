@@ -39,6 +39,7 @@ const Lang = (() => {
             import_save: 'Importar',
             reset_game: 'Reiniciar',
             confirm_reset: '¿Estás seguro? Se perderá todo el progreso.',
+            confirm_save_conflict: 'El servidor tiene una partida más avanzada (otra pestaña o dispositivo). ¿Cargarla? Cancelar mantiene esta partida y la sobrescribe.',
             confirm_prestige: '¿Innovar? Perderás tus Data Points y edificios, pero ganarás Puntos de Innovación permanentes.',
             language: 'Idioma',
             close: 'Cerrar',
@@ -48,6 +49,19 @@ const Lang = (() => {
             offline_progress: '¡Bienvenido de vuelta!',
             produce: "Produce",
             offline_earned: 'Mientras no estabas, generaste',
+            offline_rate: 'Eficiencia offline: {0}%',
+            offline_effects_ended: 'Efectos terminados: {0}',
+            offline_achievements: 'Logros obtenidos: {0}',
+            offline_auto_buy: 'Auto-compra offline',
+            offline_auto_buy_desc: 'Al volver, invierte lo generado offline en edificios (mejor retorno o más baratos primero) y mejoras.',
+            auto_buy_policy_payback: 'Mejor retorno',
+            auto_buy_policy_cheapest: 'Más baratos',
+            offline_bought_buildings: 'Edificios comprados: {0}',
+            offline_bought_upgrades: 'Mejoras compradas: {0}',
+            offline_spent: 'Invertido: {0}',
+            offline_auto_buy_skipped: 'Auto-compra omitida: la simulación superó su tiempo límite.',
+            setting_on: 'Activado',
+            setting_off: 'Desactivado',
             total_data: 'Data Points totales',
             total_clicks: 'Clicks totales',
             total_buildings: 'Edificios totales',
@@ -159,6 +173,7 @@ const Lang = (() => {
             import_save: 'Import',
             reset_game: 'Reset',
             confirm_reset: 'Are you sure? All progress will be lost.',
+            confirm_save_conflict: 'The server has a save that is further along (another tab or device). Load it? Cancel keeps this game and overwrites it.',
             confirm_prestige: 'Innovate? You will lose your Data Points and buildings, but gain permanent Innovation Points.',
             language: 'Language',
             close: 'Close',
@@ -168,6 +183,19 @@ const Lang = (() => {
             offline_progress: 'Welcome back!',
             produce: "Produce",
             offline_earned: 'While you were away, you generated',
+            offline_rate: 'Offline efficiency: {0}%',
+            offline_effects_ended: 'Effects ended: {0}',
+            offline_achievements: 'Achievements earned: {0}',
+            offline_auto_buy: 'Offline auto-buy',
+            offline_auto_buy_desc: 'When you come back, spend offline earnings on buildings (best payback or cheapest first) and upgrades.',
+            auto_buy_policy_payback: 'Best payback',
+            auto_buy_policy_cheapest: 'Cheapest',
+            offline_bought_buildings: 'Buildings bought: {0}',
+            offline_bought_upgrades: 'Upgrades bought: {0}',
+            offline_spent: 'Spent: {0}',
+            offline_auto_buy_skipped: 'Auto-buy skipped: the simulation ran past its time budget.',
+            setting_on: 'On',
+            setting_off: 'Off',
             total_data: 'Total Data Points',
             total_clicks: 'Total Clicks',
             total_buildings: 'Total Buildings',
@@ -274,7 +302,7 @@ const Lang = (() => {
     return { t, setLanguage, getLanguage, getAvailableLanguages };
 })();
 
-window.Lang = Lang;
+if (typeof window !== 'undefined') window.Lang = Lang;
 
 export const t = Lang.t;
 export const setLanguage = Lang.setLanguage;
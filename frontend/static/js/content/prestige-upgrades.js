@@ -2,91 +2,15 @@
    Summan Data Clicker - Prestige / Innovation System
    ========================================================================== */
 
+import ContentData, { createIdIndex } from './content-data.js';
 import * as Lang from './i18n/index.js';
 
 const Prestige = (() => {
     /**
      * Prestige upgrade definitions.
      */
-    const PRESTIGE_UPGRADES = [
-        {
-            id: 'p_start_bonus', cost: 1, icon: '🎁',
-            nameEs: 'Kit de Bienvenida', nameEn: 'Welcome Kit',
-            descEs: 'Empieza con 100 Data Points después de innovar.',
-            descEn: 'Start with 100 Data Points after innovating.',
-            effect: { type: 'start_bonus', value: 100 },
-        },
-        {
-            id: 'p_click_boost', cost: 2, icon: '👆',
-            nameEs: 'Memoria Muscular', nameEn: 'Muscle Memory',
-            descEs: 'Click power permanente x2.',
-            descEn: 'Permanent click power x2.',
-            effect: { type: 'click_mult', value: 2 },
-        },
-        {
-            id: 'p_production_1', cost: 3, icon: '⚡',
-            nameEs: 'Experticia Acumulada', nameEn: 'Accumulated Expertise',
-            descEs: 'Producción permanente +25%.',
-            descEn: 'Permanent production +25%.',
-            effect: { type: 'production_mult', value: 1.25 },
-        },
-        {
-            id: 'p_golden_freq', cost: 5, icon: '✨',
-            nameEs: 'Ojo para el Oro', nameEn: 'Eye for Gold',
-            descEs: 'Data Doradas aparecen 50% más seguido.',
-            descEn: 'Golden Data appears 50% more often.',
-            effect: { type: 'golden_frequency', value: 0.5 },
-        },
-        {
-            id: 'p_golden_value', cost: 5, icon: '💰',
-            nameEs: 'Toque de Midas', nameEn: 'Midas Touch',
-            descEs: 'Data Doradas dan x2 recompensa.',
-            descEn: 'Golden Data gives x2 reward.',
-            effect: { type: 'golden_value', value: 2 },
-        },
-        {
-            id: 'p_building_discount', cost: 7, icon: '🏷️',
-            nameEs: 'Negociación Experta', nameEn: 'Expert Negotiation',
-            descEs: 'Todos los edificios cuestan 10% menos.',
-            descEn: 'All buildings cost 10% less.',
-            effect: { type: 'building_discount', value: 0.90 },
-        },
-        {
-            id: 'p_production_2', cost: 10, icon: '🚀',
-            nameEs: 'Velocidad Summan', nameEn: 'Summan Speed',
-            descEs: 'Producción permanente x2.',
-            descEn: 'Permanent production x2.',
-            effect: { type: 'production_mult', value: 2 },
-        },
-        {
-            id: 'p_offline', cost: 10, icon: '😴',
-            nameEs: 'Trabajador Nocturno', nameEn: 'Night Worker',
-            descEs: 'Progreso offline al 75% (en vez de 50%).',
-            descEn: 'Offline progress at 75% (instead of 50%).',
-            effect: { type: 'offline_rate', value: 0.75 },
-        },
-        {
-            id: 'p_coffee_boost', cost: 15, icon: '☕',
-            nameEs: 'Espresso Doble', nameEn: 'Double Espresso',
-            descEs: 'Coffee Break da x10 en vez de x7.',
-            descEn: 'Coffee Break gives x10 instead of x7.',
-            effect: { type: 'coffee_mult', value: 10 },
-        },
-        {
-            id: 'p_production_3', cost: 25, icon: '🌟',
-            nameEs: 'Excelencia Operacional', nameEn: 'Operational Excellence',
-            descEs: 'Producción permanente x3.',
-            descEn: 'Permanent production x3.',
-            effect: { type: 'production_mult', value: 3 },
-        },
-        {
-            id: 'p_start_big', cost: 50, icon: '🏦',
-            nameEs: 'Inversión Semilla', nameEn: 'Seed Investment',
-            descEs: 'Empieza con 1M Data Points después de innovar.',
-            descEn: 'Start with 1M Data Points after innovating.',
-            effect: { type: 'start_bonus', value: 1000000 },
-        },
-    ];
+    const PRESTIGE_UPGRADES = ContentData.prestigeUpgrades;
+    const BY_ID = createIdIndex(PRESTIGE_UPGRADES, ContentData.indexes.prestigeUpgradesById);
 
     /**
      * Calculate innovation points earned from total lifetime data.
@@ -118,7 +42,7 @@ const Prestige = (() => {
     }
 
     function getUpgradeById(id) {
-        return PRESTIGE_UPGRADES.find(u => u.id === id);
+        return BY_ID.get(id);
     }
 
     function getName(upgrade) {
@@ -200,7 +124,7 @@ const Prestige = (() => {
     };
 })();
 
-window.Prestige = Prestige;
+if (typeof window !== 'undefined') window.Prestige = Prestige;
 
 export const calculateInnovationPoints = Prestige.calculateInnovationPoints;
 export const getBaseMultiplier = Prestige.getBaseMultiplier;
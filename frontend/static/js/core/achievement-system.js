@@ -1,5 +1,8 @@
 ﻿import * as Achievements from '../content/achievements.js';
 
+/**
+ * Full scan of every definition; the reference for createAchievementTracker().
+ */
 export function unlockNewAchievements(state, onUnlocked = () => {}) {
   if (!state) return [];
 
@@ -12,3 +15,202 @@ export function unlockNewAchievements(state, onUnlocked = () => {}) {
 
   return newlyUnlockedIds;
 }
+
+// Stats that change on every tick or click; their groups are checked on every call.
+const SCALAR_GROUPS = ['production', 'clicks', 'dps', 'prestige_count'];
+
+function getGroupKey(achievement) {
+  const checkType = achievement.checkType || 'production';
+  switch (checkType) {
+    case 'production':
+    case 'any_building':
+    case 'total_buildings':
+    case 'dps':
+    case 'prestige_count':
+      return checkType;
+    case 'specific_building':
+      return `building:${achievement.building}`;
+    case 'event':
+      return `event:${achievement.event}`;
+    default:
+      // Same fallback as Achievements.checkAll: only click achievements have one.
+      return achievement.category === 'clicks' ? 'clicks' : null;
+  }
+}
+
+// group key -> definitions sorted by threshold; built once from the content.
+const GROUPS = (() => {
+  const groups = new Map();
+  for (const achievement of Achievements.getAll()) {
+    const key = getGroupKey(achievement);
+    if (!key) continue;
+    if (!groups.has(key)) groups.set(key, []);
+    groups.get(key).push(achievement);
+  }
+  for (const entries of groups.values()) entries.sort((a, b) => a.threshold - b.threshold);
+  return groups;
+})();
+
+const DEFINITION_ORDER = new Map(Achievements.getAll().map((achievement, index) => [achievement.id, index]));
+
+/**
+ * Incremental achievement checks for one game state.
+ *
+ * Definitions are grouped by the stat they test and sorted by threshold; each group
+ * keeps a cursor on its first locked entry, so a check compares one threshold per
+ * group unless something unlocks. Scalar stats (production, clicks, DPS, prestiges)
+ * are checked on every call; building and event groups only after mark*Changed().
+ * A different state object, or invalidate(), rebuilds the cursors from
+ * `state.achievements`.
+ */
+export function createAchievementTracker() {
+  let boundState = null;
+  let unlockedIds = new Set();
+  const cursors = new Map();
+  const buildingCounts = new Map();
+  let totalBuildings = 0;
+  let maxBuilding = 0;
+
+  let needsRebuild = true;
+  const dirtyGroups = new Set();
+
+  const counters = { rebuilds: 0, checks: 0, thresholdsTested: 0 };
+
+  function invalidate() {
+    needsRebuild = true;
+  }
+
+  function markBuildingChanged(buildingId) {
+    dirtyGroups.add(`building:${buildingId}`);
+    dirtyGroups.add('any_building');
+    dirtyGroups.add('total_buildings');
+  }
+
+  function markEventChanged(eventKey) {
+    dirtyGroups.add(`event:${eventKey}`);
+  }
+
+  function rebuild(state) {
+    boundState = state;
+    unlockedIds = new Set(state.achievements);
+    buildingCounts.clear();
+    totalBuildings = 0;
+    maxBuilding = 0;
+    for (const [buildingId, count] of Object.entries(state.buildings)) {
+      buildingCounts.set(buildingId, count);
+      totalBuildings += count;
+      maxBuilding = Math.max(maxBuilding, count);
+    }
+
+    cursors.clear();
+    for (const key of GROUPS.keys()) {
+      cursors.set(key, 0);
+      dirtyGroups.add(key);
+    }
+    needsRebuild = false;
+    counters.rebuilds += 1;
+  }
+
+  function syncBuildingCounts(state) {
+    for (const key of dirtyGroups) {
+      if (!key.startsWith('building:')) continue;
+      const buildingId = key.slice('building:'.length);
+      const count = state.buildings[buildingId] || 0;
+      totalBuildings += count - (buildingCounts.get(buildingId) || 0);
+      maxBuilding = Math.max(maxBuilding, count);
+      buildingCounts.set(buildingId, count);
+    }
+  }
+
+  function readStat(state, key) {
+    switch (key) {
+      case 'production':
+        return state.stats.totalDataEarned;
+      case 'clicks':
+        return state.stats.totalClicks;
+      case 'dps':
+        return state.dps;
+      case 'prestige_count':
+        return state.stats.timesPrestiged;
+      case 'any_building':
+        return maxBuilding;
+      case 'total_buildings':
+        return totalBuildings;
+      default:
+        if (key.startsWith('building:')) return state.buildings[key.slice('building:'.length)] || 0;
+        return state.stats.events?.[key.slice('event:'.length)] || 0;
+    }
+  }
+
+  function advanceGroup(state, key, newlyUnlocked) {
+    const entries = GROUPS.get(key);
+    if (!entries) return;
+
+    const value = readStat(state, key);
+    let cursor = cursors.get(key);
+    while (cursor < entries.length) {
+      const achievement = entries[cursor];
+      if (!unlockedIds.has(achievement.id)) {
+        counters.thresholdsTested += 1;
+        if (!(value >= achievement.threshold)) break;
+        unlockedIds.add(achievement.id);
+        newlyUnlocked.push(achievement.id);
+      }
+      cursor += 1;
+    }
+    cursors.set(key, cursor);
+  }
+
+  /**
+   * Ids of achievements met but not yet in the tracker's unlocked set, in
+   * definition order (same result as Achievements.checkAll).
+   */
+  function check(state) {
+    if (!state) return [];
+
+    if (needsRebuild || state !== boundState) {
+      dirtyGroups.clear();
+      rebuild(state);
+    } else {
+      syncBuildingCounts(state);
+    }
+
+    const newlyUnlocked = [];
+    for (const key of SCALAR_GROUPS) advanceGroup(state, key, newlyUnlocked);
+    for (const key of dirtyGroups) {
+      if (!SCALAR_GROUPS.includes(key)) advanceGroup(state, key, newlyUnlocked);
+    }
+    dirtyGroups.clear();
+    counters.checks += 1;
+
+    if (newlyUnlocked.length > 1) {
+      newlyUnlocked.sort((a, b) => DEFINITION_ORDER.get(a) - DEFINITION_ORDER.get(b));
+    }
+    return newlyUnlocked;
+  }
+
+  /**
+   * Like unlockNewAchievements, through the tracker's cursors.
+   */
+  function unlock(state, onUnlocked = () => {}) {
+    const newlyUnlockedIds = check(state);
+    for (const id of newlyUnlockedIds) {
+      state.achievements.push(id);
+      onUnlocked(Achievements.getById(id), id);
+    }
+    return newlyUnlockedIds;
+  }
+
+  function getCounters() {
+    return { ...counters };
+  }
+
+  return {
+    invalidate,
+    markBuildingChanged,
+    markEventChanged,
+    check,
+    unlock,
+    getCounters,
+  };
+}
@@ -0,0 +1,302 @@
+// "SCL" + format version.
+const MAGIC = [0x53, 0x43, 0x4c, 0x01];
+
+// One byte per record. Frequent commands get a compact payload; everything else
+// (LOAD, settings) is stored as JSON.
+const OPCODES = Object.freeze({
+  END: 0,
+  CLICK: 1,
+  BUY_BUILDING: 2,
+  BUY_UPGRADE: 3,
+  BUY_PRESTIGE_UPGRADE: 4,
+  PRESTIGE: 5,
+  SET_BUY_AMOUNT: 6,
+  ADD_EFFECT: 7,
+  GRANT_REWARD: 8,
+  CATCH_UP: 9,
+  SET_TICK_RATE: 10,
+  JSON: 11,
+});
+
+const encoder = new TextEncoder();
+const decoder = new TextDecoder();
+
+function createByteWriter(initialSize = 1024) {
+  let bytes = new Uint8Array(initialSize);
+  let view = new DataView(bytes.buffer);
+  let length = 0;
+
+  function reserve(count) {
+    if (length + count <= bytes.length) return;
+    let size = bytes.length * 2;
+    while (size < length + count) size *= 2;
+    const grown = new Uint8Array(size);
+    grown.set(bytes.subarray(0, length));
+    bytes = grown;
+    view = new DataView(bytes.buffer);
+  }
+
+  function uint8(value) {
+    reserve(1);
+    bytes[length] = value;
+    length += 1;
+  }
+
+  // Unsigned LEB128, exact up to Number.MAX_SAFE_INTEGER.
+  function varint(value) {
+    reserve(8);
+    let rest = value;
+    while (rest >= 0x80) {
+      bytes[length] = (rest % 0x80) | 0x80;
+      length += 1;
+      rest = Math.floor(rest / 0x80);
+    }
+    bytes[length] = rest;
+    length += 1;
+  }
+
+  function float64(value) {
+    reserve(8);
+    view.setFloat64(length, value, true);
+    length += 8;
+  }
+
+  function raw(data) {
+    reserve(data.length);
+    bytes.set(data, length);
+    length += data.length;
+  }
+
+  function utf8(text) {
+    const data = encoder.encode(text);
+    varint(data.length);
+    raw(data);
+  }
+
+  return {
+    uint8,
+    varint,
+    float64,
+    raw,
+    utf8,
+    getLength: () => length,
+    toBytes: () => bytes.slice(0, length),
+  };
+}
+
+function createByteReader(bytes) {
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  let offset = 0;
+
+  function uint8() {
+    if (offset >= bytes.length) throw new Error('Command log is truncated');
+    const value = bytes[offset];
+    offset += 1;
+    return value;
+  }
+
+  function varint() {
+    let value = 0;
+    let scale = 1;
+    for (;;) {
+      const byte = uint8();
+      value += (byte & 0x7f) * scale;
+      if (byte < 0x80) return value;
+      scale *= 0x80;
+    }
+  }
+
+  function float64() {
+    const value = view.getFloat64(offset, true);
+    offset += 8;
+    return value;
+  }
+
+  function utf8() {
+    const size = varint();
+    const text = decoder.decode(bytes.subarray(offset, offset + size));
+    offset += size;
+    return text;
+  }
+
+  return { uint8, varint, float64, utf8 };
+}
+
+/**
+ * Records simulation commands as a compact binary log.
+ *
+ * The header (JSON) holds the state, simulated time, step length and RNG streams at
+ * the start. Each record is the number of steps since the previous one (varint), an
+ * opcode byte and its payload; ids and other repeated strings go through a table, so
+ * after its first use a building id costs one byte. finish() appends an END record
+ * at the final step and returns the bytes.
+ */
+export function createCommandRecorder({ state, simTime, stepMs, rng = null, build = '' }) {
+  const header = JSON.stringify({ state, simTime, stepMs, rng, build, recordedAt: Date.now() });
+  const body = createByteWriter();
+  const strings = new Map();
+  let lastStep = 0;
+  let records = 0;
+
+  function string(text) {
+    const index = strings.get(text);
+    if (index !== undefined) {
+      body.varint(index);
+      return;
+    }
+    strings.set(text, strings.size);
+    body.varint(strings.size - 1);
+    body.utf8(text);
+  }
+
+  function begin(step, opcode) {
+    body.varint(step - lastStep);
+    body.uint8(opcode);
+    lastStep = step;
+    records += 1;
+  }
+
+  /**
+   * Append `command` (a Simulation.apply() command) applied after `step` steps.
+   */
+  function record(step, command) {
+    switch (command.type) {
+      case 'CLICK':
+        begin(step, OPCODES.CLICK);
+        body.varint(command.count);
+        break;
+      case 'BUY_BUILDING':
+        begin(step, OPCODES.BUY_BUILDING);
+        string(command.buildingId);
+        break;
+      case 'BUY_UPGRADE':
+        begin(step, OPCODES.BUY_UPGRADE);
+        string(command.upgradeId);
+        break;
+      case 'BUY_PRESTIGE_UPGRADE':
+        begin(step, OPCODES.BUY_PRESTIGE_UPGRADE);
+        string(command.upgradeId);
+        break;
+      case 'PRESTIGE':
+        begin(step, OPCODES.PRESTIGE);
+        break;
+      case 'SET_BUY_AMOUNT':
+        begin(step, OPCODES.SET_BUY_AMOUNT);
+        // Zigzag, for the -1 "max" amount.
+        body.varint(command.amount < 0 ? (-2 * command.amount) - 1 : 2 * command.amount);
+        break;
+      case 'ADD_EFFECT':
+        begin(step, OPCODES.ADD_EFFECT);
+        string(command.effectType);
+        body.float64(command.multiplier);
+        body.float64(command.durationMs);
+        break;
+      case 'GRANT_REWARD':
+        begin(step, OPCODES.GRANT_REWARD);
+        body.float64(command.amount);
+        string(command.eventKey || '');
+        break;
+      case 'CATCH_UP':
+        begin(step, OPCODES.CATCH_UP);
+        body.float64(command.elapsedSec);
+        break;
+      case 'SET_TICK_RATE':
+        begin(step, OPCODES.SET_TICK_RATE);
+        body.float64(command.ms);
+        break;
+      default:
+        begin(step, OPCODES.JSON);
+        body.utf8(JSON.stringify(command));
+        break;
+    }
+  }
+
+  function finish(step) {
+    begin(step, OPCODES.END);
+    const out = createByteWriter(body.getLength() + header.length + 16);
+    out.raw(MAGIC);
+    out.utf8(header);
+    out.raw(body.toBytes());
+    return out.toBytes();
+  }
+
+  function getCounters() {
+    return { records, bytes: body.getLength(), strings: strings.size };
+  }
+
+  return { record, finish, getCounters };
+}
+
+/**
+ * Parse a log from createCommandRecorder into `{ header, entries: [{ step, command }],
+ * endStep }`, with steps counted from the start of the recording.
+ */
+export function decodeCommandLog(bytes) {
+  for (let i = 0; i < MAGIC.length; i += 1) {
+    if (bytes[i] !== MAGIC[i]) throw new Error('Not a command log');
+  }
+
+  const reader = createByteReader(bytes.subarray(MAGIC.length));
+  const header = JSON.parse(reader.utf8());
+  const strings = [];
+  const entries = [];
+  let step = 0;
+
+  function string() {
+    const index = reader.varint();
+    if (index === strings.length) strings.push(reader.utf8());
+    return strings[index];
+  }
+
+  for (;;) {
+    step += reader.varint();
+    const opcode = reader.uint8();
+    let command;
+    switch (opcode) {
+      case OPCODES.END:
+        return { header, entries, endStep: step };
+      case OPCODES.CLICK:
+        command = { type: 'CLICK', count: reader.varint() };
+        break;
+      case OPCODES.BUY_BUILDING:
+        command = { type: 'BUY_BUILDING', buildingId: string() };
+        break;
+      case OPCODES.BUY_UPGRADE:
+        command = { type: 'BUY_UPGRADE', upgradeId: string() };
+        break;
+      case OPCODES.BUY_PRESTIGE_UPGRADE:
+        command = { type: 'BUY_PRESTIGE_UPGRADE', upgradeId: string() };
+        break;
+      case OPCODES.PRESTIGE:
+        command = { type: 'PRESTIGE' };
+        break;
+      case OPCODES.SET_BUY_AMOUNT: {
+        const zigzag = reader.varint();
+        command = { type: 'SET_BUY_AMOUNT', amount: zigzag % 2 === 1 ? -(zigzag + 1) / 2 : zigzag / 2 };
+        break;
+      }
+      case OPCODES.ADD_EFFECT:
+        command = {
+          type: 'ADD_EFFECT', effectType: string(), multiplier: reader.float64(), durationMs: reader.float64(),
+        };
+        break;
+      case OPCODES.GRANT_REWARD: {
+        const amount = reader.float64();
+        command = { type: 'GRANT_REWARD', amount, eventKey: string() || undefined };
+        break;
+      }
+      case OPCODES.CATCH_UP:
+        command = { type: 'CATCH_UP', elapsedSec: reader.float64() };
+        break;
+      case OPCODES.SET_TICK_RATE:
+        command = { type: 'SET_TICK_RATE', ms: reader.float64() };
+        break;
+      case OPCODES.JSON:
+        command = JSON.parse(reader.utf8());
+        break;
+      default:
+        throw new Error(`Unknown command log opcode ${opcode}`);
+    }
+    entries.push({ step, command });
+  }
+}
@@ -0,0 +1,178 @@
+import * as Buildings from '../content/buildings.js';
+import * as Upgrades from '../content/upgrades.js';
+import {
+  getAchievementMultiplier,
+  getActiveProductionMultiplier,
+  getBuildingBaseDps,
+  getBuildingMultiplier,
+  getGlobalUpgradeMultiplier,
+  getOwnedUpgradeIds,
+  getPrestigeProductionMultiplier,
+} from './economy.js';
+
+const BUILDING_EFFECT_TYPES = new Set(['building_mult', 'synergy', 'synergy_per']);
+
+// building id -> buildings whose multiplier scales with its count (synergy_per upgrades).
+const SYNERGY_DEPENDENTS = (() => {
+  const dependents = new Map();
+  for (const up of Upgrades.getByEffectType('synergy_per')) {
+    const { per, target } = up.effect;
+    if (!per || !target) continue;
+    if (!dependents.has(per)) dependents.set(per, new Set());
+    dependents.get(per).add(target);
+  }
+  return dependents;
+})();
+
+function getUpgradeTargets(upgrade) {
+  const eff = upgrade.effect;
+  if (!BUILDING_EFFECT_TYPES.has(eff.type)) return [];
+  return [eff.target, ...(eff.targets || [])].filter(Boolean);
+}
+
+/**
+ * Incremental DPS for one game state.
+ *
+ * Keeps each building's multiplier and base contribution plus the global
+ * multiplier chain (upgrades, achievements, prestige, active effects). Callers
+ * report what changed with the mark* functions; recalculate() recomputes only
+ * those terms. A different state object, or invalidate(), forces a full rebuild.
+ */
+export function createDpsModel() {
+  let boundState = null;
+  let ownedUpgrades = new Set();
+  let multipliers = {};
+  const contributions = new Map();
+  let globalUpgradeMult = 1;
+  let achievementMult = 1;
+  let prestigeMult = 1;
+  let effectsMult = 1;
+
+  let needsRebuild = true;
+  const dirtyContributions = new Set();
+  const dirtyMultipliers = new Set();
+  let globalDirty = false;
+  let achievementsDirty = false;
+  let prestigeDirty = false;
+  let effectsDirty = false;
+
+  const counters = { fullRecomputes: 0, partialRecomputes: 0, termsRecomputed: 0 };
+
+  function invalidate() {
+    needsRebuild = true;
+  }
+
+  function markBuildingChanged(buildingId) {
+    dirtyContributions.add(buildingId);
+    for (const target of SYNERGY_DEPENDENTS.get(buildingId) || []) {
+      dirtyMultipliers.add(target);
+    }
+  }
+
+  function markUpgradeAdded(upgradeId) {
+    const upgrade = Upgrades.getById(upgradeId);
+    if (!upgrade) return;
+
+    ownedUpgrades.add(upgradeId);
+    if (upgrade.effect.type === 'global_mult') globalDirty = true;
+    for (const target of getUpgradeTargets(upgrade)) {
+      dirtyMultipliers.add(target);
+    }
+  }
+
+  function markAchievementsChanged() {
+    achievementsDirty = true;
+  }
+
+  function markPrestigeChanged() {
+    prestigeDirty = true;
+  }
+
+  function markEffectsChanged() {
+    effectsDirty = true;
+  }
+
+  function clearDirty() {
+    needsRebuild = false;
+    dirtyContributions.clear();
+    dirtyMultipliers.clear();
+    globalDirty = false;
+    achievementsDirty = false;
+    prestigeDirty = false;
+    effectsDirty = false;
+  }
+
+  function rebuild(state) {
+    boundState = state;
+    ownedUpgrades = getOwnedUpgradeIds(state);
+    multipliers = {};
+    contributions.clear();
+
+    for (const def of Buildings.getAll()) {
+      multipliers[def.id] = getBuildingMultiplier(state, ownedUpgrades, def.id);
+      contributions.set(def.id, getBuildingBaseDps(state, def, multipliers[def.id]));
+    }
+
+    globalUpgradeMult = getGlobalUpgradeMultiplier(ownedUpgrades);
+    achievementMult = getAchievementMultiplier(state);
+    prestigeMult = getPrestigeProductionMultiplier(state);
+    effectsMult = getActiveProductionMultiplier(state);
+    counters.fullRecomputes += 1;
+  }
+
+  function applyDirty(state) {
+    for (const buildingId of dirtyMultipliers) {
+      multipliers[buildingId] = getBuildingMultiplier(state, ownedUpgrades, buildingId);
+      dirtyContributions.add(buildingId);
+    }
+    for (const buildingId of dirtyContributions) {
+      const def = Buildings.getById(buildingId);
+      if (def) contributions.set(buildingId, getBuildingBaseDps(state, def, multipliers[buildingId]));
+    }
+
+    if (globalDirty) globalUpgradeMult = getGlobalUpgradeMultiplier(ownedUpgrades);
+    if (achievementsDirty) achievementMult = getAchievementMultiplier(state);
+    if (prestigeDirty) prestigeMult = getPrestigeProductionMultiplier(state);
+    if (effectsDirty) effectsMult = getActiveProductionMultiplier(state);
+
+    counters.partialRecomputes += 1;
+    counters.termsRecomputed += dirtyContributions.size
+      + globalDirty + achievementsDirty + prestigeDirty + effectsDirty;
+  }
+
+  /**
+   * Bring `state.dps` and `state.buildingMultipliers` up to date and return the DPS.
+   */
+  function recalculate(state) {
+    if (!state) return 0;
+
+    if (needsRebuild || state !== boundState) {
+      rebuild(state);
+    } else {
+      applyDirty(state);
+    }
+    clearDirty();
+
+    let baseDps = 0;
+    for (const contribution of contributions.values()) baseDps += contribution;
+
+    state.buildingMultipliers = multipliers;
+    state.dps = baseDps * globalUpgradeMult * achievementMult * prestigeMult * effectsMult;
+    return state.dps;
+  }
+
+  function getCounters() {
+    return { ...counters };
+  }
+
+  return {
+    invalidate,
+    markBuildingChanged,
+    markUpgradeAdded,
+    markAchievementsChanged,
+    markPrestigeChanged,
+    markEffectsChanged,
+    recalculate,
+    getCounters,
+  };
+}
@@ -2,25 +2,32 @@ import * as Achievements from '../content/achievements.js';
 import * as Upgrades from '../content/upgrades.js';
 import * as Prestige from '../content/prestige-upgrades.js';
 import * as Buildings from '../content/buildings.js';
+import { getPrestigeEffects } from './prestige-effects.js';
+
+export function getOwnedUpgradeIds(state) {
+  return new Set(state?.upgrades || []);
+}
 
 export function calculateClickValue(state) {
   if (!state) return 0;
 
+  const ownedUpgrades = getOwnedUpgradeIds(state);
   let baseClick = 1;
   let clickMult = 1;
   let clickAdd = 0;
   let dpsPercent = 0;
 
-  for (const upId of state.upgrades || []) {
-    const up = Upgrades.getById(upId);
-    if (!up) continue;
-    const eff = up.effect;
-    if (eff.type === 'click_mult') clickMult *= eff.value;
-    if (eff.type === 'click_add') clickAdd += eff.value;
-    if (eff.type === 'click_dps_percent') dpsPercent += eff.value;
+  for (const up of Upgrades.getByEffectType('click_mult')) {
+    if (ownedUpgrades.has(up.id)) clickMult *= up.effect.value;
+  }
+  for (const up of Upgrades.getByEffectType('click_add')) {
+    if (ownedUpgrades.has(up.id)) clickAdd += up.effect.value;
+  }
+  for (const up of Upgrades.getByEffectType('click_dps_percent')) {
+    if (ownedUpgrades.has(up.id)) dpsPercent += up.effect.value;
   }
 
-  const prestigeEffects = Prestige.getAggregatedEffects(state.prestigeUpgrades || []);
+  const prestigeEffects = getPrestigeEffects(state);
   clickMult *= prestigeEffects.clickMult;
 
   for (const eff of state.activeEffects || []) {
@@ -30,71 +37,81 @@ export function calculateClickValue(state) {
   return (baseClick + clickAdd) * clickMult + ((state.dps || 0) * dpsPercent);
 }
 
-export function recalculateDps(state) {
-  if (!state) return 0;
+/**
+ * Product of the upgrade multipliers (building_mult, synergy, synergy_per) for one building.
+ */
+export function getBuildingMultiplier(state, ownedUpgrades, buildingId) {
+  let multiplier = 1;
 
-  let totalDps = 0;
-  const buildingMults = {};
-
-  for (const def of Buildings.getAll()) {
-    buildingMults[def.id] = 1;
-  }
-
-  for (const upId of state.upgrades || []) {
-    const up = Upgrades.getById(upId);
-    if (!up) continue;
+  for (const up of Upgrades.getByTarget(buildingId)) {
+    if (!ownedUpgrades.has(up.id)) continue;
     const eff = up.effect;
 
-    if (eff.type === 'building_mult' && eff.target) {
-      buildingMults[eff.target] = (buildingMults[eff.target] || 1) * eff.value;
-    }
-
-    if (eff.type === 'synergy' && eff.targets) {
-      for (const target of eff.targets) {
-        buildingMults[target] = (buildingMults[target] || 1) * eff.value;
-      }
-    }
-
-    if (eff.type === 'synergy_per' && eff.target && eff.per) {
+    if (eff.type === 'building_mult' || eff.type === 'synergy') {
+      multiplier *= eff.value;
+    } else if (eff.type === 'synergy_per' && eff.per) {
       const perCount = state.buildings?.[eff.per] || 0;
-      if (perCount > 0) {
-        buildingMults[eff.target] = (buildingMults[eff.target] || 1) * (1 + eff.value * perCount);
-      }
+      if (perCount > 0) multiplier *= 1 + eff.value * perCount;
     }
   }
 
-  state.buildingMultipliers = buildingMults;
+  return multiplier;
+}
 
-  for (const def of Buildings.getAll()) {
-    const owned = state.buildings?.[def.id] || 0;
-    if (owned > 0) {
-      totalDps += def.baseDps * owned * (buildingMults[def.id] || 1);
-    }
-  }
+export function getBuildingBaseDps(state, def, multiplier) {
+  const owned = state.buildings?.[def.id] || 0;
+  return owned > 0 ? def.baseDps * owned * multiplier : 0;
+}
 
+export function getGlobalUpgradeMultiplier(ownedUpgrades) {
   let globalMult = 1;
-  for (const upId of state.upgrades || []) {
-    const up = Upgrades.getById(upId);
-    if (!up) continue;
-    if (up.effect.type === 'global_mult') {
-      globalMult *= up.effect.value;
-    }
+  for (const up of Upgrades.getByEffectType('global_mult')) {
+    if (ownedUpgrades.has(up.id)) globalMult *= up.effect.value;
   }
-  totalDps *= globalMult;
-
-  totalDps *= Achievements.getTotalBonus(state.achievements || []);
+  return globalMult;
+}
 
-  const prestigeEffects = Prestige.getAggregatedEffects(state.prestigeUpgrades || []);
-  totalDps *= prestigeEffects.productionMult;
+export function getAchievementMultiplier(state) {
+  return Achievements.getTotalBonus(state.achievements || []);
+}
 
-  const totalInnovMult = Prestige.getBaseMultiplier(state.totalInnovationEarned || 0);
-  totalDps *= totalInnovMult;
+/**
+ * Permanent prestige production: purchased prestige upgrades and innovation points earned.
+ */
+export function getPrestigeProductionMultiplier(state) {
+  const prestigeEffects = getPrestigeEffects(state);
+  return prestigeEffects.productionMult * Prestige.getBaseMultiplier(state.totalInnovationEarned || 0);
+}
 
+export function getActiveProductionMultiplier(state) {
+  let multiplier = 1;
   for (const eff of state.activeEffects || []) {
-    if (eff.type === 'production_mult') {
-      totalDps *= eff.multiplier;
-    }
+    if (eff.type === 'production_mult') multiplier *= eff.multiplier;
+  }
+  return multiplier;
+}
+
+/**
+ * Full DPS recomputation. The game loop keeps an incremental copy in core/dps-model.js;
+ * this stays the reference implementation built from the same terms.
+ */
+export function recalculateDps(state) {
+  if (!state) return 0;
+
+  const ownedUpgrades = getOwnedUpgradeIds(state);
+  const buildingMults = {};
+  let totalDps = 0;
+
+  for (const def of Buildings.getAll()) {
+    buildingMults[def.id] = getBuildingMultiplier(state, ownedUpgrades, def.id);
+    totalDps += getBuildingBaseDps(state, def, buildingMults[def.id]);
   }
+  state.buildingMultipliers = buildingMults;
+
+  totalDps *= getGlobalUpgradeMultiplier(ownedUpgrades);
+  totalDps *= getAchievementMultiplier(state);
+  totalDps *= getPrestigeProductionMultiplier(state);
+  totalDps *= getActiveProductionMultiplier(state);
 
   state.dps = totalDps;
   return totalDps;
@@ -102,6 +119,5 @@ export function recalculateDps(state) {
 
 export function getBuildingDiscount(state) {
   if (!state || !state.prestigeUpgrades) return 1;
-  const effects = Prestige.getAggregatedEffects(state.prestigeUpgrades);
-  return effects.buildingDiscount;
+  return getPrestigeEffects(state).buildingDiscount;
 }
@@ -1,21 +1,24 @@
-export function addActiveEffect(state, type, multiplier, durationMs, onRecalculate = () => {}) {
-  if (!state) return;
-  state.activeEffects.push({
+export function addActiveEffect(state, type, multiplier, durationMs, onRecalculate = () => {}, now = Date.now()) {
+  if (!state) return null;
+  const effect = {
     type,
     multiplier,
-    endTime: Date.now() + durationMs,
-  });
+    endTime: now + durationMs,
+  };
+  state.activeEffects.push(effect);
   onRecalculate();
+  return effect;
 }
 
-export function updateActiveEffects(state, onRecalculate = () => {}) {
+/**
+ * Remove one effect once its endTime has passed (scheduled by the caller).
+ */
+export function removeActiveEffect(state, effect, onRecalculate = () => {}) {
   if (!state) return;
-  const now = Date.now();
-  const before = state.activeEffects.length;
-  state.activeEffects = state.activeEffects.filter((effect) => effect.endTime > now);
-  if (state.activeEffects.length !== before) {
-    onRecalculate();
-  }
+  const index = state.activeEffects.indexOf(effect);
+  if (index === -1) return;
+  state.activeEffects.splice(index, 1);
+  onRecalculate();
 }
 
 export function getActiveEffects(state) {
@@ -1,72 +1,77 @@
 ﻿import * as Lang from '../content/i18n/index.js';
-import * as Prestige from '../content/prestige-upgrades.js';
 import * as Utils from '../infra/number-formatters.js';
+import { getRngStream, RNG_STREAMS } from '../infra/rng.js';
 import * as UI from '../ui/renderer.js';
+import { simulateOfflineAutoBuyer } from './offline-autobuyer.js';
+import { simulateOfflineProgress } from './offline-progress.js';
+import { getPrestigeEffects } from './prestige-effects.js';
+import { grantEventReward } from './production.js';
 
 export function calculateOfflineProgress(state) {
-  if (!state?.lastTickTime) return;
+  if (!state?.lastTickTime) return null;
 
   const now = Date.now();
   const elapsedSec = (now - state.lastTickTime) / 1000;
-  if (elapsedSec < 10) return;
+  if (elapsedSec < 10) return null;
 
-  const prestigeEffects = Prestige.getAggregatedEffects(state.prestigeUpgrades || []);
-  const offlineRate = prestigeEffects.offlineRate;
-  const offlineData = (state.dps || 0) * elapsedSec * offlineRate;
+  const prestigeEffects = getPrestigeEffects(state);
+  const options = { now, rate: prestigeEffects.offlineRate };
+  const summary = state.settings?.offlineAutoBuy
+    ? simulateOfflineAutoBuyer(state, elapsedSec, { ...options, policy: state.settings.offlineAutoBuyPolicy })
+    : simulateOfflineProgress(state, elapsedSec, options);
 
-  if (offlineData <= 0) return;
-
-  state.dataPoints += offlineData;
-  state.stats.totalDataEarned += offlineData;
-  state.stats.totalDataAllTime += offlineData;
+  if (summary.dataEarned <= 0) return summary;
 
   setTimeout(() => {
-    UI.showOfflineModal(offlineData, elapsedSec);
+    UI.showOfflineModal(summary.dataEarned, elapsedSec, summary);
   }, 500);
+  return summary;
 }
 
 export function computeNextGoldenDataTime(state, now = Date.now()) {
-  const prestigeEffects = Prestige.getAggregatedEffects(state?.prestigeUpgrades || []);
+  const prestigeEffects = getPrestigeEffects(state);
   const baseInterval = 120000;
   const variance = 60000;
-  const interval = (baseInterval + Utils.randomRange(-variance, variance)) * prestigeEffects.goldenFrequency;
+  const jitter = getRngStream(RNG_STREAMS.GOLDEN_TIMING).range(-variance, variance);
+  const interval = (baseInterval + jitter) * prestigeEffects.goldenFrequency;
   return now + Math.max(30000, interval);
 }
 
-export function spawnGoldenData(state) {
+export function spawnGoldenData(state, grant = (amount, eventKey) => grantEventReward(state, amount, eventKey)) {
   if ((state.dps || 0) < 0.1 && (state.stats.totalDataEarned || 0) < 100) return;
 
   UI.showGoldenData(() => {
-    const prestigeEffects = Prestige.getAggregatedEffects(state.prestigeUpgrades || []);
+    const prestigeEffects = getPrestigeEffects(state);
     const baseReward = Math.max(
-      (state.dps || 0) * Utils.randomRange(30, 120),
+      (state.dps || 0) * getRngStream(RNG_STREAMS.GOLDEN_REWARD).range(30, 120),
       (state.stats.totalDataEarned || 0) * 0.05,
     );
     const reward = baseReward * prestigeEffects.goldenValue;
-
-    state.dataPoints += reward;
-    state.stats.totalDataEarned += reward;
-    state.stats.totalDataAllTime += reward;
-    state.stats.events.golden_clicked = (state.stats.events.golden_clicked || 0) + 1;
+    grant(reward, 'golden_clicked');
 
     Utils.showToast(Lang.t('event_golden_data_desc', Utils.formatNumber(reward)), 'golden', 3000);
   });
 }
 
 export function computeNextRandomEventTime(now = Date.now()) {
-  const interval = Utils.randomRange(180000, 360000);
+  const interval = getRngStream(RNG_STREAMS.RANDOM_EVENT_TIMING).range(180000, 360000);
   return now + interval;
 }
 
-export function triggerRandomEvent(state, addActiveEffect) {
+export function triggerRandomEvent(
+  state,
+  addActiveEffect,
+  grant = (amount, eventKey) => grantEventReward(state, amount, eventKey),
+) {
   if ((state.dps || 0) < 1) return;
 
+  const rng = getRngStream(RNG_STREAMS.RANDOM_EVENT);
   const events = ['deploy_friday', 'coffee_break', 'bug_report'];
-  const event = events[Utils.randomInt(0, events.length - 1)];
+  const event = events[rng.int(0, events.length - 1)];
 
   switch (event) {
     case 'deploy_friday': {
-      const success = Math.random() > 0.3;
+      const success = rng.next() > 0.3;
       if (success) {
         addActiveEffect('production_mult', 2, 30000);
         Utils.showToast(Lang.t('event_deploy_friday_good'), 'success', 4000);
@@ -74,23 +79,20 @@ export function triggerRandomEvent(state, addActiveEffect) {
         addActiveEffect('production_mult', 0.5, 10000);
         Utils.showToast(Lang.t('event_deploy_friday_bad'), 'warning', 4000);
       }
-      state.stats.events.deploy_friday = (state.stats.events.deploy_friday || 0) + 1;
+      grant(0, 'deploy_friday');
       break;
     }
     case 'coffee_break': {
-      const prestigeEffects = Prestige.getAggregatedEffects(state.prestigeUpgrades || []);
+      const prestigeEffects = getPrestigeEffects(state);
       addActiveEffect('click_mult', prestigeEffects.coffeeMult, 13000);
       Utils.showToast(Lang.t('event_coffee_break_desc'), 'info', 4000);
-      state.stats.events.coffee_break = (state.stats.events.coffee_break || 0) + 1;
+      grant(0, 'coffee_break');
       break;
     }
     case 'bug_report': {
       UI.showBugReport(() => {
         const reward = (state.dps || 0) * 60;
-        state.dataPoints += reward;
-        state.stats.totalDataEarned += reward;
-        state.stats.totalDataAllTime += reward;
-        state.stats.events.bug_fixed = (state.stats.events.bug_fixed || 0) + 1;
+        grant(reward, 'bug_fixed');
         Utils.showToast(`Bug fixed! +${Utils.formatNumber(reward)}`, 'success', 3000);
       });
       break;
@@ -0,0 +1,59 @@
+/**
+ * Fixed-timestep simulation clock.
+ *
+ * advance(now) accumulates real time and calls onStep(stepSec) once per whole step, so
+ * the simulation runs at the same rate whatever drives it (timers, animation frames).
+ * When more than `maxSteppedMs` piled up (throttled or suspended tab), all but one
+ * step is handed to onCatchUp(elapsedSec) in a single call instead of being stepped.
+ */
+export function createFixedClock({ stepMs, maxSteppedMs = 5000, onStep, onCatchUp }) {
+  let currentStepMs = stepMs;
+  let accumulator = 0;
+  let lastTime = null;
+
+  function reset(now) {
+    lastTime = now;
+    accumulator = 0;
+  }
+
+  function advance(now) {
+    if (lastTime === null) {
+      reset(now);
+      return 0;
+    }
+
+    accumulator += Math.max(0, now - lastTime);
+    lastTime = now;
+
+    let steps = Math.floor(accumulator / currentStepMs);
+    if (steps * currentStepMs > maxSteppedMs) {
+      const catchUpMs = (steps - 1) * currentStepMs;
+      accumulator -= catchUpMs;
+      onCatchUp?.(catchUpMs / 1000);
+      steps = 1;
+    }
+
+    const stepSec = currentStepMs / 1000;
+    for (let i = 0; i < steps; i += 1) {
+      accumulator -= currentStepMs;
+      onStep(stepSec);
+    }
+    return steps;
+  }
+
+  function setStepMs(ms) {
+    const value = Number(ms);
+    if (Number.isFinite(value) && value > 0) currentStepMs = value;
+  }
+
+  function getStepMs() {
+    return currentStepMs;
+  }
+
+  return {
+    reset,
+    advance,
+    setStepMs,
+    getStepMs,
+  };
+}
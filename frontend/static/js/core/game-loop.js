@@ -1,19 +1,15 @@
 ﻿import * as SaveSystem from '../infra/save-repository.js';
+import * as SaveSync from '../infra/save-sync.js';
 import * as Lang from '../content/i18n/index.js';
+import * as Achievements from '../content/achievements.js';
+import * as Upgrades from '../content/upgrades.js';
+import * as Prestige from '../content/prestige-upgrades.js';
 import * as UI from '../ui/renderer.js';
 import * as Tutorial from '../ui/overlays/tutorial-controller.js';
 import * as Utils from '../infra/number-formatters.js';
-
-import {
-  calculateClickValue as calculateClickValueForState,
-  recalculateDps as recalculateDpsForState,
-  getBuildingDiscount as getBuildingDiscountForState,
-} from './economy.js';
-
-import {
-  addActiveEffect as addEffectToState,
-  updateActiveEffects as updateEffectsInState,
-} from './effects-system.js';
+import { getRngState, restoreRng } from '../infra/rng.js';
+import { GAME_VERSION } from '../app/version.js';
+import { DEFAULT_GAME_CONFIG, loadGameConfig } from '../infra/game-config.js';
 
 import {
   calculateOfflineProgress as applyOfflineProgress,
@@ -23,26 +19,35 @@ import {
   triggerRandomEvent as triggerRandomGameEvent,
 } from './event-system.js';
 
-import {
-  buyBuilding as buyBuildingProgression,
-  buyUpgrade as buyUpgradeProgression,
-  buyPrestigeUpgrade as buyPrestigeUpgradeProgression,
-  performPrestige as performPrestigeProgression,
-  getInnovationPointsPreview as getInnovationPointsPreviewForProgression,
-} from './progression-system.js';
-
-import { unlockNewAchievements } from './achievement-system.js';
+import { createScheduler } from './scheduler.js';
+import { createSimulation } from './simulation.js';
+import { createSimulationClient } from './simulation-client.js';
 
 const AUTO_SAVE_INTERVAL_MS = 30000;
+// Timers whose deadlines are written to state.timers on save and restored on load.
+// Golden data and random events need the DOM, so they run here rather than on
+// simulation ticks.
+const PERSISTED_TIMERS = ['goldenData', 'randomEvent'];
+// Most click particles spawned per frame; an autoclicker's extra clicks still count.
+const MAX_CLICK_PARTICLES_PER_FRAME = 8;
 
 const Game = (() => {
-  let state = null;
+  let engine = null;
+  // 'main' or 'worker': where the simulation currently runs.
+  let engineMode = 'main';
   let lastFrameTime = 0;
   let animationFrameId = null;
   let autoSaveInterval = null;
+  // 0 renders on every animation frame; higher values cap the render rate.
+  let renderIntervalMs = 0;
 
-  let nextGoldenDataTime = 0;
-  let nextRandomEventTime = 0;
+  // Every timed main-thread behaviour (events, UI popups); drained once per frame.
+  const scheduler = createScheduler();
+
+  // Clicks since the last flush and where the first few landed, as x, y pairs.
+  let pendingClicks = 0;
+  const pendingClickPositions = [];
+  const clickCounters = { clicks: 0, batches: 0, particles: 0 };
 
   function getRuntimeApi() {
     return {
@@ -54,6 +59,8 @@ const Game = (() => {
       performPrestige,
       setBuyAmount,
       setLanguage,
+      setOfflineAutoBuy,
+      setOfflineAutoBuyPolicy,
       manualSave,
       exportSave,
       importSave,
@@ -62,20 +69,89 @@ const Game = (() => {
       recalculateDps,
       calculateClickValue,
       getBuildingDiscount,
+      getAvailableUpgrades,
+      schedule,
     };
   }
 
+  /**
+   * The simulation runs on the main thread unless the page is opened with
+   * `?worker=1`, which moves it into core/simulation-worker.js. In worker mode the
+   * state seen here is a mirror and purchases resolve asynchronously.
+   */
+  function createEngine() {
+    const useWorker = typeof Worker !== 'undefined'
+      && new URLSearchParams(window.location.search).get('worker') === '1';
+    engineMode = useWorker ? 'worker' : 'main';
+    if (!useWorker) {
+      return createSimulation({ onEvent: handleSimulationEvent, tickRateMs: DEFAULT_GAME_CONFIG.tick_rate_ms });
+    }
+
+    return createSimulationClient({
+      onEvent: handleSimulationEvent,
+      onError: fallBackToMainThread,
+      tickRateMs: DEFAULT_GAME_CONFIG.tick_rate_ms,
+    });
+  }
+
+  function fallBackToMainThread() {
+    const mirror = engine.getState();
+    const tickRateMs = DEFAULT_GAME_CONFIG.tick_rate_ms;
+    engine.stop();
+    engineMode = 'main';
+    engine = createSimulation({ onEvent: handleSimulationEvent, tickRateMs });
+    loadGameConfig().then((config) => engine.setTickRate(config.tick_rate_ms));
+    if (mirror) {
+      engine.load(mirror);
+      engine.start();
+    }
+  }
+
+  function handleSimulationEvent(event) {
+    const state = engine.getState();
+    switch (event.type) {
+      case 'achievement':
+        UI.showAchievement(Achievements.getById(event.id));
+        break;
+      case 'render':
+        if (event.panel === 'buildings') UI.renderBuildings(state);
+        else if (event.panel === 'upgrades') UI.renderUpgrades(state);
+        else if (event.panel === 'prestige') UI.renderPrestige(state);
+        else UI.renderAll(state);
+        break;
+      case 'upgrade-affordability':
+        UI.applyUpgradeAffordability(event);
+        break;
+      case 'purchased':
+        if (event.kind === 'prestige_upgrade') {
+          Utils.showToast(Prestige.getName(Prestige.getUpgradeById(event.id)), 'success', 3000);
+        } else {
+          Utils.showToast(Upgrades.getName(Upgrades.getById(event.id)), 'success', 2000);
+        }
+        break;
+      case 'prestiged':
+        saveState(state);
+        UI.renderAll(state);
+        UI.showPrestigeAnimation();
+        Utils.showToast(`+${event.pointsToGain} ${Lang.t('innovation_points')}!`, 'prestige', 5000);
+        break;
+      default:
+        break;
+    }
+  }
+
   function init() {
-    const savedState = SaveSystem.load();
-    if (savedState) {
-      state = savedState;
+    engine = createEngine();
+
+    let state = SaveSystem.load();
+    if (state) {
       Lang.setLanguage(state.settings.language);
-      calculateOfflineProgress();
+      applyOfflineProgress(state);
     } else {
       state = SaveSystem.createDefaultState();
     }
 
-    recalculateDps();
+    engine.load(state);
     const runtimeApi = getRuntimeApi();
     UI.setGameApi(runtimeApi);
     Tutorial.setGameApi(runtimeApi);
@@ -84,83 +160,110 @@ const Game = (() => {
 
     if (Tutorial) Tutorial.init();
 
-    scheduleGoldenData();
-    scheduleRandomEvent();
+    restoreRunState(state);
 
     lastFrameTime = performance.now();
-    animationFrameId = requestAnimationFrame(gameLoop);
+    engine.start(lastFrameTime);
+    animationFrameId = requestAnimationFrame(renderLoop);
+
+    loadGameConfig().then((config) => {
+      setTickRate(config.tick_rate_ms);
+      setRenderInterval(config.render_interval_ms);
+    });
 
+    SaveSync.setConflictHandler(handleSaveConflict);
     autoSaveInterval = setInterval(() => {
-      SaveSystem.save(state);
+      flushClicks();
+      const current = engine.getState();
+      saveState(current);
+      SaveSync.push(current);
       UI.showSaveIndicator();
     }, AUTO_SAVE_INTERVAL_MS);
   }
 
-  function gameLoop(timestamp) {
-    const deltaMs = timestamp - lastFrameTime;
-    lastFrameTime = timestamp;
-
-    const deltaSec = Math.min(deltaMs / 1000, 1);
-
-    update(deltaSec);
-    UI.update(state, deltaSec);
-
-    if (Tutorial) Tutorial.update();
-
-    animationFrameId = requestAnimationFrame(gameLoop);
+  function setTickRate(tickRateMs) {
+    engine.setTickRate(tickRateMs);
   }
 
-  function update(deltaSec) {
-    applyProductionTick(deltaSec);
-    updateActiveEffects();
-
-    const unlocked = unlockNewAchievements(state, (achievement) => {
-      UI.showAchievement(achievement);
-    });
-    if (unlocked.length > 0) recalculateDps();
+  function setRenderInterval(ms) {
+    const value = Number(ms);
+    if (Number.isFinite(value) && value >= 0) renderIntervalMs = value;
+  }
 
-    if (Date.now() >= nextGoldenDataTime) {
-      spawnGoldenData();
-      scheduleGoldenData();
-    }
+  /**
+   * Rendering consumes whatever state the simulation reached; it also advances the
+   * simulation first so a frame never shows state older than the last whole step.
+   */
+  function renderLoop(timestamp) {
+    flushClicks();
+    engine.advance(performance.now());
+    scheduler.runDue(Date.now());
 
-    if (Date.now() >= nextRandomEventTime) {
-      triggerRandomEvent();
-      scheduleRandomEvent();
+    const deltaMs = timestamp - lastFrameTime;
+    if (deltaMs >= renderIntervalMs) {
+      lastFrameTime = timestamp;
+      UI.update(engine.getState(), Math.min(deltaMs / 1000, 1));
+      if (Tutorial) Tutorial.update();
     }
 
-    if (state.dps > state.stats.highestDps) {
-      state.stats.highestDps = state.dps;
-    }
+    animationFrameId = requestAnimationFrame(renderLoop);
+  }
 
-    state.lastTickTime = Date.now();
+  /**
+   * Run `callback` after `delayMs` on the frame scheduler. Reusing a key replaces
+   * that timer; a null key always adds a new one. Returns the key.
+   */
+  function schedule(key, delayMs, callback) {
+    return scheduler.schedule(key, Date.now() + delayMs, callback);
   }
 
-  function applyProductionTick(deltaSec) {
-    state.stats.playTimeSeconds += deltaSec;
+  /**
+   * Continue the random streams from `state.rng` and reschedule the persisted timers
+   * from `state.timers`; whatever is absent starts afresh.
+   */
+  function restoreRunState(state) {
+    restoreRng(state?.rng);
+    const saved = state?.timers || {};
+    scheduleGoldenData(saved.goldenData);
+    scheduleRandomEvent(saved.randomEvent);
+  }
 
-    const generatedData = state.dps * deltaSec;
-    if (generatedData <= 0) return;
+  function captureRunState(state) {
+    state.timers = scheduler.getDeadlines(PERSISTED_TIMERS);
+    state.rng = getRngState();
+  }
 
-    state.dataPoints += generatedData;
-    state.stats.totalDataEarned += generatedData;
-    state.stats.totalDataAllTime += generatedData;
+  function saveState(state) {
+    captureRunState(state);
+    return SaveSystem.save(state);
   }
 
+  /**
+   * Queue a click; the batch is applied on the next frame (see flushClicks).
+   */
   function handleClick(x, y) {
-    const clickValue = calculateClickValue();
+    pendingClicks += 1;
+    if (pendingClickPositions.length < MAX_CLICK_PARTICLES_PER_FRAME * 2) {
+      pendingClickPositions.push(x, y);
+    }
+  }
 
-    state.dataPoints += clickValue;
-    state.stats.totalDataEarned += clickValue;
-    state.stats.totalDataAllTime += clickValue;
-    state.stats.totalClicks += 1;
-    state.stats.totalClicksAllTime = (state.stats.totalClicksAllTime || 0) + 1;
+  /**
+   * Apply queued clicks as one count x value batch, with at most
+   * MAX_CLICK_PARTICLES_PER_FRAME particles and one click animation.
+   */
+  function flushClicks() {
+    if (pendingClicks === 0) return;
 
-    Utils.createParticle(x, y, `+${Utils.formatDps(clickValue)}`);
+    const count = pendingClicks;
+    pendingClicks = 0;
+    const earned = engine.click(count);
 
-    unlockNewAchievements(state, (achievement) => {
-      UI.showAchievement(achievement);
-    });
+    UI.showClickParticles(pendingClickPositions, count, earned / count);
+    clickCounters.clicks += count;
+    clickCounters.batches += 1;
+    clickCounters.particles += pendingClickPositions.length / 2;
+    pendingClickPositions.length = 0;
 
     UI.animateClick();
 
@@ -168,115 +271,155 @@ const Game = (() => {
   }
 
   function calculateClickValue() {
-    return calculateClickValueForState(state);
+    return engine.calculateClickValue();
   }
 
+  function discardClicks() {
+    pendingClicks = 0;
+    pendingClickPositions.length = 0;
+  }
+
+  // Purchases and saves settle queued clicks first so their data is already counted.
   function buyBuilding(buildingId) {
-    return buyBuildingProgression(state, buildingId, {
-      getBuildingDiscount,
-      onRecalculateDps: recalculateDps,
-      onRenderBuildings: () => UI.renderBuildings(state),
-      onRenderUpgrades: () => UI.renderUpgrades(state),
-    });
+    flushClicks();
+    return engine.buyBuilding(buildingId);
   }
 
   function buyUpgrade(upgradeId) {
-    return buyUpgradeProgression(state, upgradeId, {
-      onRecalculateDps: recalculateDps,
-      onRenderUpgrades: () => UI.renderUpgrades(state),
-      onShowToast: (message, type, duration) => Utils.showToast(message, type, duration),
-    });
+    flushClicks();
+    return engine.buyUpgrade(upgradeId);
   }
 
   function buyPrestigeUpgrade(upgradeId) {
-    return buyPrestigeUpgradeProgression(state, upgradeId, {
-      onRecalculateDps: recalculateDps,
-      onRenderPrestige: () => UI.renderPrestige(state),
-      onShowToast: (message, type, duration) => Utils.showToast(message, type, duration),
-    });
+    return engine.buyPrestigeUpgrade(upgradeId);
   }
 
   function performPrestige() {
-    const result = performPrestigeProgression(state, {
-      createDefaultState: SaveSystem.createDefaultState,
-      onRecalculateDps: (nextState) => recalculateDpsForState(nextState),
-      onSave: (nextState) => SaveSystem.save(nextState),
-      onRenderAll: (nextState) => UI.renderAll(nextState),
-      onPrestigeAnimation: () => UI.showPrestigeAnimation(),
-      onShowToast: (pointsToGain) => {
-        Utils.showToast(`+${pointsToGain} ${Lang.t('innovation_points')}!`, 'prestige', 5000);
-      },
-    });
-
-    if (!result.ok) return false;
-
-    state = result.state;
-    return true;
+    flushClicks();
+    return engine.performPrestige();
   }
 
+  /**
+   * Full recomputation, for when the state changed in ways the simulation was not told about.
+   */
   function recalculateDps() {
-    recalculateDpsForState(state);
+    engine.recalculateDps();
   }
 
   function getBuildingDiscount() {
-    return getBuildingDiscountForState(state);
+    return engine.getBuildingDiscount();
   }
 
-  function calculateOfflineProgress() {
-    applyOfflineProgress(state);
+  function getAvailableUpgrades() {
+    return engine.getAvailableUpgrades();
   }
 
-  function scheduleGoldenData() {
-    nextGoldenDataTime = computeNextGoldenDataTime(state);
+  function scheduleGoldenData(deadline = computeNextGoldenDataTime(engine.getState())) {
+    scheduler.schedule('goldenData', deadline, () => {
+      spawnGoldenData();
+      scheduleGoldenData();
+    });
   }
 
   function spawnGoldenData() {
-    spawnGoldenDataEvent(state);
+    spawnGoldenDataEvent(engine.getState(), grantReward);
   }
 
-  function scheduleRandomEvent() {
-    nextRandomEventTime = computeNextRandomEventTime();
-  }
-
-  function triggerRandomEvent() {
-    triggerRandomGameEvent(state, (type, multiplier, durationMs) => {
-      addActiveEffect(type, multiplier, durationMs);
+  function scheduleRandomEvent(deadline = computeNextRandomEventTime()) {
+    scheduler.schedule('randomEvent', deadline, () => {
+      triggerRandomEvent();
+      scheduleRandomEvent();
     });
   }
 
-  function addActiveEffect(type, multiplier, durationMs) {
-    addEffectToState(state, type, multiplier, durationMs, recalculateDps);
+  function triggerRandomEvent() {
+    triggerRandomGameEvent(
+      engine.getState(),
+      (type, multiplier, durationMs) => engine.addActiveEffect(type, multiplier, durationMs),
+      grantReward,
+    );
   }
 
-  function updateActiveEffects() {
-    updateEffectsInState(state, recalculateDps);
+  function grantReward(amount, eventKey) {
+    engine.grantReward(amount, eventKey);
   }
 
   function getState() {
-    return state;
+    return engine ? engine.getState() : null;
   }
 
   function setBuyAmount(amount) {
-    state.settings.buyAmount = amount;
-    UI.renderBuildings(state);
+    engine.setBuyAmount(amount);
   }
 
   function setLanguage(lang) {
     Lang.setLanguage(lang);
-    state.settings.language = lang;
-    UI.renderAll(state);
+    engine.setLanguage(lang);
+    UI.renderAll(engine.getState());
+  }
+
+  function setOfflineAutoBuy(enabled) {
+    engine.setOfflineAutoBuy(enabled);
+  }
+
+  function setOfflineAutoBuyPolicy(policy) {
+    return engine.setOfflineAutoBuyPolicy(policy);
+  }
+
+  /**
+   * Start recording every engine command into a command log (core/command-log.js).
+   */
+  function startRecording() {
+    flushClicks();
+    return engine.startRecording({ rng: getRngState(), build: GAME_VERSION });
+  }
+
+  /**
+   * Stop recording; returns the log bytes (a promise of them in worker mode), or null
+   * if nothing was being recorded.
+   */
+  function stopRecording() {
+    flushClicks();
+    return engine.stopRecording();
   }
 
   function manualSave() {
-    SaveSystem.save(state);
+    flushClicks();
+    saveState(engine.getState());
     const message = Lang.getLanguage() === 'en' ? 'Game saved!' : 'Juego guardado!';
     Utils.showToast(message, 'info', 2000);
   }
 
   function exportSave() {
+    const state = engine.getState();
+    captureRunState(state);
     return SaveSystem.exportSave(state);
   }
 
+  /**
+   * Swap in a whole different game (import, or the server's copy after a conflict).
+   */
+  function replaceGame(newState) {
+    Lang.setLanguage(newState.settings.language);
+    discardClicks();
+    engine.load(newState);
+    restoreRunState(newState);
+    saveState(newState);
+    UI.renderAll(newState);
+  }
+
+  /**
+   * The server holds a save further along than this game (another tab or device).
+   * The player picks which one to keep; nothing is uploaded until they do.
+   */
+  function handleSaveConflict() {
+    flushClicks();
+    const useServer = confirm(Lang.t('confirm_save_conflict'));
+    SaveSync.resolveConflict(useServer ? 'server' : 'local', engine.getState()).then((remoteState) => {
+      if (remoteState) replaceGame(SaveSystem.migrate(remoteState));
+    });
+  }
+
   function importSave(data) {
     const newState = SaveSystem.importSave(data);
     if (!newState) {
@@ -285,11 +428,7 @@ const Game = (() => {
       return false;
     }
 
-    state = newState;
-    Lang.setLanguage(state.settings.language);
-    recalculateDps();
-    SaveSystem.save(state);
-    UI.renderAll(state);
+    replaceGame(newState);
 
     const successMessage = Lang.getLanguage() === 'en' ? 'Save imported!' : 'Guardado importado!';
     Utils.showToast(successMessage, 'success', 3000);
@@ -298,8 +437,10 @@ const Game = (() => {
 
   function resetGame() {
     SaveSystem.deleteSave();
-    state = SaveSystem.createDefaultState();
-    recalculateDps();
+    const state = SaveSystem.createDefaultState();
+    discardClicks();
+    engine.load(state);
+    restoreRunState(state);
     UI.renderAll(state);
 
     const message = Lang.getLanguage() === 'en' ? 'Game reset!' : 'Juego reiniciado!';
@@ -309,19 +450,34 @@ const Game = (() => {
   }
 
   function getInnovationPointsPreviewForState() {
-    return getInnovationPointsPreviewForProgression(state);
+    return engine.getInnovationPointsPreview();
+  }
+
+  function getPerfCounters() {
+    return {
+      ...engine.getPerfCounters(),
+      engine: engineMode,
+      renderIntervalMs,
+      clicks: { ...clickCounters },
+      scheduler: scheduler.getCounters(),
+    };
   }
 
   return {
     init,
     getState,
     handleClick,
+    flushClicks,
     buyBuilding,
     buyUpgrade,
     buyPrestigeUpgrade,
     performPrestige,
     setBuyAmount,
     setLanguage,
+    setOfflineAutoBuy,
+    setOfflineAutoBuyPolicy,
+    startRecording,
+    stopRecording,
     manualSave,
     exportSave,
     importSave,
@@ -330,18 +486,26 @@ const Game = (() => {
     recalculateDps,
     calculateClickValue,
     getBuildingDiscount,
+    getPerfCounters,
+    setTickRate,
+    setRenderInterval,
   };
 })();
 
 export const init = Game.init;
 export const getState = Game.getState;
 export const handleClick = Game.handleClick;
+export const flushClicks = Game.flushClicks;
 export const buyBuilding = Game.buyBuilding;
 export const buyUpgrade = Game.buyUpgrade;
 export const buyPrestigeUpgrade = Game.buyPrestigeUpgrade;
 export const performPrestige = Game.performPrestige;
 export const setBuyAmount = Game.setBuyAmount;
 export const setLanguage = Game.setLanguage;
+export const setOfflineAutoBuy = Game.setOfflineAutoBuy;
+export const setOfflineAutoBuyPolicy = Game.setOfflineAutoBuyPolicy;
+export const startRecording = Game.startRecording;
+export const stopRecording = Game.stopRecording;
 export const manualSave = Game.manualSave;
 export const exportSave = Game.exportSave;
 export const importSave = Game.importSave;
@@ -350,4 +514,7 @@ export const getInnovationPointsPreview = Game.getInnovationPointsPreview;
 export const recalculateDps = Game.recalculateDps;
 export const calculateClickValue = Game.calculateClickValue;
 export const getBuildingDiscount = Game.getBuildingDiscount;
+export const getPerfCounters = Game.getPerfCounters;
+export const setTickRate = Game.setTickRate;
+export const setRenderInterval = Game.setRenderInterval;
 export default Game;
@@ -0,0 +1,278 @@
+import * as Achievements from '../content/achievements.js';
+import * as Buildings from '../content/buildings.js';
+import * as Upgrades from '../content/upgrades.js';
+import * as Utils from '../infra/number-formatters.js';
+import { createAchievementTracker } from './achievement-system.js';
+import { createDpsModel } from './dps-model.js';
+import { getBuildingDiscount } from './economy.js';
+import { simulateOfflineProgress } from './offline-progress.js';
+import { createUpgradeUnlockTracker } from './upgrade-unlocks.js';
+
+// Same policies as backend/sim/runner.py: 'payback' buys the building with the lowest
+// cost per unit of DPS, 'cheapest' the lowest price. Upgrades are always bought
+// cheapest first as soon as they are unlocked and affordable.
+export const OFFLINE_AUTO_BUY_POLICIES = ['payback', 'cheapest'];
+
+// Wall-clock budget for one offline settlement; past it the lump-sum path is used.
+// Longer absences buy more and get more time: the base budget, plus this much per
+// doubling of the absence in hours, up to the cap. A cold first run (page load, no
+// JIT yet) settles a week of early game in roughly 100 ms.
+export const OFFLINE_AUTO_BUY_BUDGET_MS = 100;
+const BUDGET_MS_PER_DOUBLING = 50;
+const MAX_BUDGET_MS = 500;
+// The clock is read once per this many events.
+const BUDGET_CHECK_EVERY = 16;
+
+// Total-data levels that change what can be bought or how fast data comes in:
+// building reveals, total_data upgrade requirements and production achievements.
+const TOTAL_DATA_GATES = (() => {
+  const gates = new Set();
+  for (const def of Buildings.getAll()) if (def.unlockAt > 0) gates.add(def.unlockAt);
+  for (const upgrade of Upgrades.getAll()) {
+    if (upgrade.requirement?.type === 'total_data') gates.add(upgrade.requirement.value);
+  }
+  for (const achievement of Achievements.getAll()) {
+    if ((achievement.checkType || 'production') === 'production') gates.add(achievement.threshold);
+  }
+  return [...gates].sort((a, b) => a - b);
+})();
+
+/**
+ * Default compute budget (ms) for settling `elapsedSec` of absence.
+ */
+export function getOfflineAutoBuyBudgetMs(elapsedSec) {
+  const doublings = Math.log2(1 + (Math.max(0, elapsedSec) / 3600));
+  return Math.min(MAX_BUDGET_MS, OFFLINE_AUTO_BUY_BUDGET_MS + (BUDGET_MS_PER_DOUBLING * doublings));
+}
+
+// Buildings in reveal order, so the visible ones are always a prefix.
+const BUILDINGS_BY_UNLOCK = [...Buildings.getAll()].sort((a, b) => a.unlockAt - b.unlockAt);
+
+function nextGate(totalDataEarned) {
+  let lo = 0;
+  let hi = TOTAL_DATA_GATES.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (TOTAL_DATA_GATES[mid] > totalDataEarned) hi = mid;
+    else lo = mid + 1;
+  }
+  return TOTAL_DATA_GATES[lo] ?? Infinity;
+}
+
+/**
+ * Settle an absence like simulateOfflineProgress, spending the data as it comes in.
+ *
+ * Event-driven: between purchases DPS is constant, so the next point of interest
+ * (the preferred item becomes affordable, a total-data gate is crossed, an effect
+ * expires) is solved in closed form and production jumps straight to it. Runs of the
+ * preferred building are bought in bulk up to the price where the runner-up would win.
+ * The work happens on a copy of `state`; if it takes longer than `budgetMs` (by
+ * default getOfflineAutoBuyBudgetMs(elapsedSec)) the copy is dropped and the plain
+ * lump-sum settlement is used instead (`autoBuy.fellBack`).
+ *
+ * Returns the simulateOfflineProgress summary plus
+ * `autoBuy: { policy, fellBack, buildings: { id: count }, upgrades, spent, events }`.
+ */
+export function simulateOfflineAutoBuyer(state, elapsedSec, {
+  now = Date.now(),
+  rate = 1,
+  policy = 'payback',
+  budgetMs = getOfflineAutoBuyBudgetMs(elapsedSec),
+  clock = () => performance.now(),
+} = {}) {
+  const startedAt = clock();
+  const autoBuy = { policy, fellBack: false, buildings: {}, upgrades: [], spent: 0, events: 0 };
+  const summary = {
+    secondsAway: elapsedSec,
+    dataEarned: 0,
+    rate,
+    segments: [],
+    expiredEffects: [],
+    achievements: [],
+    autoBuy,
+  };
+  if (!state || !(elapsedSec > 0)) return summary;
+
+  const work = structuredClone(state);
+  const startMs = now - (elapsedSec * 1000);
+  const discount = getBuildingDiscount(work);
+  const dpsModel = createDpsModel();
+  const achievementTracker = createAchievementTracker();
+  const upgradeTracker = createUpgradeUnlockTracker();
+  let dps = dpsModel.recalculate(work);
+
+  // Next unit price per building, refreshed only when that building is bought, and
+  // how many of BUILDINGS_BY_UNLOCK are revealed.
+  const nextCosts = {};
+  for (const def of BUILDINGS_BY_UNLOCK) {
+    nextCosts[def.id] = Utils.calculateBuildingCost(def.baseCost * discount, work.buildings[def.id] || 0, def.growthRate);
+  }
+  let visibleCount = 0;
+
+  function unlockAchievements() {
+    const ids = achievementTracker.unlock(work);
+    if (ids.length === 0) return;
+    summary.achievements.push(...ids);
+    dpsModel.markAchievementsChanged();
+    dps = dpsModel.recalculate(work);
+  }
+
+  function expireEffects(atMs) {
+    const remaining = work.activeEffects.filter((effect) => effect.endTime > atMs);
+    if (remaining.length === work.activeEffects.length) return;
+
+    for (const effect of work.activeEffects) {
+      if (effect.endTime <= atMs) summary.expiredEffects.push(effect);
+    }
+    work.activeEffects = remaining;
+    dpsModel.markEffectsChanged();
+    dps = dpsModel.recalculate(work);
+  }
+
+  function buyUpgrades() {
+    let bought = false;
+    upgradeTracker.update(work);
+    for (const upgrade of upgradeTracker.getAvailable(work)) {
+      if (work.dataPoints < upgrade.cost) break;
+      work.dataPoints -= upgrade.cost;
+      work.upgrades.push(upgrade.id);
+      upgradeTracker.markUpgradePurchased(upgrade.id);
+      dpsModel.markUpgradeAdded(upgrade.id);
+      autoBuy.upgrades.push(upgrade.id);
+      autoBuy.spent += upgrade.cost;
+      bought = true;
+    }
+    if (bought) dps = dpsModel.recalculate(work);
+    return bought;
+  }
+
+  function score(cost, def) {
+    if (policy === 'cheapest') return cost;
+    return cost / (def.baseDps * (work.buildingMultipliers?.[def.id] || 1));
+  }
+
+  // The preferred building, its next unit price and how many units in a row keep
+  // it preferred (every unit whose own score still beats the runner-up's).
+  function pickBuilding() {
+    while (visibleCount < BUILDINGS_BY_UNLOCK.length
+      && work.stats.totalDataEarned >= BUILDINGS_BY_UNLOCK[visibleCount].unlockAt) {
+      visibleCount += 1;
+    }
+
+    let bestDef = null;
+    let bestValue = Infinity;
+    let runnerUp = Infinity;
+    for (let i = 0; i < visibleCount; i += 1) {
+      const def = BUILDINGS_BY_UNLOCK[i];
+      const value = score(nextCosts[def.id], def);
+      if (!bestDef || value < bestValue) {
+        if (bestDef) runnerUp = bestValue;
+        bestDef = def;
+        bestValue = value;
+      } else if (value < runnerUp) {
+        runnerUp = value;
+      }
+    }
+    if (!bestDef) return null;
+
+    // Unit prices grow geometrically, so the run length is a logarithm.
+    const cost = nextCosts[bestDef.id];
+    const priceLimit = runnerUp * (cost / bestValue);
+    const run = Number.isFinite(priceLimit)
+      ? Math.max(1, Math.floor(Math.log(priceLimit / cost) / Math.log(bestDef.growthRate)) + 1)
+      : Infinity;
+    return { def: bestDef, cost, run };
+  }
+
+  function buyBuildings(pick) {
+    const { def } = pick;
+    const baseCost = def.baseCost * discount;
+    const owned = work.buildings[def.id] || 0;
+    const count = Math.min(pick.run, Utils.maxAffordable(baseCost, owned, work.dataPoints, def.growthRate).count);
+    if (count <= 0) return false;
+
+    const totalCost = Utils.calculateBulkCost(baseCost, owned, count, def.growthRate);
+    if (work.dataPoints < totalCost) return false;
+
+    work.dataPoints -= totalCost;
+    work.buildings[def.id] = owned + count;
+    work.stats.totalBuildings = Object.values(work.buildings).reduce((sum, n) => sum + n, 0);
+    nextCosts[def.id] = Utils.calculateBuildingCost(baseCost, owned + count, def.growthRate);
+    dpsModel.markBuildingChanged(def.id);
+    achievementTracker.markBuildingChanged(def.id);
+    upgradeTracker.markBuildingChanged(def.id);
+    dps = dpsModel.recalculate(work);
+
+    autoBuy.buildings[def.id] = (autoBuy.buildings[def.id] || 0) + count;
+    autoBuy.spent += totalCost;
+    return true;
+  }
+
+  function fallBack() {
+    const lumpSum = simulateOfflineProgress(state, elapsedSec, { now, rate });
+    lumpSum.autoBuy = { policy, fellBack: true, buildings: {}, upgrades: [], spent: 0, events: autoBuy.events };
+    return lumpSum;
+  }
+
+  expireEffects(startMs);
+  unlockAchievements();
+
+  // Offsets from startMs, as in simulateOfflineProgress.
+  const totalMs = elapsedSec * 1000;
+  let offsetMs = 0;
+  for (;;) {
+    if (autoBuy.events % BUDGET_CHECK_EVERY === 0 && clock() - startedAt > budgetMs) return fallBack();
+    autoBuy.events += 1;
+
+    if (buyUpgrades()) {
+      unlockAchievements();
+      continue;
+    }
+    const pick = pickBuilding();
+    if (pick && buyBuildings(pick)) {
+      unlockAchievements();
+      continue;
+    }
+    if (offsetMs >= totalMs) break;
+
+    // Nothing affordable: produce until the next point of interest.
+    let endMs = totalMs;
+    for (const effect of work.activeEffects) endMs = Math.min(endMs, effect.endTime - startMs);
+
+    const ratePerMs = (dps * rate) / 1000;
+    let needed = Infinity;
+    const considerTarget = (target) => {
+      if (target > 0 && target < needed) needed = target;
+    };
+    considerTarget(nextGate(work.stats.totalDataEarned) - work.stats.totalDataEarned);
+    if (pick) considerTarget(pick.cost - work.dataPoints);
+    const nextUpgrade = upgradeTracker.getAvailable(work)[0];
+    if (nextUpgrade) considerTarget(nextUpgrade.cost - work.dataPoints);
+    let endsOnTarget = false;
+    if (ratePerMs > 0 && offsetMs + (needed / ratePerMs) < endMs) {
+      endMs = offsetMs + (needed / ratePerMs);
+      endsOnTarget = true;
+    }
+
+    const seconds = (endMs - offsetMs) / 1000;
+    // A segment that ends on a target earns exactly what was missing.
+    const data = endsOnTarget ? needed : dps * rate * seconds;
+    if (data > 0) {
+      work.dataPoints += data;
+      work.stats.totalDataEarned += data;
+      work.stats.totalDataAllTime += data;
+      summary.dataEarned += data;
+    }
+    if (seconds > 0) summary.segments.push({ seconds, dps, data });
+    if (dps > work.stats.highestDps) work.stats.highestDps = dps;
+
+    offsetMs = endMs;
+    expireEffects(startMs + offsetMs);
+    unlockAchievements();
+  }
+
+  work.stats.playTimeSeconds += elapsedSec;
+  work.lastTickTime = now;
+  Object.assign(state, work);
+  return summary;
+}
@@ -0,0 +1,109 @@
+import * as Achievements from '../content/achievements.js';
+import { unlockNewAchievements } from './achievement-system.js';
+import { createDpsModel } from './dps-model.js';
+
+// Production thresholds, lowest first. Like Achievements.checkAll, a missing
+// checkType means 'production' (this includes the click ones).
+const PRODUCTION_THRESHOLDS = Achievements.getAll()
+  .filter((achievement) => (achievement.checkType || 'production') === 'production')
+  .sort((a, b) => a.threshold - b.threshold);
+
+/**
+ * Settle an absence of `elapsedSec` seconds ending at `now` (ms) on `state`.
+ *
+ * DPS only changes offline when an active effect expires or a production achievement
+ * unlocks, so the interval is split at those boundaries and each segment is credited
+ * in closed form (dps x rate x duration). Cost is O(boundaries), not O(seconds).
+ * Expired effects are removed, unlocked achievements recorded and playTimeSeconds /
+ * highestDps updated. Returns an itemized summary for the offline modal:
+ * `{ secondsAway, dataEarned, rate, segments: [{ seconds, dps, data }],
+ *    expiredEffects, achievements }`.
+ */
+export function simulateOfflineProgress(state, elapsedSec, { now = Date.now(), rate = 1 } = {}) {
+  const summary = {
+    secondsAway: elapsedSec,
+    dataEarned: 0,
+    rate,
+    segments: [],
+    expiredEffects: [],
+    achievements: [],
+  };
+  if (!state || !(elapsedSec > 0)) return summary;
+
+  const startMs = now - (elapsedSec * 1000);
+  const dpsModel = createDpsModel();
+  let dps = dpsModel.recalculate(state);
+
+  const unlocked = new Set(state.achievements);
+  let thresholdIndex = 0;
+
+  function unlockAchievements() {
+    const ids = unlockNewAchievements(state);
+    if (ids.length === 0) return;
+    for (const id of ids) unlocked.add(id);
+    summary.achievements.push(...ids);
+    dpsModel.markAchievementsChanged();
+    dps = dpsModel.recalculate(state);
+  }
+
+  function expireEffects(atMs) {
+    const remaining = state.activeEffects.filter((effect) => effect.endTime > atMs);
+    if (remaining.length === state.activeEffects.length) return;
+
+    for (const effect of state.activeEffects) {
+      if (effect.endTime <= atMs) summary.expiredEffects.push(effect);
+    }
+    state.activeEffects = remaining;
+    dpsModel.markEffectsChanged();
+    dps = dpsModel.recalculate(state);
+  }
+
+  function nextThreshold() {
+    while (thresholdIndex < PRODUCTION_THRESHOLDS.length
+      && unlocked.has(PRODUCTION_THRESHOLDS[thresholdIndex].id)) {
+      thresholdIndex += 1;
+    }
+    return PRODUCTION_THRESHOLDS[thresholdIndex]?.threshold ?? Infinity;
+  }
+
+  expireEffects(startMs);
+  unlockAchievements();
+
+  // Offsets from startMs: epoch milliseconds are too coarse for short segments.
+  const totalMs = elapsedSec * 1000;
+  let offsetMs = 0;
+  while (offsetMs < totalMs) {
+    let endMs = totalMs;
+    for (const effect of state.activeEffects) endMs = Math.min(endMs, effect.endTime - startMs);
+
+    const threshold = nextThreshold();
+    const ratePerMs = (dps * rate) / 1000;
+    const toThreshold = threshold - state.stats.totalDataEarned;
+    let endsAtThreshold = false;
+    if (ratePerMs > 0 && offsetMs + (toThreshold / ratePerMs) < endMs) {
+      endMs = offsetMs + Math.max(0, toThreshold / ratePerMs);
+      endsAtThreshold = true;
+    }
+
+    const seconds = (endMs - offsetMs) / 1000;
+    // A segment that ends on a threshold earns exactly what was missing.
+    const data = endsAtThreshold ? Math.max(0, toThreshold) : dps * rate * seconds;
+    if (data > 0) {
+      state.dataPoints += data;
+      state.stats.totalDataEarned += data;
+      state.stats.totalDataAllTime += data;
+      summary.dataEarned += data;
+    }
+    if (seconds > 0) summary.segments.push({ seconds, dps, data });
+    if (dps > state.stats.highestDps) state.stats.highestDps = dps;
+
+    offsetMs = endMs;
+    if (endsAtThreshold) thresholdIndex += 1;
+    expireEffects(startMs + offsetMs);
+    unlockAchievements();
+  }
+
+  state.stats.playTimeSeconds += elapsedSec;
+  state.lastTickTime = now;
+  return summary;
+}
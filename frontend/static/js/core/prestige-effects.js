@@ -0,0 +1,36 @@
+import * as Prestige from '../content/prestige-upgrades.js';
+
+// state -> { purchased, effects }. `purchased` is the prestigeUpgrades array the effects
+// were aggregated from, so replacing that array also misses the cache.
+const cache = new WeakMap();
+const counters = { hits: 0, recomputes: 0, invalidations: 0 };
+
+/**
+ * Aggregated prestige effects for `state`, recomputed only after the purchased set changed.
+ *
+ * Code that mutates `state.prestigeUpgrades` in place must call invalidatePrestigeEffects().
+ * The returned object is shared and frozen.
+ */
+export function getPrestigeEffects(state) {
+  const purchased = state?.prestigeUpgrades || [];
+  if (!state) return Object.freeze(Prestige.getAggregatedEffects(purchased));
+
+  const entry = cache.get(state);
+  if (entry && entry.purchased === purchased) {
+    counters.hits += 1;
+    return entry.effects;
+  }
+
+  const effects = Object.freeze(Prestige.getAggregatedEffects(purchased));
+  cache.set(state, { purchased, effects });
+  counters.recomputes += 1;
+  return effects;
+}
+
+export function invalidatePrestigeEffects(state) {
+  if (state && cache.delete(state)) counters.invalidations += 1;
+}
+
+export function getPrestigeEffectsCounters() {
+  return { ...counters };
+}
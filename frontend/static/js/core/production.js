@@ -0,0 +1,16 @@
+// Data credited outside regular production ticks. DOM-free, so the simulation
+// worker can use it as well as the main-thread event system.
+
+/**
+ * Credit an event reward and count the event; `amount` 0 only counts it.
+ */
+export function grantEventReward(state, amount, eventKey) {
+  if (amount > 0) {
+    state.dataPoints += amount;
+    state.stats.totalDataEarned += amount;
+    state.stats.totalDataAllTime += amount;
+  }
+  if (eventKey) {
+    state.stats.events[eventKey] = (state.stats.events[eventKey] || 0) + 1;
+  }
+}
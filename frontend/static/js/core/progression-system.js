@@ -2,6 +2,7 @@
 import * as Upgrades from '../content/upgrades.js';
 import * as Prestige from '../content/prestige-upgrades.js';
 import * as Utils from '../infra/number-formatters.js';
+import { getPrestigeEffects, invalidatePrestigeEffects } from './prestige-effects.js';
 
 export function buyBuilding(state, buildingId, callbacks = {}) {
   const def = Buildings.getById(buildingId);
@@ -16,15 +17,8 @@ export function buyBuilding(state, buildingId, callbacks = {}) {
 
   if (amount <= 0) return false;
 
-  let totalCost = 0;
-  for (let i = 0; i < amount; i += 1) {
-    // Keep per-step rounding aligned with the original gameplay formula.
-    totalCost += Utils.calculateBuildingCost(
-      def.baseCost * discount,
-      owned + i,
-      def.growthRate,
-    );
-  }
+  // Same per-unit rounding as summing calculateBuildingCost for each unit.
+  const totalCost = Utils.calculateBulkCost(def.baseCost * discount, owned, amount, def.growthRate);
 
   if (state.dataPoints < totalCost) return false;
 
@@ -62,6 +56,7 @@ export function buyPrestigeUpgrade(state, upgradeId, callbacks = {}) {
 
   state.innovationPoints -= upgrade.cost;
   state.prestigeUpgrades.push(upgradeId);
+  invalidatePrestigeEffects(state);
 
   callbacks.onRecalculateDps?.();
   callbacks.onRenderPrestige?.();
@@ -107,7 +102,8 @@ export function performPrestige(state, callbacks = {}) {
   nextState.stats = persistent.stats;
   nextState.stats.totalDataAllTime = persistent.stats.totalDataAllTime;
 
-  const effects = Prestige.getAggregatedEffects(nextState.prestigeUpgrades);
+  invalidatePrestigeEffects(nextState);
+  const effects = getPrestigeEffects(nextState);
   nextState.dataPoints = effects.startBonus;
   nextState.stats.totalDataEarned = effects.startBonus;
 
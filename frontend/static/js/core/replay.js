@@ -0,0 +1,46 @@
+import { decodeCommandLog } from './command-log.js';
+import { createSimulation } from './simulation.js';
+
+/**
+ * Re-run a command log (Simulation.stopRecording()) on a fresh simulation as fast as
+ * possible: no clock, no timers, no rendering.
+ *
+ * The recorded state is loaded at the recorded game time, then each command is
+ * applied after the same number of fixed steps as when it was recorded, and the run
+ * ends on the recorded final step. Events go to `onEvent` if given. Returns the final
+ * `state` with `{ steps, commands, simulatedSec, elapsedMs, header }`.
+ */
+export function replayCommandLog(bytes, { onEvent = () => {} } = {}) {
+  const startedAt = performance.now();
+  const { header, entries, endStep } = decodeCommandLog(bytes);
+
+  const simulation = createSimulation({ onEvent, tickRateMs: header.stepMs, now: () => header.simTime });
+  simulation.load(structuredClone(header.state), header.simTime);
+
+  let step = 0;
+  let stepMs = header.stepMs;
+  let simulatedSec = 0;
+  function runTo(target) {
+    if (target <= step) return;
+    simulation.runSteps(target - step);
+    simulatedSec += ((target - step) * stepMs) / 1000;
+    step = target;
+  }
+
+  for (const { step: at, command } of entries) {
+    runTo(at);
+    if (command.type === 'CATCH_UP') simulatedSec += command.elapsedSec;
+    if (command.type === 'SET_TICK_RATE') stepMs = command.ms;
+    simulation.apply(command);
+  }
+  runTo(endStep);
+
+  return {
+    state: simulation.getState(),
+    steps: endStep,
+    commands: entries.length,
+    simulatedSec,
+    elapsedMs: performance.now() - startedAt,
+    header,
+  };
+}
@@ -0,0 +1,157 @@
+// Stale entries (replaced or cancelled) are dropped when they reach the top; the heap
+// is rebuilt if they ever outnumber the live ones by this factor.
+const MAX_STALE_RATIO = 2;
+
+function isEarlier(a, b) {
+  return a.deadline < b.deadline || (a.deadline === b.deadline && a.seq < b.seq);
+}
+
+/**
+ * Deadline scheduler: a binary min-heap of timers keyed by name.
+ *
+ * Deadlines are absolute epoch milliseconds, so they can be saved and restored as
+ * plain numbers (getDeadlines / schedule). Scheduling a key that is already pending
+ * replaces it. runDue(now) pops only the timers that are due, earliest first, against
+ * one clock reading taken by the caller; a frame with nothing due costs a single
+ * comparison. Timers with equal deadlines fire in the order they were scheduled.
+ */
+export function createScheduler() {
+  const heap = [];
+  const pending = new Map(); // key -> live heap entry
+  let nextSeq = 0;
+
+  const counters = { scheduled: 0, fired: 0, cancelled: 0, staleDropped: 0 };
+
+  function siftUp(index) {
+    const entry = heap[index];
+    while (index > 0) {
+      const parent = (index - 1) >> 1;
+      if (!isEarlier(entry, heap[parent])) break;
+      heap[index] = heap[parent];
+      index = parent;
+    }
+    heap[index] = entry;
+  }
+
+  function siftDown(index) {
+    const entry = heap[index];
+    const half = heap.length >> 1;
+    while (index < half) {
+      let child = (index * 2) + 1;
+      if (child + 1 < heap.length && isEarlier(heap[child + 1], heap[child])) child += 1;
+      if (!isEarlier(heap[child], entry)) break;
+      heap[index] = heap[child];
+      index = child;
+    }
+    heap[index] = entry;
+  }
+
+  function popTop() {
+    const top = heap[0];
+    const last = heap.pop();
+    if (heap.length > 0) {
+      heap[0] = last;
+      siftDown(0);
+    }
+    return top;
+  }
+
+  function compact() {
+    heap.length = 0;
+    for (const entry of pending.values()) heap.push(entry);
+    for (let i = (heap.length >> 1) - 1; i >= 0; i -= 1) siftDown(i);
+  }
+
+  /**
+   * Run `callback(now, key)` once `deadline` (epoch ms) has passed. A null key gets a
+   * fresh one. Returns the key, for cancel().
+   */
+  function schedule(key, deadline, callback) {
+    const timerKey = key ?? Symbol('timer');
+    const entry = { key: timerKey, deadline, callback, seq: nextSeq };
+    nextSeq += 1;
+
+    pending.set(timerKey, entry);
+    heap.push(entry);
+    siftUp(heap.length - 1);
+    counters.scheduled += 1;
+
+    if (heap.length > (pending.size * MAX_STALE_RATIO) + 16) compact();
+    return timerKey;
+  }
+
+  function cancel(key) {
+    if (pending.delete(key)) counters.cancelled += 1;
+  }
+
+  function has(key) {
+    return pending.has(key);
+  }
+
+  function getDeadline(key) {
+    return pending.get(key)?.deadline ?? null;
+  }
+
+  /**
+   * Fire every timer due at `now`, earliest first. Callbacks may schedule new timers;
+   * those fire in the same call if they are already due.
+   */
+  function runDue(now) {
+    let fired = 0;
+    while (heap.length > 0 && heap[0].deadline <= now) {
+      const entry = popTop();
+      if (pending.get(entry.key) !== entry) {
+        counters.staleDropped += 1;
+        continue;
+      }
+      pending.delete(entry.key);
+      fired += 1;
+      counters.fired += 1;
+      entry.callback(now, entry.key);
+    }
+    return fired;
+  }
+
+  /**
+   * Earliest pending deadline, or Infinity.
+   */
+  function nextDeadline() {
+    while (heap.length > 0 && pending.get(heap[0].key) !== heap[0]) {
+      popTop();
+      counters.staleDropped += 1;
+    }
+    return heap.length > 0 ? heap[0].deadline : Infinity;
+  }
+
+  /**
+   * `{ key: deadline }` for the given keys that are pending, for saving.
+   */
+  function getDeadlines(keys) {
+    const deadlines = {};
+    for (const key of keys) {
+      if (pending.has(key)) deadlines[key] = pending.get(key).deadline;
+    }
+    return deadlines;
+  }
+
+  function clear() {
+    heap.length = 0;
+    pending.clear();
+  }
+
+  function getCounters() {
+    return { ...counters, pending: pending.size, heapSize: heap.length };
+  }
+
+  return {
+    schedule,
+    cancel,
+    has,
+    getDeadline,
+    runDue,
+    nextDeadline,
+    getDeadlines,
+    clear,
+    getCounters,
+  };
+}
@@ -0,0 +1,171 @@
+import * as Upgrades from '../content/upgrades.js';
+import { getBuildingDiscount as getBuildingDiscountForState } from './economy.js';
+import { getInnovationPointsPreview as getInnovationPointsPreviewForProgression } from './progression-system.js';
+import { applySnapshot } from './simulation-snapshot.js';
+
+/**
+ * Main-thread handle on core/simulation-worker.js with the same surface as
+ * createSimulation().
+ *
+ * getState() returns a mirror: replaced by the worker's copy whenever its revision
+ * changes and patched from the per-tick numbers otherwise, so it is at most one
+ * snapshot behind. Commands that change the game resolve asynchronously (promises);
+ * click() returns the earnings at the last known click value straight away.
+ */
+export function createSimulationClient({ onEvent = () => {}, onError = () => {}, tickRateMs = 33 } = {}) {
+  const worker = new Worker(new URL('./simulation-worker.js', import.meta.url), { type: 'module' });
+
+  let mirror = null;
+  let clickValue = 0;
+  let counters = null;
+  let revision = -1;
+  let initialized = false;
+  let frameRequested = false;
+  let nextRequestId = 1;
+  const pendingResults = new Map();
+
+  worker.addEventListener('message', ({ data }) => {
+    if (data?.type !== 'snapshot') return;
+    frameRequested = false;
+
+    if (data.state) {
+      mirror = data.state;
+      counters = data.counters || counters;
+    }
+    revision = data.revision;
+    if (mirror) clickValue = applySnapshot(mirror, data.numbers);
+
+    for (const event of data.events) onEvent(event);
+    for (const { requestId, value } of data.results) {
+      pendingResults.get(requestId)?.(value);
+      pendingResults.delete(requestId);
+    }
+  });
+
+  worker.addEventListener('error', (event) => {
+    for (const resolve of pendingResults.values()) resolve(false);
+    pendingResults.clear();
+    onError(event);
+  });
+
+  function post(command) {
+    const requestId = nextRequestId;
+    nextRequestId += 1;
+    return new Promise((resolve) => {
+      pendingResults.set(requestId, resolve);
+      worker.postMessage({ type: 'command', command, requestId });
+    });
+  }
+
+  function getState() {
+    return mirror;
+  }
+
+  function getRevision() {
+    return revision;
+  }
+
+  function load(state) {
+    mirror = state;
+    if (!initialized) {
+      initialized = true;
+      worker.postMessage({ type: 'init', state, tickRateMs });
+    } else {
+      post({ type: 'LOAD', state });
+    }
+  }
+
+  function start() {
+    // The worker starts its own clock on init.
+  }
+
+  function stop() {
+    worker.terminate();
+  }
+
+  /**
+   * Ask for a snapshot; called once per rendered frame, at most one in flight.
+   */
+  function advance() {
+    if (!initialized || frameRequested) return 0;
+    frameRequested = true;
+    worker.postMessage({ type: 'frame' });
+    return 0;
+  }
+
+  function setTickRate(ms) {
+    tickRateMs = ms;
+    worker.postMessage({ type: 'tick-rate', tickRateMs: ms });
+  }
+
+  function click(count = 1) {
+    worker.postMessage({ type: 'command', command: { type: 'CLICK', count } });
+    return clickValue * count;
+  }
+
+  function calculateClickValue() {
+    return clickValue;
+  }
+
+  function setBuyAmount(amount) {
+    if (mirror) mirror.settings.buyAmount = amount;
+    return post({ type: 'SET_BUY_AMOUNT', amount });
+  }
+
+  function setLanguage(language) {
+    if (mirror) mirror.settings.language = language;
+    return post({ type: 'SET_LANGUAGE', language });
+  }
+
+  function setOfflineAutoBuy(enabled) {
+    if (mirror) mirror.settings.offlineAutoBuy = enabled;
+    return post({ type: 'SET_OFFLINE_AUTO_BUY', enabled });
+  }
+
+  function setOfflineAutoBuyPolicy(policy) {
+    if (mirror) mirror.settings.offlineAutoBuyPolicy = policy;
+    return post({ type: 'SET_OFFLINE_AUTO_BUY_POLICY', policy });
+  }
+
+  /**
+   * The mirror was edited directly (test API setState); send it back as the state.
+   */
+  function recalculateDps() {
+    if (mirror) post({ type: 'LOAD', state: mirror });
+  }
+
+  function getPerfCounters() {
+    return counters;
+  }
+
+  return {
+    getState,
+    getRevision,
+    load,
+    start,
+    stop,
+    advance,
+    setTickRate,
+    click,
+    calculateClickValue,
+    buyBuilding: (buildingId) => post({ type: 'BUY_BUILDING', buildingId }),
+    buyUpgrade: (upgradeId) => post({ type: 'BUY_UPGRADE', upgradeId }),
+    buyPrestigeUpgrade: (upgradeId) => post({ type: 'BUY_PRESTIGE_UPGRADE', upgradeId }),
+    performPrestige: () => post({ type: 'PRESTIGE' }),
+    setBuyAmount,
+    setLanguage,
+    setOfflineAutoBuy,
+    setOfflineAutoBuyPolicy,
+    addActiveEffect: (effectType, multiplier, durationMs) => post({
+      type: 'ADD_EFFECT', effectType, multiplier, durationMs,
+    }),
+    grantReward: (amount, eventKey) => post({ type: 'GRANT_REWARD', amount, eventKey }),
+    startRecording: ({ rng = null, build = '' } = {}) => post({ type: 'START_RECORDING', rng, build }),
+    stopRecording: () => post({ type: 'STOP_RECORDING' }),
+    recalculateDps,
+    getBuildingDiscount: () => getBuildingDiscountForState(mirror),
+    getAvailableUpgrades: () => Upgrades.getAvailable(mirror).sort((a, b) => a.cost - b.cost),
+    getInnovationPointsPreview: () => getInnovationPointsPreviewForProgression(mirror),
+    getPerfCounters,
+  };
+}
@@ -0,0 +1,43 @@
+// State fields that change on every tick without a revision bump, in snapshot order.
+// Everything else only changes with the revision and travels as a full state copy.
+const SNAPSHOT_FIELDS = [
+  ['dataPoints'],
+  ['dps'],
+  ['lastTickTime'],
+  ['stats', 'totalDataEarned'],
+  ['stats', 'totalDataAllTime'],
+  ['stats', 'totalClicks'],
+  ['stats', 'totalClicksAllTime'],
+  ['stats', 'playTimeSeconds'],
+  ['stats', 'highestDps'],
+];
+
+const CLICK_VALUE_INDEX = SNAPSHOT_FIELDS.length;
+export const SNAPSHOT_LENGTH = SNAPSHOT_FIELDS.length + 1;
+
+/**
+ * Pack the per-tick numbers and the current click value into a Float64Array whose
+ * buffer can be transferred to another thread.
+ */
+export function encodeSnapshot(state, clickValue, target = new Float64Array(SNAPSHOT_LENGTH)) {
+  SNAPSHOT_FIELDS.forEach(([key, nested], index) => {
+    const value = nested ? state[key]?.[nested] : state[key];
+    target[index] = Number(value) || 0;
+  });
+  target[CLICK_VALUE_INDEX] = clickValue;
+  return target;
+}
+
+/**
+ * Write a snapshot's numbers into `state` and return the click value it carried.
+ */
+export function applySnapshot(state, numbers) {
+  SNAPSHOT_FIELDS.forEach(([key, nested], index) => {
+    if (nested) {
+      if (state[key]) state[key][nested] = numbers[index];
+    } else {
+      state[key] = numbers[index];
+    }
+  });
+  return numbers[CLICK_VALUE_INDEX];
+}
@@ -0,0 +1,75 @@
+/* ==========================================================================
+   Summan Data Clicker - Simulation Worker
+   ========================================================================== */
+
+import { createSimulation } from './simulation.js';
+import { encodeSnapshot } from './simulation-snapshot.js';
+
+// Owns the game state off the main thread. Protocol (all messages are plain objects):
+//
+//   in:  { type: 'init', state, tickRateMs }
+//        { type: 'command', command, requestId? }   command as in Simulation.apply()
+//        { type: 'frame' }                          render-rate snapshot request
+//        { type: 'tick-rate', tickRateMs }
+//   out: { type: 'snapshot', revision, numbers, events, results, state?, counters? }
+//
+// `numbers` is a transferred Float64Array (see simulation-snapshot.js); `state` is only
+// included when the revision changed since the last snapshot.
+
+let pendingEvents = [];
+let pendingResults = [];
+let sentRevision = -1;
+
+const simulation = createSimulation({
+  onEvent: (event) => pendingEvents.push(event),
+});
+
+function postSnapshot() {
+  const state = simulation.getState();
+  if (!state) return;
+
+  const numbers = encodeSnapshot(state, simulation.calculateClickValue());
+  const revision = simulation.getRevision();
+  const message = {
+    type: 'snapshot',
+    revision,
+    numbers,
+    events: pendingEvents,
+    results: pendingResults,
+  };
+  if (revision !== sentRevision) {
+    message.state = state;
+    message.counters = simulation.getPerfCounters();
+    sentRevision = revision;
+  }
+
+  pendingEvents = [];
+  pendingResults = [];
+  self.postMessage(message, [numbers.buffer]);
+}
+
+self.addEventListener('message', ({ data }) => {
+  switch (data?.type) {
+    case 'init':
+      simulation.setTickRate(data.tickRateMs);
+      simulation.load(data.state);
+      simulation.start();
+      postSnapshot();
+      break;
+    case 'command': {
+      const value = simulation.apply(data.command);
+      if (data.requestId !== undefined) pendingResults.push({ requestId: data.requestId, value });
+      postSnapshot();
+      break;
+    }
+    case 'frame':
+      simulation.advance();
+      postSnapshot();
+      break;
+    case 'tick-rate':
+      simulation.setTickRate(data.tickRateMs);
+      break;
+    default:
+      break;
+  }
+});
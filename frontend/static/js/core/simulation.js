@@ -0,0 +1,507 @@
+import { createDefaultState } from '../infra/save-repository.js';
+
+import {
+  calculateClickValue as calculateClickValueForState,
+  getBuildingDiscount as getBuildingDiscountForState,
+} from './economy.js';
+import {
+  addActiveEffect as addEffectToState,
+  removeActiveEffect as removeEffectFromState,
+} from './effects-system.js';
+import {
+  buyBuilding as buyBuildingProgression,
+  buyUpgrade as buyUpgradeProgression,
+  buyPrestigeUpgrade as buyPrestigeUpgradeProgression,
+  performPrestige as performPrestigeProgression,
+  getInnovationPointsPreview as getInnovationPointsPreviewForProgression,
+} from './progression-system.js';
+import { createAchievementTracker } from './achievement-system.js';
+import { createDpsModel } from './dps-model.js';
+import { createFixedClock } from './fixed-clock.js';
+import { getPrestigeEffectsCounters, invalidatePrestigeEffects } from './prestige-effects.js';
+import { createCommandRecorder } from './command-log.js';
+import { OFFLINE_AUTO_BUY_POLICIES } from './offline-autobuyer.js';
+import { simulateOfflineProgress } from './offline-progress.js';
+import { grantEventReward } from './production.js';
+import { createScheduler } from './scheduler.js';
+import { createUpgradeUnlockTracker } from './upgrade-unlocks.js';
+
+// Longest backlog stepped tick by tick; anything older is credited in one catch-up.
+const MAX_STEPPED_MS = 5000;
+
+/**
+ * The game simulation: owns the state and applies ticks and player commands to it.
+ *
+ * It never touches the DOM, so it runs on the main thread or in
+ * core/simulation-worker.js. Anything the UI should react to is reported through
+ * `onEvent` as plain data:
+ *
+ * - `{ type: 'achievement', id }`
+ * - `{ type: 'render', panel }` with panel `buildings`, `upgrades`, `prestige` or `all`
+ * - `{ type: 'upgrade-affordability', affordable, unaffordable }` (upgrade ids)
+ * - `{ type: 'purchased', kind, id }` with kind `upgrade` or `prestige_upgrade`
+ * - `{ type: 'prestiged', pointsToGain }`
+ *
+ * The fixed-timestep clock is driven by start() (a timer) and advance(now), or by
+ * runSteps(count) for headless replays (core/replay.js).
+ *
+ * Game time (effect deadlines, lastTickTime) is simulated: set from `now()` on load
+ * and advanced only by steps and catch-ups, so the same commands at the same steps
+ * give the same run. startRecording() / stopRecording() capture every command with
+ * its step in a binary log (core/command-log.js).
+ */
+export function createSimulation({ onEvent = () => {}, tickRateMs = 33, now = () => Date.now() } = {}) {
+  let state = null;
+  let simulationInterval = null;
+  // Bumped on every change other than per-tick production; snapshots use it to
+  // decide when the full state has to be resent.
+  let revision = 0;
+
+  let simTime = now();
+  let stepCount = 0;
+  let recorder = null;
+  let recordingStartStep = 0;
+
+  const dpsModel = createDpsModel();
+  const achievementTracker = createAchievementTracker();
+  const upgradeTracker = createUpgradeUnlockTracker();
+  // One timer per active effect, keyed by the effect object, at its endTime.
+  const effectTimers = createScheduler();
+
+  // Click value depends on owned upgrades, prestige upgrades, active effects and DPS.
+  // Every change to those ends in recalculateDps() or refreshDps(), which bump the
+  // version; a new state object (prestige, import, reset) also misses the cache.
+  let clickValueVersion = 0;
+  const clickValueCache = { state: null, version: -1, value: 0 };
+
+  const clock = createFixedClock({
+    stepMs: tickRateMs,
+    maxSteppedMs: MAX_STEPPED_MS,
+    onStep: (stepSec) => step(stepSec),
+    onCatchUp: (elapsedSec) => catchUp(elapsedSec),
+  });
+
+  function emit(event) {
+    revision += 1;
+    onEvent(event);
+  }
+
+  function getState() {
+    return state;
+  }
+
+  function getRevision() {
+    return revision;
+  }
+
+  function record(command) {
+    recorder?.record(stepCount - recordingStartStep, command);
+  }
+
+  /**
+   * Replace the whole state (load, import, reset) at game time `at` and recompute
+   * everything.
+   */
+  function load(nextState, at = now()) {
+    record({ type: 'LOAD', state: nextState, at });
+    simTime = at;
+    replaceState(nextState);
+  }
+
+  function replaceState(nextState) {
+    state = nextState;
+    invalidatePrestigeEffects(state);
+    rebuildModels();
+  }
+
+  function start(now = performance.now()) {
+    clock.reset(now);
+    startTimer();
+  }
+
+  function stop() {
+    clearInterval(simulationInterval);
+    simulationInterval = null;
+  }
+
+  function startTimer() {
+    clearInterval(simulationInterval);
+    simulationInterval = setInterval(() => clock.advance(performance.now()), clock.getStepMs());
+  }
+
+  function advance(now = performance.now()) {
+    return state ? clock.advance(now) : 0;
+  }
+
+  function setTickRate(ms) {
+    record({ type: 'SET_TICK_RATE', ms });
+    const previous = clock.getStepMs();
+    clock.setStepMs(ms);
+    if (simulationInterval !== null && clock.getStepMs() !== previous) startTimer();
+  }
+
+  /**
+   * Run `count` fixed steps straight away, without the clock (replays).
+   */
+  function runSteps(count) {
+    const stepSec = clock.getStepMs() / 1000;
+    for (let i = 0; i < count; i += 1) step(stepSec);
+  }
+
+  function step(stepSec) {
+    stepCount += 1;
+    simTime += stepSec * 1000;
+    applyProductionTick(stepSec);
+    effectTimers.runDue(simTime);
+    unlockAchievements();
+    refreshUpgrades();
+
+    if (state.dps > state.stats.highestDps) {
+      state.stats.highestDps = state.dps;
+    }
+
+    state.lastTickTime = simTime;
+  }
+
+  function applyProductionTick(stepSec) {
+    state.stats.playTimeSeconds += stepSec;
+
+    const generatedData = state.dps * stepSec;
+    if (generatedData <= 0) return;
+
+    state.dataPoints += generatedData;
+    state.stats.totalDataEarned += generatedData;
+    state.stats.totalDataAllTime += generatedData;
+  }
+
+  /**
+   * Settle a long gap (throttled or suspended tab) at full rate through the
+   * offline-progress engine, then resume fixed steps.
+   */
+  function catchUp(elapsedSec) {
+    record({ type: 'CATCH_UP', elapsedSec });
+    simTime += elapsedSec * 1000;
+    const summary = simulateOfflineProgress(state, elapsedSec, { now: simTime });
+    for (const id of summary.achievements) emit({ type: 'achievement', id });
+    rebuildModels();
+  }
+
+  function unlockAchievements() {
+    const unlocked = achievementTracker.unlock(state, (achievement, id) => {
+      emit({ type: 'achievement', id });
+    });
+    if (unlocked.length > 0) {
+      dpsModel.markAchievementsChanged();
+      refreshDps();
+    }
+  }
+
+  /**
+   * Apply `count` clicks at the current click value and return the data they earned.
+   * A batch is checked for achievements and upgrade unlocks once, at its end.
+   */
+  function click(count = 1) {
+    const clicks = Math.max(0, Math.floor(count));
+    if (clicks === 0) return 0;
+    record({ type: 'CLICK', count: clicks });
+    const earned = calculateClickValue() * clicks;
+
+    state.dataPoints += earned;
+    state.stats.totalDataEarned += earned;
+    state.stats.totalDataAllTime += earned;
+    state.stats.totalClicks += clicks;
+    state.stats.totalClicksAllTime = (state.stats.totalClicksAllTime || 0) + clicks;
+
+    unlockAchievements();
+    refreshUpgrades();
+    return earned;
+  }
+
+  /**
+   * Report upgrade availability changes: a new list re-renders the upgrades bar, an
+   * affordability flip only toggles the affected tiles.
+   */
+  function refreshUpgrades() {
+    const delta = upgradeTracker.update(state);
+    if (!delta) return;
+
+    if (delta.availableChanged) {
+      emit({ type: 'render', panel: 'upgrades' });
+    } else {
+      // Per-tick data only; the state revision does not change.
+      onEvent({ type: 'upgrade-affordability', affordable: delta.affordable, unaffordable: delta.unaffordable });
+    }
+  }
+
+  function getAvailableUpgrades() {
+    return upgradeTracker.getAvailable(state);
+  }
+
+  function calculateClickValue() {
+    if (clickValueCache.state !== state || clickValueCache.version !== clickValueVersion) {
+      clickValueCache.state = state;
+      clickValueCache.version = clickValueVersion;
+      clickValueCache.value = calculateClickValueForState(state);
+    }
+    return clickValueCache.value;
+  }
+
+  function buyBuilding(buildingId) {
+    record({ type: 'BUY_BUILDING', buildingId });
+    return buyBuildingProgression(state, buildingId, {
+      getBuildingDiscount,
+      onRecalculateDps: () => {
+        dpsModel.markBuildingChanged(buildingId);
+        achievementTracker.markBuildingChanged(buildingId);
+        upgradeTracker.markBuildingChanged(buildingId);
+        refreshDps();
+      },
+      onRenderBuildings: () => emit({ type: 'render', panel: 'buildings' }),
+      onRenderUpgrades: () => refreshUpgrades(),
+    });
+  }
+
+  function buyUpgrade(upgradeId) {
+    record({ type: 'BUY_UPGRADE', upgradeId });
+    return buyUpgradeProgression(state, upgradeId, {
+      onRecalculateDps: () => {
+        dpsModel.markUpgradeAdded(upgradeId);
+        refreshDps();
+      },
+      onRenderUpgrades: () => {
+        upgradeTracker.markUpgradePurchased(upgradeId);
+        refreshUpgrades();
+      },
+      onShowToast: () => emit({ type: 'purchased', kind: 'upgrade', id: upgradeId }),
+    });
+  }
+
+  function buyPrestigeUpgrade(upgradeId) {
+    record({ type: 'BUY_PRESTIGE_UPGRADE', upgradeId });
+    return buyPrestigeUpgradeProgression(state, upgradeId, {
+      onRecalculateDps: () => {
+        dpsModel.markPrestigeChanged();
+        refreshDps();
+      },
+      onRenderPrestige: () => emit({ type: 'render', panel: 'prestige' }),
+      onShowToast: () => emit({ type: 'purchased', kind: 'prestige_upgrade', id: upgradeId }),
+    });
+  }
+
+  function performPrestige() {
+    record({ type: 'PRESTIGE' });
+    const result = performPrestigeProgression(state, { createDefaultState });
+    if (!result.ok) return false;
+
+    replaceState(result.state);
+    emit({ type: 'prestiged', pointsToGain: result.pointsToGain });
+    return true;
+  }
+
+  function setBuyAmount(amount) {
+    record({ type: 'SET_BUY_AMOUNT', amount });
+    state.settings.buyAmount = amount;
+    emit({ type: 'render', panel: 'buildings' });
+  }
+
+  function setLanguage(language) {
+    record({ type: 'SET_LANGUAGE', language });
+    state.settings.language = language;
+    revision += 1;
+  }
+
+  function setOfflineAutoBuy(enabled) {
+    record({ type: 'SET_OFFLINE_AUTO_BUY', enabled });
+    state.settings.offlineAutoBuy = enabled;
+    revision += 1;
+  }
+
+  function setOfflineAutoBuyPolicy(policy) {
+    if (!OFFLINE_AUTO_BUY_POLICIES.includes(policy)) return false;
+    record({ type: 'SET_OFFLINE_AUTO_BUY_POLICY', policy });
+    state.settings.offlineAutoBuyPolicy = policy;
+    revision += 1;
+    return true;
+  }
+
+  function addActiveEffect(type, multiplier, durationMs) {
+    record({ type: 'ADD_EFFECT', effectType: type, multiplier, durationMs });
+    const effect = addEffectToState(state, type, multiplier, durationMs, onActiveEffectsChanged, simTime);
+    if (effect) scheduleEffectExpiry(effect);
+  }
+
+  function scheduleEffectExpiry(effect) {
+    effectTimers.schedule(effect, effect.endTime, () => {
+      removeEffectFromState(state, effect, onActiveEffectsChanged);
+    });
+  }
+
+  /**
+   * Rebuild the expiry timers from state.activeEffects (new or externally edited state).
+   */
+  function syncEffectTimers() {
+    effectTimers.clear();
+    for (const effect of state.activeEffects) scheduleEffectExpiry(effect);
+  }
+
+  function grantReward(amount, eventKey) {
+    record({ type: 'GRANT_REWARD', amount, eventKey });
+    grantEventReward(state, amount, eventKey);
+    if (eventKey) achievementTracker.markEventChanged(eventKey);
+    revision += 1;
+  }
+
+  /**
+   * Full recomputation, for when the state changed in ways the model was not told
+   * about (test API setState). A recording logs the edited state as a LOAD.
+   */
+  function recalculateDps() {
+    record({ type: 'LOAD', state, at: simTime });
+    rebuildModels();
+  }
+
+  function rebuildModels() {
+    syncEffectTimers();
+    dpsModel.invalidate();
+    achievementTracker.invalidate();
+    upgradeTracker.invalidate();
+    dpsModel.recalculate(state);
+    clickValueVersion += 1;
+    revision += 1;
+  }
+
+  /**
+   * Recompute only the DPS terms marked dirty on the model.
+   */
+  function refreshDps() {
+    dpsModel.recalculate(state);
+    clickValueVersion += 1;
+    revision += 1;
+  }
+
+  function onActiveEffectsChanged() {
+    dpsModel.markEffectsChanged();
+    refreshDps();
+  }
+
+  function getBuildingDiscount() {
+    return getBuildingDiscountForState(state);
+  }
+
+  function getInnovationPointsPreview() {
+    return getInnovationPointsPreviewForProgression(state);
+  }
+
+  /**
+   * Start logging commands from the current state; `rng` (infra/rng.js state) and
+   * `build` are stored in the header for reproducing the run.
+   */
+  function startRecording({ rng = null, build = '' } = {}) {
+    recordingStartStep = stepCount;
+    recorder = createCommandRecorder({ state, simTime, stepMs: clock.getStepMs(), rng, build });
+    return true;
+  }
+
+  /**
+   * Stop logging and return the log bytes, or null when not recording.
+   */
+  function stopRecording() {
+    if (!recorder) return null;
+    const bytes = recorder.finish(stepCount - recordingStartStep);
+    recorder = null;
+    return bytes;
+  }
+
+  function getPerfCounters() {
+    return {
+      dps: dpsModel.getCounters(),
+      achievements: achievementTracker.getCounters(),
+      upgrades: upgradeTracker.getCounters(),
+      prestigeEffects: getPrestigeEffectsCounters(),
+      effectTimers: effectTimers.getCounters(),
+      recording: recorder ? recorder.getCounters() : null,
+      clock: { stepMs: clock.getStepMs(), steps: stepCount },
+    };
+  }
+
+  /**
+   * Apply a serialized command (the worker protocol) and return its result.
+   */
+  function apply(command) {
+    switch (command?.type) {
+      case 'CLICK':
+        return click(command.count ?? 1);
+      case 'BUY_BUILDING':
+        return buyBuilding(command.buildingId);
+      case 'BUY_UPGRADE':
+        return buyUpgrade(command.upgradeId);
+      case 'BUY_PRESTIGE_UPGRADE':
+        return buyPrestigeUpgrade(command.upgradeId);
+      case 'PRESTIGE':
+        return performPrestige();
+      case 'SET_BUY_AMOUNT':
+        setBuyAmount(command.amount);
+        return true;
+      case 'SET_LANGUAGE':
+        setLanguage(command.language);
+        return true;
+      case 'SET_OFFLINE_AUTO_BUY':
+        setOfflineAutoBuy(command.enabled);
+        return true;
+      case 'SET_OFFLINE_AUTO_BUY_POLICY':
+        return setOfflineAutoBuyPolicy(command.policy);
+      case 'ADD_EFFECT':
+        addActiveEffect(command.effectType, command.multiplier, command.durationMs);
+        return true;
+      case 'GRANT_REWARD':
+        grantReward(command.amount, command.eventKey);
+        return true;
+      case 'LOAD':
+        load(command.state, command.at);
+        return true;
+      case 'CATCH_UP':
+        catchUp(command.elapsedSec);
+        return true;
+      case 'SET_TICK_RATE':
+        setTickRate(command.ms);
+        return true;
+      case 'START_RECORDING':
+        return startRecording(command);
+      case 'STOP_RECORDING':
+        return stopRecording();
+      default:
+        return false;
+    }
+  }
+
+  return {
+    getState,
+    getRevision,
+    load,
+    start,
+    stop,
+    advance,
+    runSteps,
+    setTickRate,
+    click,
+    calculateClickValue,
+    buyBuilding,
+    buyUpgrade,
+    buyPrestigeUpgrade,
+    performPrestige,
+    setBuyAmount,
+    setLanguage,
+    setOfflineAutoBuy,
+    setOfflineAutoBuyPolicy,
+    addActiveEffect,
+    grantReward,
+    recalculateDps,
+    getBuildingDiscount,
+    getAvailableUpgrades,
+    getInnovationPointsPreview,
+    getPerfCounters,
+    startRecording,
+    stopRecording,
+    apply,
+  };
+}
@@ -0,0 +1,253 @@
+import * as Upgrades from '../content/upgrades.js';
+
+// Every upgrade, cheapest first (definition order on ties, like the upgrades bar).
+const BY_COST = [...Upgrades.getAll()].sort((a, b) => a.cost - b.cost);
+
+// Requirements as monotonic conditions: each one is a threshold on a stat (sorted
+// per stat) or an edge from a prerequisite upgrade. An upgrade unlocks once all of
+// its conditions have been met; it stays unlocked for the rest of the run.
+const CONDITIONS = (() => {
+  const thresholds = new Map(); // stat key -> [{ value, upgradeId }] sorted by value
+  const dependents = new Map(); // prerequisite upgrade id -> dependent upgrade ids
+  const conditionCounts = new Map(); // upgrade id -> number of conditions
+
+  function addThreshold(key, value, upgradeId) {
+    if (!thresholds.has(key)) thresholds.set(key, []);
+    thresholds.get(key).push({ value, upgradeId });
+  }
+
+  for (const upgrade of Upgrades.getAll()) {
+    const req = upgrade.requirement;
+    let count = 0;
+    switch (req?.type) {
+      case undefined:
+        break;
+      case 'building_count':
+        addThreshold(`building:${req.target}`, req.value, upgrade.id);
+        count = 1;
+        if (req.target2) {
+          addThreshold(`building:${req.target2}`, req.value2, upgrade.id);
+          count = 2;
+        }
+        break;
+      case 'total_data':
+        addThreshold('total_data', req.value, upgrade.id);
+        count = 1;
+        break;
+      case 'click_count':
+        addThreshold('click_count', req.value, upgrade.id);
+        count = 1;
+        break;
+      case 'upgrade':
+        if (!dependents.has(req.target)) dependents.set(req.target, []);
+        dependents.get(req.target).push(upgrade.id);
+        count = 1;
+        break;
+      default:
+        // Unknown requirement types never unlock (Upgrades.isUnlocked returns false).
+        count = Infinity;
+        break;
+    }
+    conditionCounts.set(upgrade.id, count);
+  }
+
+  for (const entries of thresholds.values()) entries.sort((a, b) => a.value - b.value);
+  return { thresholds, dependents, conditionCounts };
+})();
+
+const SCALAR_STATS = ['total_data', 'click_count'];
+
+/**
+ * Incremental upgrade availability for one game state.
+ *
+ * Keeps a cursor per requirement stat over its sorted thresholds and a count of unmet
+ * conditions per upgrade, so an update compares one threshold per stat unless
+ * something unlocks. Building stats are only read after markBuildingChanged();
+ * purchases are reported with markUpgradePurchased(). update() returns the delta
+ * since the last call, or null when nothing changed:
+ *
+ * - `availableChanged`: the available list (getAvailable()) gained or lost upgrades
+ * - `unlocked`: upgrades whose requirement became met
+ * - `affordable` / `unaffordable`: available upgrades whose affordability flipped
+ *
+ * A different state object, or invalidate(), rebuilds everything and reports the
+ * available list as changed.
+ */
+export function createUpgradeUnlockTracker() {
+  let boundState = null;
+  const cursors = new Map();
+  const remaining = new Map();
+  let owned = new Set();
+  let available = [];
+  let affordableIds = new Set();
+  let affordableCount = 0;
+
+  let needsRebuild = true;
+  const dirtyStats = new Set();
+  const pendingPurchases = [];
+  let availableDirty = false;
+
+  const counters = { rebuilds: 0, updates: 0, thresholdsTested: 0, availableChanges: 0 };
+
+  function invalidate() {
+    needsRebuild = true;
+  }
+
+  function markBuildingChanged(buildingId) {
+    dirtyStats.add(`building:${buildingId}`);
+  }
+
+  function markUpgradePurchased(upgradeId) {
+    pendingPurchases.push(upgradeId);
+  }
+
+  function readStat(state, key) {
+    if (key === 'total_data') return state.stats.totalDataEarned;
+    if (key === 'click_count') return state.stats.totalClicks;
+    return state.buildings[key.slice('building:'.length)] || 0;
+  }
+
+  function meetCondition(upgradeId, unlocked) {
+    const left = remaining.get(upgradeId) - 1;
+    remaining.set(upgradeId, left);
+    if (left === 0) unlocked.push(upgradeId);
+  }
+
+  function addOwned(upgradeId, unlocked) {
+    if (owned.has(upgradeId)) return;
+    owned.add(upgradeId);
+    availableDirty = true;
+    for (const dependentId of CONDITIONS.dependents.get(upgradeId) || []) {
+      meetCondition(dependentId, unlocked);
+    }
+  }
+
+  function advanceStat(state, key, unlocked) {
+    const entries = CONDITIONS.thresholds.get(key);
+    if (!entries) return;
+
+    const value = readStat(state, key);
+    let cursor = cursors.get(key) || 0;
+    while (cursor < entries.length) {
+      counters.thresholdsTested += 1;
+      if (!(value >= entries[cursor].value)) break;
+      meetCondition(entries[cursor].upgradeId, unlocked);
+      cursor += 1;
+    }
+    cursors.set(key, cursor);
+  }
+
+  function rebuild(state, unlocked) {
+    boundState = state;
+    owned = new Set();
+    cursors.clear();
+    remaining.clear();
+    pendingPurchases.length = 0;
+    for (const [upgradeId, count] of CONDITIONS.conditionCounts) {
+      remaining.set(upgradeId, count);
+      if (count === 0) unlocked.push(upgradeId);
+    }
+
+    dirtyStats.clear();
+    for (const key of CONDITIONS.thresholds.keys()) dirtyStats.add(key);
+    for (const upgradeId of state.upgrades) addOwned(upgradeId, unlocked);
+
+    available = [];
+    affordableIds = new Set();
+    affordableCount = 0;
+    availableDirty = true;
+    needsRebuild = false;
+    counters.rebuilds += 1;
+  }
+
+  function isAvailable(upgrade) {
+    return remaining.get(upgrade.id) === 0 && !owned.has(upgrade.id);
+  }
+
+  /**
+   * Bring the tracker up to date with `state` and return what changed, or null.
+   */
+  function update(state) {
+    if (!state) return null;
+
+    const unlocked = [];
+    if (needsRebuild || state !== boundState) rebuild(state, unlocked);
+
+    for (const upgradeId of pendingPurchases) addOwned(upgradeId, unlocked);
+    pendingPurchases.length = 0;
+
+    for (const key of SCALAR_STATS) advanceStat(state, key, unlocked);
+    for (const key of dirtyStats) {
+      if (!SCALAR_STATS.includes(key)) advanceStat(state, key, unlocked);
+    }
+    dirtyStats.clear();
+    counters.updates += 1;
+
+    const availableChanged = availableDirty || unlocked.some((id) => !owned.has(id));
+    availableDirty = false;
+    if (availableChanged) {
+      available = BY_COST.filter(isAvailable);
+      counters.availableChanges += 1;
+    }
+
+    const affordable = [];
+    const unaffordable = [];
+    if (availableChanged) {
+      // The list changed: diff the whole affordable prefix against the last one.
+      const nextIds = new Set();
+      affordableCount = 0;
+      while (affordableCount < available.length && state.dataPoints >= available[affordableCount].cost) {
+        nextIds.add(available[affordableCount].id);
+        affordableCount += 1;
+      }
+      for (const upgradeId of nextIds) if (!affordableIds.has(upgradeId)) affordable.push(upgradeId);
+      for (const upgradeId of affordableIds) {
+        if (!nextIds.has(upgradeId) && !owned.has(upgradeId)) unaffordable.push(upgradeId);
+      }
+      affordableIds = nextIds;
+    } else {
+      // Cheapest first, so the affordable upgrades are a prefix; only its boundary moves.
+      while (affordableCount < available.length && state.dataPoints >= available[affordableCount].cost) {
+        affordableIds.add(available[affordableCount].id);
+        affordable.push(available[affordableCount].id);
+        affordableCount += 1;
+      }
+      while (affordableCount > 0 && !(state.dataPoints >= available[affordableCount - 1].cost)) {
+        affordableCount -= 1;
+        affordableIds.delete(available[affordableCount].id);
+        unaffordable.push(available[affordableCount].id);
+      }
+    }
+
+    if (!availableChanged && affordable.length === 0 && unaffordable.length === 0) return null;
+    return {
+      availableChanged,
+      unlocked: unlocked.filter((upgradeId) => !owned.has(upgradeId)),
+      affordable,
+      unaffordable,
+    };
+  }
+
+  /**
+   * Unlocked, unowned upgrades, cheapest first (same as Upgrades.getAvailable sorted by
+   * cost). Shared array: do not mutate. A replaced state is rebuilt here without
+   * reporting a delta; loads are followed by a full render anyway.
+   */
+  function getAvailable(state) {
+    if (needsRebuild || state !== boundState || pendingPurchases.length > 0) update(state);
+    return available;
+  }
+
+  function getCounters() {
+    return { ...counters };
+  }
+
+  return {
+    invalidate,
+    markBuildingChanged,
+    markUpgradePurchased,
+    update,
+    getAvailable,
+    getCounters,
+  };
+}
@@ -0,0 +1,35 @@
+import { createLogger } from './logger.js';
+
+const log = createLogger('game-config');
+
+const CONFIG_ENDPOINT = '/api/config';
+
+// Used until /api/config answers, and if it never does.
+export const DEFAULT_GAME_CONFIG = Object.freeze({
+  tick_rate_ms: 33,
+  // 0 renders on every animation frame; higher values cap the render rate.
+  render_interval_ms: 0,
+  autosave_interval_seconds: 30,
+});
+
+let pending = null;
+
+/**
+ * Fetch the server's game configuration once; later calls share the same promise.
+ * Never rejects: on failure it resolves to DEFAULT_GAME_CONFIG.
+ */
+export function loadGameConfig() {
+  if (!pending) {
+    pending = fetch(CONFIG_ENDPOINT)
+      .then((response) => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+      })
+      .then((config) => ({ ...DEFAULT_GAME_CONFIG, ...config }))
+      .catch((error) => {
+        log.warn('Using default game config:', error);
+        return { ...DEFAULT_GAME_CONFIG };
+      });
+  }
+  return pending;
+}
@@ -88,29 +88,148 @@ const Utils = (() => {
         return Math.ceil(baseCost * Math.pow(growthRate, owned));
     }
 
+    /**
+     * Prefix sums of per-unit building costs, one table per (baseCost, growthRate).
+     *
+     * prefix[k] is the exact total of units 0..k-1, each rounded up like
+     * calculateBuildingCost. Tables stop before the running total passes
+     * Number.MAX_SAFE_INTEGER, so every lookup inside them matches a unit-by-unit
+     * sum exactly. Past the end a purchase whose total is still a safe integer is
+     * summed unit by unit (those units are large, so there are few of them); beyond
+     * that the rounding is below double precision and the geometric-series closed
+     * form is used. COST_TABLE_MAX_UNITS only matters for growth rates barely above 1.
+     */
+    const COST_TABLE_MAX_UNITS = 10000;
+    const MAX_COST_TABLES = 64;
+    const costTables = new Map();
+
+    function getCostTable(baseCost, growthRate) {
+        const key = `${baseCost}:${growthRate}`;
+        let table = costTables.get(key);
+        if (table) return table;
+
+        const prefix = [0];
+        let total = 0;
+        for (let i = 0; i < COST_TABLE_MAX_UNITS; i++) {
+            const next = total + calculateBuildingCost(baseCost, i, growthRate);
+            if (!(next <= Number.MAX_SAFE_INTEGER)) break;
+            total = next;
+            prefix.push(total);
+        }
+
+        if (costTables.size >= MAX_COST_TABLES) costTables.clear();
+        table = { prefix, size: prefix.length - 1 };
+        costTables.set(key, table);
+        return table;
+    }
+
+    /**
+     * Unrounded cost of `count` units starting at unit `owned`:
+     * baseCost * g^owned * (g^count - 1) / (g - 1), via expm1 so huge counts
+     * overflow to Infinity instead of NaN.
+     */
+    function geometricCost(baseCost, owned, count, growthRate) {
+        if (count <= 0) return 0;
+        const first = baseCost * Math.pow(growthRate, owned);
+        if (growthRate === 1) return first * count;
+        return first * Math.expm1(count * Math.log(growthRate)) / (growthRate - 1);
+    }
+
+    /**
+     * Exact unit-by-unit total of units `from`.. added to `total`, stopping before
+     * `budget`, Number.MAX_SAFE_INTEGER or `limit` units. Returns [units, total].
+     */
+    function correctionPass(baseCost, from, total, limit, budget, growthRate) {
+        let units = 0;
+        while (units < Math.min(limit, COST_TABLE_MAX_UNITS)) {
+            const next = total + calculateBuildingCost(baseCost, from + units, growthRate);
+            if (next > budget || next > Number.MAX_SAFE_INTEGER) break;
+            total = next;
+            units++;
+        }
+        return [units, total];
+    }
+
     /**
      * Calculate cost for buying N buildings at once.
+     * Matches summing calculateBuildingCost unit by unit, and rounds exactly as
+     * maxAffordable does so a Max purchase costs what maxAffordable reported.
      */
     function calculateBulkCost(baseCost, owned, count, growthRate = 1.15) {
+        if (count <= 0) return 0;
+
+        const table = getCostTable(baseCost, growthRate);
+        let done = 0;
         let total = 0;
-        for (let i = 0; i < count; i++) {
-            total += calculateBuildingCost(baseCost, owned + i, growthRate);
+        if (owned < table.size) {
+            done = Math.min(count, table.size - owned);
+            total = table.prefix[owned + done] - table.prefix[owned];
+            if (done === count) return total;
         }
-        return total;
+
+        const [units, exact] = correctionPass(baseCost, owned + done, total, count - done, Infinity, growthRate);
+        done += units;
+        return exact + geometricCost(baseCost, owned + done, count - done, growthRate);
+    }
+
+    /**
+     * Largest n with geometricCost(baseCost, owned, n) <= budget: the log inverse of
+     * the closed form, nudged by one either way for floating-point error.
+     */
+    function geometricAffordable(baseCost, owned, budget, growthRate) {
+        const first = baseCost * Math.pow(growthRate, owned);
+        if (!(budget >= first)) return 0;
+
+        let count = growthRate === 1
+            ? Math.floor(budget / first)
+            : Math.floor(Math.log1p(budget * (growthRate - 1) / first) / Math.log(growthRate));
+        if (!Number.isFinite(count)) return 0;
+        while (count > 0 && geometricCost(baseCost, owned, count, growthRate) > budget) count--;
+        while (geometricCost(baseCost, owned, count + 1, growthRate) <= budget) count++;
+        return count;
     }
 
     /**
      * Calculate max affordable count of a building.
+     *
+     * Binary search over the exact cost table, then the closed form for whatever the
+     * budget covers past the table's end.
      */
     function maxAffordable(baseCost, owned, budget, growthRate = 1.15) {
+        const table = getCostTable(baseCost, growthRate);
         let count = 0;
         let totalCost = 0;
-        while (true) {
-            const nextCost = calculateBuildingCost(baseCost, owned + count, growthRate);
-            if (totalCost + nextCost > budget) break;
-            totalCost += nextCost;
-            count++;
-            if (count > 10000) break; // Safety cap
+
+        if (owned < table.size) {
+            const { prefix } = table;
+            const start = prefix[owned];
+            let lo = owned;
+            let hi = table.size;
+            while (lo < hi) {
+                const mid = (lo + hi + 1) >> 1;
+                if (prefix[mid] - start <= budget) lo = mid;
+                else hi = mid - 1;
+            }
+            count = lo - owned;
+            totalCost = prefix[lo] - start;
+            if (lo < table.size) return { count, totalCost };
+        }
+
+        const [units, exact] = correctionPass(baseCost, owned + count, totalCost, Infinity, budget, growthRate);
+        count += units;
+        totalCost = exact;
+
+        const from = owned + count;
+        // The pass stopped on the budget rather than on precision: nothing more fits.
+        if (units < COST_TABLE_MAX_UNITS
+            && totalCost + calculateBuildingCost(baseCost, from, growthRate) <= Number.MAX_SAFE_INTEGER) {
+            return { count, totalCost };
+        }
+
+        const extra = geometricAffordable(baseCost, from, budget - totalCost, growthRate);
+        if (extra > 0) {
+            count += extra;
+            totalCost += geometricCost(baseCost, from, extra, growthRate);
         }
         return { count, totalCost };
     }
@@ -212,7 +331,7 @@ const Utils = (() => {
     };
 })();
 
-window.Utils = Utils;
+if (typeof window !== 'undefined') window.Utils = Utils;
 
 export const formatNumber = Utils.formatNumber;
 export const formatDps = Utils.formatDps;
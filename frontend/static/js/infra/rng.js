@@ -0,0 +1,162 @@
+/**
+ * Seeded random number streams (xoshiro128**, 128-bit state, 32-bit outputs).
+ *
+ * Each consumer draws from its own named stream, so an extra draw in one place (a
+ * new click sound, a UI position) does not shift the sequence another consumer sees.
+ * Every stream is derived from one run seed and the stream name; getRngState() /
+ * restoreRng() carry the seed and each stream's position through the save.
+ */
+
+// Streams in use, by consumer.
+export const RNG_STREAMS = Object.freeze({
+  GOLDEN_TIMING: 'goldenTiming',
+  GOLDEN_REWARD: 'goldenReward',
+  RANDOM_EVENT_TIMING: 'randomEventTiming',
+  RANDOM_EVENT: 'randomEvent',
+  UI: 'ui',
+  CLICK_SFX: 'clickSfx',
+});
+
+function rotl(value, shift) {
+  return (value << shift) | (value >>> (32 - shift));
+}
+
+// FNV-1a, to turn a stream name into a 32-bit salt.
+function hashName(name) {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < name.length; i += 1) {
+    hash ^= name.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+}
+
+// splitmix32, to expand a 32-bit seed into well-mixed state words.
+function splitmix32(seed) {
+  let x = seed >>> 0;
+  return () => {
+    x = (x + 0x9e3779b9) >>> 0;
+    let z = x;
+    z = Math.imul(z ^ (z >>> 16), 0x85ebca6b);
+    z = Math.imul(z ^ (z >>> 13), 0xc2b2ae35);
+    return (z ^ (z >>> 16)) >>> 0;
+  };
+}
+
+function seedWords(seed, name) {
+  const next = splitmix32((seed ^ hashName(name)) >>> 0);
+  const words = [next(), next(), next(), next()];
+  // The all-zero state is the one xoshiro cannot leave.
+  if ((words[0] | words[1] | words[2] | words[3]) === 0) words[0] = 1;
+  return words;
+}
+
+function isValidWords(words) {
+  return Array.isArray(words) && words.length === 4
+    && words.every((word) => Number.isInteger(word) && word >= 0 && word <= 0xffffffff)
+    && words.some((word) => word !== 0);
+}
+
+/**
+ * One xoshiro128** generator over the four 32-bit words `words`.
+ */
+export function createRngStream(words) {
+  let s0 = words[0] | 0;
+  let s1 = words[1] | 0;
+  let s2 = words[2] | 0;
+  let s3 = words[3] | 0;
+
+  function nextUint32() {
+    const result = Math.imul(rotl(Math.imul(s1, 5), 7), 9);
+    const t = s1 << 9;
+    s2 ^= s0;
+    s3 ^= s1;
+    s1 ^= s2;
+    s0 ^= s3;
+    s2 ^= t;
+    s3 = rotl(s3, 11);
+    return result >>> 0;
+  }
+
+  /** Uniform float in [0, 1). */
+  function next() {
+    return nextUint32() / 4294967296;
+  }
+
+  /** Uniform float in [min, max), like Utils.randomRange. */
+  function range(min, max) {
+    return next() * (max - min) + min;
+  }
+
+  /** Uniform integer in [min, max], like Utils.randomInt. */
+  function int(min, max) {
+    return Math.floor(next() * (max - min + 1)) + min;
+  }
+
+  function getState() {
+    return [s0 >>> 0, s1 >>> 0, s2 >>> 0, s3 >>> 0];
+  }
+
+  return { nextUint32, next, range, int, getState };
+}
+
+let runSeed = 0;
+const streams = new Map();
+
+/**
+ * A fresh 32-bit seed from the platform's entropy source.
+ */
+export function randomSeed() {
+  if (globalThis.crypto?.getRandomValues) {
+    return globalThis.crypto.getRandomValues(new Uint32Array(1))[0];
+  }
+  return Math.floor(Math.random() * 4294967296) >>> 0;
+}
+
+/**
+ * Restart every stream from `seed`.
+ */
+export function seedRng(seed = randomSeed()) {
+  runSeed = seed >>> 0;
+  streams.clear();
+}
+
+/**
+ * The named stream, created at its seeded start on first use.
+ */
+export function getRngStream(name) {
+  let stream = streams.get(name);
+  if (!stream) {
+    stream = createRngStream(seedWords(runSeed, name));
+    streams.set(name, stream);
+  }
+  return stream;
+}
+
+/**
+ * `{ seed, streams: { name: [4 words] } }` for the save. Streams never drawn from
+ * are left out; they restart from the seed.
+ */
+export function getRngState() {
+  const saved = {};
+  for (const [name, stream] of streams) saved[name] = stream.getState();
+  return { seed: runSeed, streams: saved };
+}
+
+/**
+ * Continue from a getRngState() snapshot; anything missing or malformed is reseeded
+ * (the whole run when there is no usable seed).
+ */
+export function restoreRng(saved) {
+  if (!saved || !Number.isInteger(saved.seed)) {
+    seedRng();
+    return;
+  }
+
+  seedRng(saved.seed);
+  for (const [name, words] of Object.entries(saved.streams || {})) {
+    if (isValidWords(words)) streams.set(name, createRngStream(words));
+  }
+}
+
+seedRng();
@@ -0,0 +1,83 @@
+/* ==========================================================================
+   Summan Data Clicker - Save Delta Encoding (JSON Merge Patch, RFC 7386)
+   ========================================================================== */
+
+const SaveDelta = (() => {
+  function isPlainObject(value) {
+    return value !== null && typeof value === 'object' && !Array.isArray(value);
+  }
+
+  function arraysEqual(a, b) {
+    if (a.length !== b.length) return false;
+    for (let i = 0; i < a.length; i += 1) {
+      if (!valuesEqual(a[i], b[i])) return false;
+    }
+    return true;
+  }
+
+  function valuesEqual(a, b) {
+    if (a === b) return true;
+    if (Array.isArray(a) && Array.isArray(b)) return arraysEqual(a, b);
+    if (isPlainObject(a) && isPlainObject(b)) return createMergePatch(a, b) === null;
+    return false;
+  }
+
+  /**
+   * Build a merge patch that turns `base` into `next`, or null when they are equal.
+   * Nested objects are diffed key by key; arrays are replaced as a whole.
+   */
+  function createMergePatch(base, next) {
+    let patch = null;
+
+    for (const key of Object.keys(next)) {
+      const nextValue = next[key];
+      if (nextValue === undefined) continue;
+      const baseValue = base[key];
+
+      let change;
+      if (isPlainObject(nextValue) && isPlainObject(baseValue)) {
+        change = createMergePatch(baseValue, nextValue);
+        if (change === null) continue;
+      } else if (valuesEqual(baseValue, nextValue)) {
+        continue;
+      } else {
+        change = nextValue;
+      }
+
+      patch = patch || {};
+      patch[key] = change;
+    }
+
+    for (const key of Object.keys(base)) {
+      if (base[key] !== undefined && next[key] === undefined) {
+        patch = patch || {};
+        patch[key] = null;
+      }
+    }
+
+    return patch;
+  }
+
+  /**
+   * Apply a merge patch without mutating `target` (untouched branches are shared).
+   */
+  function applyMergePatch(target, patch) {
+    if (!isPlainObject(patch)) return patch;
+
+    const result = isPlainObject(target) ? { ...target } : {};
+    for (const [key, value] of Object.entries(patch)) {
+      if (value === null) {
+        delete result[key];
+      } else {
+        result[key] = applyMergePatch(result[key], value);
+      }
+    }
+    return result;
+  }
+
+  return { createMergePatch, applyMergePatch };
+})();
+
+export const createMergePatch = SaveDelta.createMergePatch;
+export const applyMergePatch = SaveDelta.applyMergePatch;
+export default SaveDelta;
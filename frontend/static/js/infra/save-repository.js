@@ -46,9 +46,15 @@ const SaveSystem = (() => {
             settings: {
                 language: 'es',
                 buyAmount: 1,     // 1, 10, 100, -1 (max)
+                offlineAutoBuy: false, // spend offline earnings (core/offline-autobuyer.js)
+                offlineAutoBuyPolicy: 'payback', // 'payback' or 'cheapest'
             },
             // Active effects
             activeEffects: [],   // { type, multiplier, endTime }
+            // Scheduled event deadlines (epoch ms) by timer name, see core/game-loop.js
+            timers: {},
+            // Random stream positions (infra/rng.js); null starts a new seed
+            rng: null,
             // DPS cache
             dps: 0,
         };
@@ -103,6 +109,7 @@ const SaveSystem = (() => {
         state.settings = { ...defaults.settings, ...state.settings };
 
         if (!state.activeEffects) state.activeEffects = [];
+        if (!state.timers) state.timers = {};
         if (!state.prestigeUpgrades) state.prestigeUpgrades = [];
         if (!state.buildingMultipliers) state.buildingMultipliers = {};
         if (state.innovationPoints === undefined) state.innovationPoints = 0;
@@ -158,18 +165,20 @@ const SaveSystem = (() => {
         load,
         exportSave,
         importSave,
+        migrate,
         deleteSave,
         hasSave,
     };
 })();
 
-window.SaveSystem = SaveSystem;
+if (typeof window !== 'undefined') window.SaveSystem = SaveSystem;
 
 export const createDefaultState = SaveSystem.createDefaultState;
 export const save = SaveSystem.save;
 export const load = SaveSystem.load;
 export const exportSave = SaveSystem.exportSave;
 export const importSave = SaveSystem.importSave;
+export const migrate = SaveSystem.migrate;
 export const deleteSave = SaveSystem.deleteSave;
 export const hasSave = SaveSystem.hasSave;
 export default SaveSystem;
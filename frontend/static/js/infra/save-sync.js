@@ -0,0 +1,222 @@
+/* ==========================================================================
+   Summan Data Clicker - Server Save Sync
+   ========================================================================== */
+
+import { createLogger } from './logger.js';
+import { applyMergePatch, createMergePatch } from './save-delta.js';
+
+const log = createLogger('save-sync');
+
+const SaveSync = (() => {
+  const PLAYER_ID_KEY = 'summan_player_id';
+  const SAVES_ENDPOINT = '/api/saves';
+  // Send a full snapshot after this many consecutive delta uploads.
+  const FULL_SNAPSHOT_EVERY = 20;
+
+  let acknowledgedVersion = null;
+  // What the server holds at `acknowledgedVersion`, rebuilt from the JSON we sent.
+  let acknowledgedState = null;
+  let deltasSinceSnapshot = 0;
+  let inFlight = null;
+  // `{ version, state }` of a server save that is further along than this game; no
+  // uploads happen until resolveConflict() picks a side. The handler is told once the
+  // upload that found it has finished.
+  let conflict = null;
+  let conflictReported = false;
+  let onConflict = () => {};
+
+  function createPlayerId() {
+    // getRandomValues (unlike randomUUID) also works on plain-http LAN hosts.
+    const bytes = crypto.getRandomValues(new Uint8Array(16));
+    return Array.from(bytes, (byte) => byte.toString(16).padStart(2, '0')).join('');
+  }
+
+  /**
+   * Stable anonymous id for this browser, created on first use.
+   */
+  function getPlayerId() {
+    let playerId = localStorage.getItem(PLAYER_ID_KEY);
+    if (!playerId) {
+      playerId = createPlayerId();
+      localStorage.setItem(PLAYER_ID_KEY, playerId);
+    }
+    return playerId;
+  }
+
+  function versionFromEtag(etag) {
+    const version = parseInt(String(etag || '').replace(/^W\//, '').replace(/"/g, ''), 10);
+    return Number.isFinite(version) ? version : null;
+  }
+
+  function getSaveUrl() {
+    return `${SAVES_ENDPOINT}/${getPlayerId()}`;
+  }
+
+  async function upload(body, version) {
+    const headers = { 'Content-Type': 'application/json' };
+    if (version !== null) headers['If-Match'] = `"${version}"`;
+
+    return fetch(getSaveUrl(), { method: 'PUT', headers, body });
+  }
+
+  /**
+   * The server's save as `{ version, state }`, or null when there is none.
+   */
+  async function fetchRemote() {
+    const response = await fetch(getSaveUrl(), { cache: 'no-cache' });
+    if (response.status === 404) return null;
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    return { version: versionFromEtag(response.headers.get('ETag')), state: await response.json() };
+  }
+
+  /**
+   * Whether `remote` holds progress this game does not: more data produced over all
+   * runs, or as much but simulated later.
+   */
+  function isFurtherAlong(remote, local) {
+    const remoteData = Number(remote?.stats?.totalDataAllTime) || 0;
+    const localData = Number(local?.stats?.totalDataAllTime) || 0;
+    if (remoteData !== localData) return remoteData > localData;
+    return (Number(remote?.lastTickTime) || 0) > (Number(local?.lastTickTime) || 0);
+  }
+
+  function acknowledge(response, state) {
+    acknowledgedVersion = versionFromEtag(response.headers.get('ETag'));
+    acknowledgedState = state;
+    deltasSinceSnapshot = 0;
+  }
+
+  async function pushSnapshot(gameState) {
+    const body = JSON.stringify(gameState);
+    let response = acknowledgedVersion === null ? null : await upload(body, acknowledgedVersion);
+
+    if (response === null || response.status === 412) {
+      // First upload from this page, or another tab/device wrote in between: only
+      // overwrite a server save that is not ahead of this game.
+      const remote = await fetchRemote();
+      if (remote && isFurtherAlong(remote.state, gameState)) {
+        conflict = remote;
+        conflictReported = false;
+        log.warn(`Server save v${remote.version} is further along; waiting for the player`);
+        return false;
+      }
+      response = await upload(body, remote ? remote.version : null);
+    }
+
+    if (!response.ok) {
+      log.warn(`Save upload rejected (${response.status})`);
+      return false;
+    }
+
+    acknowledge(response, JSON.parse(body));
+    return true;
+  }
+
+  async function pushDelta(gameState) {
+    const patch = createMergePatch(acknowledgedState, gameState);
+    if (!patch) return true;
+
+    const body = JSON.stringify(patch);
+    const response = await fetch(getSaveUrl(), {
+      method: 'PATCH',
+      headers: {
+        'Content-Type': 'application/merge-patch+json',
+        'If-Match': `"${acknowledgedVersion}"`,
+      },
+      body,
+    });
+
+    if (!response.ok) {
+      // Server lost or moved past our base version: resynchronize with a full snapshot.
+      return pushSnapshot(gameState);
+    }
+
+    acknowledgedVersion = versionFromEtag(response.headers.get('ETag'));
+    acknowledgedState = applyMergePatch(acknowledgedState, JSON.parse(body));
+    deltasSinceSnapshot += 1;
+    return true;
+  }
+
+  function canSendDelta() {
+    return acknowledgedState !== null
+      && acknowledgedVersion !== null
+      && deltasSinceSnapshot < FULL_SNAPSHOT_EVERY;
+  }
+
+  /**
+   * Upload the current state: a merge patch against the last acknowledged version when
+   * possible, a full snapshot otherwise. Overlapping calls share the in-flight upload.
+   */
+  function push(gameState) {
+    if (!gameState || typeof fetch !== 'function' || conflict) return Promise.resolve(false);
+    if (inFlight) return inFlight;
+
+    inFlight = (canSendDelta() ? pushDelta(gameState) : pushSnapshot(gameState))
+      .catch((error) => {
+        log.warn('Save upload failed:', error);
+        return false;
+      })
+      .finally(() => {
+        inFlight = null;
+        if (conflict && !conflictReported) {
+          conflictReported = true;
+          onConflict(conflict.state);
+        }
+      });
+    return inFlight;
+  }
+
+  function getAcknowledgedVersion() {
+    return acknowledgedVersion;
+  }
+
+  /**
+   * Called with the server's state when it is further along than this game.
+   */
+  function setConflictHandler(handler) {
+    onConflict = handler || (() => {});
+  }
+
+  function hasConflict() {
+    return conflict !== null;
+  }
+
+  /**
+   * Settle a conflict. 'local' uploads `gameState` over the server save; 'server'
+   * adopts the server save as the acknowledged base and returns its state for the
+   * caller to load. Uploads resume either way.
+   */
+  function resolveConflict(choice, gameState) {
+    if (!conflict) return Promise.resolve(null);
+    const remote = conflict;
+    conflict = null;
+
+    if (choice === 'server') {
+      acknowledgedVersion = remote.version;
+      acknowledgedState = remote.state;
+      deltasSinceSnapshot = 0;
+      return Promise.resolve(structuredClone(remote.state));
+    }
+
+    acknowledgedVersion = remote.version;
+    acknowledgedState = null;
+    return push(gameState).then(() => null);
+  }
+
+  return {
+    getPlayerId,
+    push,
+    getAcknowledgedVersion,
+    setConflictHandler,
+    hasConflict,
+    resolveConflict,
+  };
+})();
+
+export const getPlayerId = SaveSync.getPlayerId;
+export const push = SaveSync.push;
+export const getAcknowledgedVersion = SaveSync.getAcknowledgedVersion;
+export const setConflictHandler = SaveSync.setConflictHandler;
+export const hasConflict = SaveSync.hasConflict;
+export const resolveConflict = SaveSync.resolveConflict;
+export default SaveSync;
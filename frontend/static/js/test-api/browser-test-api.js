@@ -1,5 +1,7 @@
 import * as Game from '../core/game-loop.js';
 import * as UI from '../ui/renderer.js';
+import * as Rng from '../infra/rng.js';
+import { replayCommandLog } from '../core/replay.js';
 import * as TutorialOverlay from '../ui/overlays/tutorial-overlay.js';
 
 function safeState() {
@@ -14,6 +16,8 @@ function dispatch(action) {
       const x = Number(action.x ?? 0);
       const y = Number(action.y ?? 0);
       Game.handleClick(x, y);
+      // Tests observe the click's effect right away instead of on the next frame.
+      Game.flushClicks();
       return true;
     }
     case 'BUY_BUILDING':
@@ -26,6 +30,11 @@ function dispatch(action) {
     case 'SET_BUY_AMOUNT':
       Game.setBuyAmount(action.amount);
       return true;
+    case 'SET_OFFLINE_AUTO_BUY':
+      Game.setOfflineAutoBuy(action.enabled);
+      return true;
+    case 'SET_OFFLINE_AUTO_BUY_POLICY':
+      return Game.setOfflineAutoBuyPolicy(action.policy);
     case 'PRESTIGE':
       return Game.performPrestige();
     case 'RESET':
@@ -41,7 +50,7 @@ function dispatch(action) {
       UI.showBugReport(() => {});
       return true;
     case 'SHOW_OFFLINE_MODAL':
-      UI.showOfflineModal(Number(action.dataEarned ?? 0), Number(action.secondsAway ?? 0));
+      UI.showOfflineModal(Number(action.dataEarned ?? 0), Number(action.secondsAway ?? 0), action.summary ?? null);
       return true;
     case 'SHOW_TUTORIAL_NARRATIVE':
       TutorialOverlay.init();
@@ -52,6 +61,29 @@ function dispatch(action) {
   }
 }
 
+let lastRecording = null;
+
+async function stopRecording() {
+  lastRecording = (await Game.stopRecording()) || null;
+  return lastRecording ? lastRecording.length : 0;
+}
+
+// Replays the last stopped recording headless and reports the resulting state.
+function replayRecording() {
+  if (!lastRecording) return null;
+  const { state, steps, commands, simulatedSec } = replayCommandLog(lastRecording);
+  return {
+    steps,
+    commands,
+    simulatedSec,
+    dataPoints: state.dataPoints,
+    totalDataEarned: state.stats.totalDataEarned,
+    buildings: state.buildings,
+    upgrades: state.upgrades,
+    totalClicks: state.stats.totalClicks,
+  };
+}
+
 function setState(partialState) {
   const state = safeState();
   if (!state) return null;
@@ -71,5 +103,24 @@ export function installBrowserTestApi() {
       return true;
     },
     isReady: () => Boolean(Game.getState && UI.renderAll && safeState()),
+    // Deterministic runs: seed or restore every random stream, or draw from one.
+    seedRng: (seed) => {
+      Rng.seedRng(seed);
+      return Rng.getRngState();
+    },
+    getRngState: () => Rng.getRngState(),
+    setRngState: (saved) => {
+      Rng.restoreRng(saved);
+      return Rng.getRngState();
+    },
+    drawRandom: (stream, count = 1) => Array.from({ length: count }, () => Rng.getRngStream(stream).next()),
+    // Session recording: the log stays here; replayRecording() re-runs it headless.
+    startRecording: () => Game.startRecording(),
+    stopRecording,
+    replayRecording,
+    getPerfCounters: () => ({
+      ...(Game.getPerfCounters ? Game.getPerfCounters() : {}),
+      render: UI.getRenderCounters ? UI.getRenderCounters() : null,
+    }),
   };
 }
@@ -0,0 +1,62 @@
+// container -> Map(key -> element) of the rows it currently holds.
+const keyedRows = new WeakMap();
+
+/**
+ * Keep one element per key in `container`, in the order of `items`.
+ *
+ * `create(item)` builds the element the first time a key appears; `update(element,
+ * item)` patches it on every call. Rows whose key is gone are removed, rows that stay
+ * are only moved when their position changed. Anything in the container that this
+ * function did not create is cleared on first use.
+ */
+export function reconcileKeyedList(container, items, { key, create, update }) {
+  if (!container) return [];
+
+  let rows = keyedRows.get(container);
+  if (!rows) {
+    rows = new Map();
+    keyedRows.set(container, rows);
+    container.replaceChildren();
+  }
+
+  const nextRows = new Map();
+  const ordered = [];
+  for (const item of items) {
+    const id = key(item);
+    let element = rows.get(id);
+    if (!element) element = create(item);
+    update(element, item);
+    nextRows.set(id, element);
+    ordered.push(element);
+  }
+
+  for (const [id, element] of rows) {
+    if (!nextRows.has(id)) element.remove();
+  }
+
+  let cursor = container.firstChild;
+  for (const element of ordered) {
+    if (element === cursor) {
+      cursor = cursor.nextSibling;
+    } else {
+      container.insertBefore(element, cursor);
+    }
+  }
+
+  keyedRows.set(container, nextRows);
+  return ordered;
+}
+
+export function patchText(element, text) {
+  if (element && element.textContent !== text) element.textContent = text;
+}
+
+export function patchAttribute(element, name, value) {
+  if (element && element.getAttribute(name) !== value) element.setAttribute(name, value);
+}
+
+export function createElementFromHtml(html) {
+  const template = document.createElement('template');
+  template.innerHTML = html.trim();
+  return template.content.firstElementChild;
+}
@@ -65,6 +65,14 @@ export function handleModalAction(actionElement, callbacks = {}) {
       gameApi?.setLanguage(actionElement.dataset.lang);
       callbacks.onRefreshSettings?.();
       break;
+    case 'set-offline-auto-buy':
+      gameApi?.setOfflineAutoBuy(actionElement.dataset.enabled === 'true');
+      callbacks.onRefreshSettings?.();
+      break;
+    case 'set-offline-auto-buy-policy':
+      gameApi?.setOfflineAutoBuyPolicy(actionElement.dataset.policy);
+      callbacks.onRefreshSettings?.();
+      break;
     case 'export-save':
       handleExport(gameApi);
       break;
@@ -0,0 +1,141 @@
+import * as Utils from '../../infra/number-formatters.js';
+
+const DEFAULT_POOL_SIZE = 24;
+const PARTICLE_DURATION_MS = 1200;
+const PARTICLE_RISE_PX = 100;
+// Above this click rate, clicks are summed into one "+N" label per interval.
+const DEFAULT_AGGREGATE_ABOVE_CPS = 15;
+const DEFAULT_AGGREGATE_INTERVAL_MS = 150;
+const RATE_WINDOW_MS = 1000;
+const FLUSH_TIMER_KEY = 'click-particles-flush';
+
+/**
+ * Click feedback from a fixed pool of particle nodes.
+ *
+ * Nodes are created once (up to `size`) and recycled oldest-first; each spawn only
+ * rewrites the text and restarts a transform/opacity animation, so sustained clicking
+ * keeps the node count and listener count flat.
+ *
+ * While clicks are being summed, a `schedule(key, delayMs, callback)` timer (the game
+ * loop's frame scheduler) shows whatever is still pending once the interval is up, so
+ * the last "+N" appears even when the clicking stops.
+ */
+export function createClickParticles({
+  container,
+  size = DEFAULT_POOL_SIZE,
+  aggregateAboveCps = DEFAULT_AGGREGATE_ABOVE_CPS,
+  aggregateIntervalMs = DEFAULT_AGGREGATE_INTERVAL_MS,
+  schedule = (key, delayMs, callback) => setTimeout(callback, delayMs),
+} = {}) {
+  const particles = [];
+  const animations = [];
+  let nextIndex = 0;
+
+  let windowStart = 0;
+  let windowClicks = 0;
+  let lastWindowCps = 0;
+
+  let aggregatedValue = 0;
+  let aggregateX = null;
+  let aggregateY = null;
+  let lastAggregateAt = -Infinity;
+
+  const counters = { spawned: 0, recycled: 0, aggregatedLabels: 0, poolSize: 0 };
+
+  function acquire() {
+    if (particles.length < size) {
+      const particle = document.createElement('div');
+      particle.className = 'click-particle pooled';
+      container.appendChild(particle);
+      particles.push(particle);
+      animations.push(null);
+      counters.poolSize = particles.length;
+      return particles.length - 1;
+    }
+
+    const index = nextIndex;
+    nextIndex = (nextIndex + 1) % size;
+    counters.recycled += 1;
+    return index;
+  }
+
+  function spawn(x, y, text, color = '') {
+    if (!container) return;
+
+    const index = acquire();
+    const particle = particles[index];
+    if (particle.textContent !== text) particle.textContent = text;
+    if (particle.style.color !== color) particle.style.color = color;
+    counters.spawned += 1;
+
+    animations[index]?.cancel();
+    if (typeof particle.animate !== 'function') {
+      particle.style.transform = `translate(${x}px, ${y}px)`;
+      return;
+    }
+
+    // fill: 'forwards' leaves the node at opacity 0 until it is reused.
+    animations[index] = particle.animate([
+      { transform: `translate(${x}px, ${y}px) scale(1.2)`, opacity: 1 },
+      { opacity: 0.8, offset: 0.5 },
+      { transform: `translate(${x}px, ${y - PARTICLE_RISE_PX}px) scale(0.5)`, opacity: 0 },
+    ], { duration: PARTICLE_DURATION_MS, easing: 'ease-out', fill: 'forwards' });
+  }
+
+  function trackRate(count, now) {
+    if (now - windowStart >= RATE_WINDOW_MS) {
+      lastWindowCps = (windowClicks * 1000) / Math.max(RATE_WINDOW_MS, now - windowStart);
+      windowStart = now;
+      windowClicks = 0;
+    }
+    windowClicks += count;
+    return Math.max(lastWindowCps, windowClicks);
+  }
+
+  /**
+   * Feedback for one click batch. `positions` holds x, y pairs (already budgeted by
+   * the caller); `count` clicks earned `valuePerClick` each.
+   */
+  function showClicks(positions, count, valuePerClick, now = performance.now()) {
+    if (!container || count <= 0) return;
+
+    const cps = trackRate(count, now);
+    if (cps <= aggregateAboveCps && aggregatedValue === 0) {
+      const text = `+${Utils.formatDps(valuePerClick)}`;
+      for (let i = 0; i < positions.length; i += 2) spawn(positions[i], positions[i + 1], text);
+      return;
+    }
+
+    aggregatedValue += count * valuePerClick;
+    if (positions.length >= 2) {
+      aggregateX = positions[positions.length - 2];
+      aggregateY = positions[positions.length - 1];
+    }
+
+    const waitMs = (lastAggregateAt + aggregateIntervalMs) - now;
+    if (waitMs <= 0 && positions.length >= 2) {
+      flushAggregate(now);
+      return;
+    }
+    schedule(FLUSH_TIMER_KEY, Math.max(0, waitMs), () => flushAggregate(performance.now()));
+  }
+
+  /**
+   * Show the summed value as one label at the latest click position.
+   */
+  function flushAggregate(now) {
+    if (aggregatedValue === 0) return;
+    if (aggregateX !== null) {
+      spawn(aggregateX, aggregateY, `+${Utils.formatDps(aggregatedValue)}`);
+      counters.aggregatedLabels += 1;
+    }
+    aggregatedValue = 0;
+    lastAggregateAt = now;
+  }
+
+  function getCounters() {
+    return { ...counters, pendingValue: aggregatedValue };
+  }
+
+  return { spawn, showClicks, getCounters };
+}
@@ -1,4 +1,5 @@
 import { getClickSfxVariantsCatalog } from '../../content/click-sfx-variants.js';
+import { getRngStream, RNG_STREAMS } from '../../infra/rng.js';
 
 function sanitizeVariant(variant) {
   return Object.freeze({
@@ -38,7 +39,7 @@ function clamp01(value) {
 }
 
 function randomCentered(scale) {
-  return (Math.random() * 2 - 1) * scale;
+  return (getRngStream(RNG_STREAMS.CLICK_SFX).next() * 2 - 1) * scale;
 }
 
 function pointerKey(pointerId) {
@@ -62,7 +63,7 @@ function createAudioPool(src, poolSize, preloadMode) {
 
 function shuffleIndices(indices) {
   for (let i = indices.length - 1; i > 0; i -= 1) {
-    const j = Math.floor(Math.random() * (i + 1));
+    const j = getRngStream(RNG_STREAMS.CLICK_SFX).int(0, i);
     const temp = indices[i];
     indices[i] = indices[j];
     indices[j] = temp;
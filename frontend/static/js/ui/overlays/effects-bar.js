@@ -7,6 +7,9 @@ const EFFECT_ICON_BY_TYPE = {
   production_mult: '&#x26A1;',
 };
 
+// container -> markup last written, so unchanged timers skip the innerHTML rewrite.
+const renderedMarkup = new WeakMap();
+
 function getEffectIcon(type) {
   return EFFECT_ICON_BY_TYPE[type] || DEFAULT_EFFECT_ICON;
 }
@@ -15,14 +18,7 @@ export function renderActiveEffectsBar(state, container) {
   if (!container) return;
 
   const effects = state?.activeEffects || [];
-  if (effects.length === 0) {
-    container.innerHTML = '';
-    container.style.display = 'none';
-    return;
-  }
-
-  container.style.display = 'flex';
-  container.innerHTML = effects.map((effect) => {
+  const markup = effects.map((effect) => {
     const remainingSeconds = Math.max(0, Math.ceil((effect.endTime - Date.now()) / 1000));
     const icon = getEffectIcon(effect.type);
 
@@ -33,4 +29,9 @@ export function renderActiveEffectsBar(state, container) {
       </div>
     `;
   }).join('');
+
+  if (renderedMarkup.get(container) === markup) return;
+  renderedMarkup.set(container, markup);
+  container.innerHTML = markup;
+  container.style.display = effects.length === 0 ? 'none' : 'flex';
 }
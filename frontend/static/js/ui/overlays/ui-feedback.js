@@ -1,12 +1,30 @@
 ﻿import * as Achievements from '../../content/achievements.js';
+import * as Buildings from '../../content/buildings.js';
 import * as Lang from '../../content/i18n/index.js';
 import * as Utils from '../../infra/number-formatters.js';
+import { getRngStream, RNG_STREAMS } from '../../infra/rng.js';
 import { createClickSfx } from './click-sfx.js';
 
-export function createUiFeedback({ elements, getState, renderAchievements, showModal }) {
+// Production segments listed in the offline modal before the rest are merged.
+const MAX_OFFLINE_ROWS = 5;
+
+/**
+ * `schedule(key, delayMs, callback)` runs UI timers on the game loop's frame scheduler
+ * (core/scheduler.js); a key replaces that key's pending timer, null adds a new one.
+ */
+export function createUiFeedback({
+  elements,
+  getState,
+  renderAchievements,
+  showModal,
+  schedule = (key, delayMs, callback) => setTimeout(callback, delayMs),
+}) {
   let achievementQueue = [];
   let isShowingAchievement = false;
   const clickSfx = createClickSfx();
+  // One persistent ring, restarted only once its animation has ended.
+  let clickRing = null;
+  let isRingAnimating = false;
 
   function playClickPress(pointerId) {
     clickSfx.playPress(pointerId);
@@ -44,13 +62,13 @@ export function createUiFeedback({ elements, getState, renderAchievements, showM
 
     popup.classList.add('visible');
 
-    setTimeout(() => {
+    schedule(null, 4000, () => {
       popup.classList.remove('visible');
-      setTimeout(() => {
+      schedule(null, 400, () => {
         isShowingAchievement = false;
         processAchievementQueue();
-      }, 400);
-    }, 4000);
+      });
+    });
   }
 
   function showGoldenData(onClick) {
@@ -62,8 +80,9 @@ export function createUiFeedback({ elements, getState, renderAchievements, showM
     if (!container) return;
 
     const rect = container.getBoundingClientRect();
-    const x = Utils.randomRange(20, rect.width - 60);
-    const y = Utils.randomRange(20, rect.height - 60);
+    const rng = getRngStream(RNG_STREAMS.UI);
+    const x = rng.range(20, rect.width - 60);
+    const y = rng.range(20, rect.height - 60);
 
     element.style.left = `${x}px`;
     element.style.top = `${y}px`;
@@ -79,10 +98,10 @@ export function createUiFeedback({ elements, getState, renderAchievements, showM
 
     element.addEventListener('click', handleClick);
 
-    setTimeout(() => {
+    schedule(null, 10000, () => {
       element.classList.remove('visible');
       element.removeEventListener('click', handleClick);
-    }, 10000);
+    });
   }
 
   function showBugReport(onFix) {
@@ -100,30 +119,92 @@ export function createUiFeedback({ elements, getState, renderAchievements, showM
 
     element.addEventListener('click', handleClick);
 
-    setTimeout(() => {
+    schedule(null, 15000, () => {
       element.classList.remove('visible');
       element.removeEventListener('click', handleClick);
-    }, 15000);
+    });
   }
 
-  function showOfflineModal(dataEarned, secondsAway) {
+  function showOfflineModal(dataEarned, secondsAway, summary = null) {
     const html = `
       <div class="offline-progress">
         <div class="offline-icon">&#x1F319;</div>
         <p>${Lang.t('offline_earned')}</p>
         <div class="offline-amount">+${Utils.formatNumber(dataEarned)} Data Points</div>
         <p class="offline-time">(${Utils.formatTime(secondsAway)})</p>
+        ${summary ? renderOfflineBreakdown(summary) : ''}
       </div>
     `;
 
     showModal?.(Lang.t('offline_progress'), html);
   }
 
+  /**
+   * Itemized offline summary (core/offline-progress.js): one row per production
+   * segment, the last ones merged past MAX_OFFLINE_ROWS, then effects, achievements
+   * and what the offline auto-buyer spent (core/offline-autobuyer.js).
+   */
+  function renderOfflineBreakdown(summary) {
+    const segments = summary.segments.slice(0, MAX_OFFLINE_ROWS);
+    const rest = summary.segments.slice(MAX_OFFLINE_ROWS);
+    if (rest.length > 0) {
+      const seconds = rest.reduce((sum, segment) => sum + segment.seconds, 0);
+      const data = rest.reduce((sum, segment) => sum + segment.data, 0);
+      segments.push({ seconds, data, dps: seconds > 0 ? data / (seconds * summary.rate) : 0 });
+    }
+
+    const rows = segments.map((segment) => `
+      <div class="stat-row">
+        <span>${Utils.formatTime(segment.seconds)} &times; ${Utils.formatDps(segment.dps)} ${Lang.t('per_second')}</span>
+        <span>+${Utils.formatNumber(segment.data)}</span>
+      </div>
+    `);
+    rows.push(`<div class="stat-row"><span>${Lang.t('offline_rate', Math.round(summary.rate * 100))}</span></div>`);
+    if (summary.expiredEffects.length > 0) {
+      rows.push(`<div class="stat-row"><span>${Lang.t('offline_effects_ended', summary.expiredEffects.length)}</span></div>`);
+    }
+    if (summary.achievements.length > 0) {
+      const names = summary.achievements
+        .map((id) => Achievements.getById(id))
+        .filter(Boolean)
+        .map((achievement) => Achievements.getName(achievement))
+        .join(', ');
+      rows.push(`<div class="stat-row"><span>${Lang.t('offline_achievements', names)}</span></div>`);
+    }
+    if (summary.autoBuy) rows.push(...renderAutoBuyRows(summary.autoBuy));
+
+    return `<div class="offline-breakdown">${rows.join('')}</div>`;
+  }
+
+  function renderAutoBuyRows(autoBuy) {
+    if (autoBuy.fellBack) {
+      return [`<div class="stat-row"><span>${Lang.t('offline_auto_buy_skipped')}</span></div>`];
+    }
+
+    const rows = [];
+    const buildings = Object.entries(autoBuy.buildings)
+      .map(([id, count]) => {
+        const def = Buildings.getById(id);
+        return def ? `${Lang.t(def.nameKey)} &times;${count}` : null;
+      })
+      .filter(Boolean);
+    if (buildings.length > 0) {
+      rows.push(`<div class="stat-row"><span>${Lang.t('offline_bought_buildings', buildings.join(', '))}</span></div>`);
+    }
+    if (autoBuy.upgrades.length > 0) {
+      rows.push(`<div class="stat-row"><span>${Lang.t('offline_bought_upgrades', autoBuy.upgrades.length)}</span></div>`);
+    }
+    if (autoBuy.spent > 0) {
+      rows.push(`<div class="stat-row"><span>${Lang.t('offline_spent', Utils.formatNumber(autoBuy.spent))}</span></div>`);
+    }
+    return rows;
+  }
+
   function showPrestigeAnimation() {
     const overlay = document.createElement('div');
     overlay.className = 'prestige-flash';
     document.body.appendChild(overlay);
-    setTimeout(() => overlay.remove(), 1500);
+    schedule(null, 1500, () => overlay.remove());
   }
 
   function animateClick() {
@@ -132,12 +213,19 @@ export function createUiFeedback({ elements, getState, renderAchievements, showM
     if (!clickOrb) return;
 
     clickOrb.classList.add('clicked');
-    setTimeout(() => clickOrb.classList.remove('clicked'), 150);
+    schedule('click-orb-pressed', 150, () => clickOrb.classList.remove('clicked'));
 
-    if (!clickTarget) return;
+    if (!clickTarget || isRingAnimating) return;
 
-    const ring = document.createElement('div');
-    ring.className = 'click-ring';
+    if (!clickRing) {
+      clickRing = document.createElement('div');
+      clickRing.className = 'click-ring';
+      clickRing.addEventListener('animationend', () => {
+        isRingAnimating = false;
+        clickRing.style.display = 'none';
+      });
+      clickTarget.appendChild(clickRing);
+    }
 
     const orbRect = clickOrb.getBoundingClientRect();
     const targetRect = clickTarget.getBoundingClientRect();
@@ -145,11 +233,11 @@ export function createUiFeedback({ elements, getState, renderAchievements, showM
     const x = (orbRect.left - targetRect.left) + (orbRect.width / 2);
     const y = (orbRect.top - targetRect.top) + (orbRect.height / 2);
 
-    ring.style.left = `${x}px`;
-    ring.style.top = `${y}px`;
-
-    clickTarget.appendChild(ring);
-    ring.addEventListener('animationend', () => ring.remove());
+    clickRing.style.left = `${x}px`;
+    clickRing.style.top = `${y}px`;
+    // display: none -> '' restarts the CSS animation.
+    clickRing.style.display = '';
+    isRingAnimating = true;
   }
 
   function showSaveIndicator() {
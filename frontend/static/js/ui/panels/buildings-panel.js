@@ -1,30 +1,50 @@
 ﻿import * as Buildings from '../../content/buildings.js';
 import * as Lang from '../../content/i18n/index.js';
 import * as Utils from '../../infra/number-formatters.js';
+import { createElementFromHtml, patchText, reconcileKeyedList } from '../keyed-list.js';
 
-const COST_ICON = '&#x1F4A0;';
+const COST_ICON = '\u{1F4A0}';
 const LOCK_ICON = '&#x1F512;';
-const DPS_ICON = '&#x26A1;';
+const DPS_ICON = '\u26A1';
+const LOCKED_ROW_KEY = '__locked__';
 
-function getScrollParent(element) {
-  if (!element) return null;
-  return element.closest('.tab-content');
+// building id -> price for the last (owned, discount, buyAmount) it was asked about.
+// `threshold` is the dataPoints needed for the row to be affordable: the bulk cost for
+// fixed amounts, the next unit's cost in Max mode.
+const priceTable = new Map();
+
+// buildings list element -> building rows rendered into it, so frames skip querySelectorAll.
+const renderedRows = new WeakMap();
+
+// row element -> its building and the child elements its updates patch.
+const rowParts = new WeakMap();
+
+function getPriceEntry(def, owned, discount, buyAmount) {
+  let entry = priceTable.get(def.id);
+  if (entry && entry.owned === owned && entry.discount === discount && entry.buyAmount === buyAmount) {
+    return entry;
+  }
+
+  const currentPrice = def.baseCost * discount;
+  const threshold = buyAmount === -1
+    ? Utils.calculateBuildingCost(currentPrice, owned, def.growthRate)
+    : Utils.calculateBulkCost(currentPrice, owned, buyAmount, def.growthRate);
+  entry = { owned, discount, buyAmount, threshold };
+  priceTable.set(def.id, entry);
+  return entry;
 }
 
 function calculateBuildingCostForBuyMode(state, def, owned, getBuildingDiscount) {
   const discount = getBuildingDiscount ? getBuildingDiscount() : 1;
-  const currentPrice = def.baseCost * discount;
   const buyAmount = state.settings.buyAmount || 1;
+  const entry = getPriceEntry(def, owned, discount, buyAmount);
 
   if (buyAmount === -1) {
-    const max = Utils.maxAffordable(currentPrice, owned, state.dataPoints, def.growthRate);
-    if (max.count === 0) {
-      return {
-        cost: Utils.calculateBuildingCost(currentPrice, owned, def.growthRate),
-        countToBuy: 1,
-      };
+    if (state.dataPoints < entry.threshold) {
+      return { cost: entry.threshold, countToBuy: 1 };
     }
 
+    const max = Utils.maxAffordable(def.baseCost * discount, owned, state.dataPoints, def.growthRate);
     return {
       cost: max.totalCost,
       countToBuy: max.count,
@@ -32,105 +52,154 @@ function calculateBuildingCostForBuyMode(state, def, owned, getBuildingDiscount)
   }
 
   return {
-    cost: Utils.calculateBulkCost(currentPrice, owned, buyAmount, def.growthRate),
+    cost: entry.threshold,
     countToBuy: buyAmount,
   };
 }
 
+function createBuildingRow(def) {
+  const item = createElementFromHtml(`
+    <div class="building-item" data-building="${def.id}" data-action="buy-building">
+      <div class="building-icon"></div>
+      <div class="building-info">
+        <div class="building-name"></div>
+        <div class="building-desc"></div>
+        <div class="building-stats">
+          <span class="building-dps">
+            <span class="building-produce-label" style="color: var(--text-muted); font-weight: normal;"></span>
+            <span class="building-unit-dps" style="color: var(--green-light)"></span>
+          </span>
+          <span class="building-total-dps"></span>
+        </div>
+      </div>
+      <div class="building-right">
+        <div class="building-cost"></div>
+        <div class="building-owned"></div>
+      </div>
+    </div>
+  `);
+  item.style.setProperty('--building-color', def.color);
+  item.querySelector('.building-icon').textContent = def.icon;
+
+  rowParts.set(item, {
+    def,
+    item,
+    name: item.querySelector('.building-name'),
+    desc: item.querySelector('.building-desc'),
+    produceLabel: item.querySelector('.building-produce-label'),
+    unitDps: item.querySelector('.building-unit-dps'),
+    totalDps: item.querySelector('.building-total-dps'),
+    costElement: item.querySelector('.building-cost'),
+    owned: item.querySelector('.building-owned'),
+    canAfford: null,
+  });
+  return item;
+}
+
+function updateBuildingRow(item, row) {
+  const parts = rowParts.get(item);
+  const { def, owned, cost, countToBuy, canAfford, dps, buyAmount } = row;
+  const amountDisplay = buyAmount !== 1 ? ` (x${countToBuy})` : '';
+
+  patchText(parts.name, Lang.t(def.nameKey));
+  patchText(parts.desc, Lang.t(def.descKey));
+  patchText(parts.produceLabel, Lang.t('produce'));
+  patchText(parts.unitDps, `${DPS_ICON} ${Utils.formatDps(dps)}/s`);
+  patchText(parts.totalDps, `(${Utils.formatDps(dps * owned)}/s total)`);
+  patchText(parts.costElement, `${COST_ICON} ${Utils.formatNumber(cost)}${amountDisplay}`);
+  patchText(parts.owned, String(owned));
+
+  if (parts.canAfford !== canAfford) {
+    parts.canAfford = canAfford;
+    item.classList.toggle('affordable', canAfford);
+    item.classList.toggle('locked', !canAfford);
+    parts.costElement.classList.toggle('too-expensive', !canAfford);
+  }
+}
+
+function createLockedRow() {
+  return createElementFromHtml(`
+    <div class="building-item building-locked">
+      <div class="building-icon">${LOCK_ICON}</div>
+      <div class="building-info">
+        <div class="building-name"></div>
+        <div class="building-desc"></div>
+      </div>
+    </div>
+  `);
+}
+
+function updateLockedRow(item, row) {
+  patchText(item.querySelector('.building-name'), Lang.t('locked'));
+  patchText(
+    item.querySelector('.building-desc'),
+    `${Lang.t('total')}: ${Utils.formatNumber(row.def.unlockAt)} Data Points`,
+  );
+}
+
+/**
+ * Reconcile the buildings list: one persistent row per visible building (plus the
+ * next locked one), patched in place so purchases keep row nodes, hover and scroll.
+ */
 export function renderBuildingsPanel(state, elements, options = {}) {
-  if (!elements?.buildingsList) return;
+  const list = elements?.buildingsList;
+  if (!list) return;
 
   try {
-    const parent = getScrollParent(elements.buildingsList);
-    const scrollTop = parent ? parent.scrollTop : 0;
-
     const getBuildingDiscount = options.getBuildingDiscount || (() => 1);
-    const visibleBuildings = Buildings.getVisible(state.stats.totalDataEarned);
-    let html = '';
+    const buyAmount = state.settings.buyAmount || 1;
+    const rows = [];
 
-    for (const def of visibleBuildings) {
+    for (const def of Buildings.getVisible(state.stats.totalDataEarned)) {
       const owned = state.buildings[def.id] || 0;
       const priceInfo = calculateBuildingCostForBuyMode(state, def, owned, getBuildingDiscount);
-      const cost = priceInfo.cost;
-      const countToBuy = priceInfo.countToBuy;
-
       const multiplier = state.buildingMultipliers?.[def.id] || 1;
-      const dps = def.baseDps * multiplier;
-      const totalDps = dps * owned;
-      const canAfford = state.dataPoints >= cost;
-      const buyAmount = state.settings.buyAmount || 1;
-      const amountDisplay = buyAmount !== 1 ? ` (x${countToBuy})` : '';
-
-      html += `
-        <div class="building-item ${canAfford ? 'affordable' : 'locked'}"
-             data-building="${def.id}"
-             data-action="buy-building"
-             style="--building-color: ${def.color}">
-          <div class="building-icon">${def.icon}</div>
-          <div class="building-info">
-            <div class="building-name">${Lang.t(def.nameKey)}</div>
-            <div class="building-desc">${Lang.t(def.descKey)}</div>
-            <div class="building-stats">
-              <span class="building-dps">
-                <span style="color: var(--text-muted); font-weight: normal;">${Lang.t('produce')}</span>
-                <span style="color: var(--green-light)">${DPS_ICON} ${Utils.formatDps(dps)}/s</span>
-              </span>
-              <span class="building-total-dps">(${Utils.formatDps(totalDps)}/s total)</span>
-            </div>
-          </div>
-          <div class="building-right">
-            <div class="building-cost ${canAfford ? '' : 'too-expensive'}">
-              ${COST_ICON} ${Utils.formatNumber(cost)}${amountDisplay}
-            </div>
-            <div class="building-owned">${owned}</div>
-          </div>
-        </div>
-      `;
-    }
 
-    const nextLocked = Buildings.getAll().find((building) => state.stats.totalDataEarned < building.unlockAt);
-    if (nextLocked) {
-      html += `
-        <div class="building-item building-locked">
-          <div class="building-icon">${LOCK_ICON}</div>
-          <div class="building-info">
-            <div class="building-name">${Lang.t('locked')}</div>
-            <div class="building-desc">${Lang.t('total')}: ${Utils.formatNumber(nextLocked.unlockAt)} Data Points</div>
-          </div>
-        </div>
-      `;
+      rows.push({
+        def,
+        owned,
+        buyAmount,
+        cost: priceInfo.cost,
+        countToBuy: priceInfo.countToBuy,
+        canAfford: state.dataPoints >= priceInfo.cost,
+        dps: def.baseDps * multiplier,
+      });
     }
 
-    elements.buildingsList.innerHTML = html;
-    if (parent) parent.scrollTop = scrollTop;
+    const nextLocked = Buildings.getAll().find((building) => state.stats.totalDataEarned < building.unlockAt);
+    if (nextLocked) rows.push({ def: nextLocked, locked: true });
+
+    const items = reconcileKeyedList(list, rows, {
+      key: (row) => (row.locked ? LOCKED_ROW_KEY : row.def.id),
+      create: (row) => (row.locked ? createLockedRow() : createBuildingRow(row.def)),
+      update: (item, row) => (row.locked ? updateLockedRow(item, row) : updateBuildingRow(item, row)),
+    });
+    renderedRows.set(list, items.map((item) => rowParts.get(item)).filter(Boolean));
   } catch (error) {
     console.error('Error rendering buildings:', error);
   }
 }
 
+/**
+ * Per-frame affordability refresh. Prices come from the price table, so a frame is one
+ * comparison per row; classes are only touched when a row flips.
+ */
 export function updateBuildingAffordability(state, elements, options = {}) {
-  if (!elements?.buildingsList) return;
+  const list = elements?.buildingsList;
+  if (!list) return;
 
   const getBuildingDiscount = options.getBuildingDiscount || (() => 1);
-  const items = elements.buildingsList.querySelectorAll('.building-item');
-
-  for (const item of items) {
-    const id = item.dataset.building;
-    if (!id) continue;
-
-    const def = Buildings.getById(id);
-    if (!def) continue;
-
-    const owned = state.buildings[id] || 0;
-    const cost = calculateBuildingCostForBuyMode(state, def, owned, getBuildingDiscount).cost;
-    const canAfford = state.dataPoints >= cost;
-
-    item.classList.toggle('affordable', canAfford);
-    item.classList.toggle('locked', !canAfford);
-
-    const costElement = item.querySelector('.building-cost');
-    if (costElement) {
-      costElement.classList.toggle('too-expensive', !canAfford);
-    }
+  const discount = getBuildingDiscount();
+  const buyAmount = state.settings.buyAmount || 1;
+  for (const row of renderedRows.get(list) || []) {
+    const owned = state.buildings[row.def.id] || 0;
+    const { threshold } = getPriceEntry(row.def, owned, discount, buyAmount);
+    const canAfford = state.dataPoints >= threshold;
+    if (canAfford === row.canAfford) continue;
+
+    row.canAfford = canAfford;
+    row.item.classList.toggle('affordable', canAfford);
+    row.item.classList.toggle('locked', !canAfford);
+    row.costElement.classList.toggle('too-expensive', !canAfford);
   }
 }
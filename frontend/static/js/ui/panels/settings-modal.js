@@ -1,7 +1,9 @@
 ﻿import * as Lang from '../../content/i18n/index.js';
 import { GAME_VERSION } from '../../app/version.js';
 
-export function createSettingsModal() {
+export function createSettingsModal(settings = {}) {
+  const autoBuy = !!settings.offlineAutoBuy;
+  const policy = settings.offlineAutoBuyPolicy === 'cheapest' ? 'cheapest' : 'payback';
   const html = `
     <div class="settings-group">
       <h3>${Lang.t('language')}</h3>
@@ -10,6 +12,18 @@ export function createSettingsModal() {
         <button data-action="set-language" data-lang="en" class="lang-btn ${Lang.getLanguage() === 'en' ? 'active' : ''}">&#x1F1FA;&#x1F1F8; EN</button>
       </div>
     </div>
+    <div class="settings-group">
+      <h3>${Lang.t('offline_auto_buy')}</h3>
+      <div class="language-switch">
+        <button data-action="set-offline-auto-buy" data-enabled="false" class="lang-btn ${autoBuy ? '' : 'active'}">${Lang.t('setting_off')}</button>
+        <button data-action="set-offline-auto-buy" data-enabled="true" class="lang-btn ${autoBuy ? 'active' : ''}">${Lang.t('setting_on')}</button>
+      </div>
+      <div class="language-switch">
+        <button data-action="set-offline-auto-buy-policy" data-policy="payback" class="lang-btn ${policy === 'payback' ? 'active' : ''}">${Lang.t('auto_buy_policy_payback')}</button>
+        <button data-action="set-offline-auto-buy-policy" data-policy="cheapest" class="lang-btn ${policy === 'cheapest' ? 'active' : ''}">${Lang.t('auto_buy_policy_cheapest')}</button>
+      </div>
+      <p class="settings-hint">${Lang.t('offline_auto_buy_desc')}</p>
+    </div>
     <div class="settings-group">
       <h3>${Lang.t('actions')}</h3>
       <div class="settings-buttons">
@@ -1,10 +1,14 @@
 ﻿import * as Upgrades from '../../content/upgrades.js';
 import * as Utils from '../../infra/number-formatters.js';
+import { createElementFromHtml, patchAttribute, patchText, reconcileKeyedList } from '../keyed-list.js';
 
 let tooltipElement = null;
 let tooltipTimeout = null;
-let overHandler = null;
-let outHandler = null;
+let tooltipTile = null;
+let tooltipList = null;
+
+// tile element -> its upgrade and the child elements its updates patch.
+const tileParts = new WeakMap();
 
 function getOrCreateTooltip() {
   if (!tooltipElement) {
@@ -20,6 +24,7 @@ function showTooltipFor(tile) {
   if (!text) return;
 
   const tooltip = getOrCreateTooltip();
+  tooltipTile = tile;
   tooltip.textContent = text;
   tooltip.classList.add('visible');
 
@@ -44,19 +49,17 @@ function hideTooltip() {
 }
 
 function bindUpgradeTooltips(upgradesList) {
-  if (!upgradesList) return;
-
-  if (overHandler) upgradesList.removeEventListener('mouseover', overHandler);
-  if (outHandler) upgradesList.removeEventListener('mouseout', outHandler);
+  if (!upgradesList || tooltipList === upgradesList) return;
+  tooltipList = upgradesList;
 
-  overHandler = (event) => {
+  const overHandler = (event) => {
     const tile = event.target.closest('.upgrade-tile');
     if (!tile) return;
     clearTimeout(tooltipTimeout);
     tooltipTimeout = setTimeout(() => showTooltipFor(tile), 100);
   };
 
-  outHandler = (event) => {
+  const outHandler = (event) => {
     const tile = event.target.closest('.upgrade-tile');
     if (!tile) return;
     const related = event.relatedTarget;
@@ -68,61 +71,75 @@ function bindUpgradeTooltips(upgradesList) {
   upgradesList.addEventListener('mouseout', outHandler);
 }
 
-function escapeAttributeValue(value) {
-  return value
-    .replace(/&/g, '&amp;')
-    .replace(/"/g, '&quot;')
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;');
+function createUpgradeTile(upgrade) {
+  const item = createElementFromHtml(`
+    <div class="upgrade-tile" data-upgrade="${upgrade.id}" data-action="buy-upgrade">
+      <div class="upgrade-tile-icon"></div>
+      <div class="upgrade-tile-cost"></div>
+    </div>
+  `);
+  item.querySelector('.upgrade-tile-icon').textContent = upgrade.icon;
+  patchText(item.querySelector('.upgrade-tile-cost'), Utils.formatNumber(upgrade.cost));
+
+  tileParts.set(item, { upgrade, item, canAfford: null });
+  return item;
 }
 
-export function renderUpgradesBar(state, elements) {
-  if (!elements?.upgradesList) return;
+function updateUpgradeTile(item, upgrade, state) {
+  const parts = tileParts.get(item);
+  const tooltip = `${Upgrades.getName(upgrade)}: ${Upgrades.getDesc(upgrade)} - Cost: ${Utils.formatNumber(upgrade.cost)}`;
+  patchAttribute(item, 'data-tooltip', tooltip);
+
+  const canAfford = state.dataPoints >= upgrade.cost;
+  if (parts.canAfford !== canAfford) {
+    parts.canAfford = canAfford;
+    item.classList.toggle('affordable', canAfford);
+    item.classList.toggle('locked', !canAfford);
+  }
+}
+
+/**
+ * Reconcile the upgrades bar: one persistent tile per available upgrade, cheapest first.
+ * `getAvailableUpgrades` supplies the simulation's tracked list (already sorted).
+ */
+export function renderUpgradesBar(state, elements, callbacks = {}) {
+  const list = elements?.upgradesList;
+  if (!list) return;
 
-  const available = Upgrades.getAvailable(state).sort((a, b) => a.cost - b.cost);
+  const available = callbacks.getAvailableUpgrades?.()
+    || Upgrades.getAvailable(state).sort((a, b) => a.cost - b.cost);
   const container = document.getElementById('upgrades-container');
   const bar = document.getElementById('upgrades-bar') || container;
   const target = container || bar;
 
-  if (available.length === 0) {
-    target.style.display = 'none';
-    elements.upgradesList.innerHTML = '';
-    return;
-  }
-
-  target.style.display = 'block';
-
-  let html = '';
-  for (const upgrade of available) {
-    const canAfford = state.dataPoints >= upgrade.cost;
-    const tooltip = `${Upgrades.getName(upgrade)}: ${Upgrades.getDesc(upgrade)} - Cost: ${Utils.formatNumber(upgrade.cost)}`;
-
-    html += `
-      <div class="upgrade-tile ${canAfford ? 'affordable' : 'locked'}"
-           data-upgrade="${upgrade.id}"
-           data-action="buy-upgrade"
-           data-tooltip="${escapeAttributeValue(tooltip)}">
-        <div class="upgrade-tile-icon">${upgrade.icon}</div>
-        <div class="upgrade-tile-cost">${Utils.formatNumber(upgrade.cost)}</div>
-      </div>
-    `;
-  }
+  if (target) target.style.display = available.length === 0 ? 'none' : 'block';
 
-  elements.upgradesList.innerHTML = html;
-  bindUpgradeTooltips(elements.upgradesList);
+  reconcileKeyedList(list, available, {
+    key: (upgrade) => upgrade.id,
+    create: createUpgradeTile,
+    update: (item, upgrade) => updateUpgradeTile(item, upgrade, state),
+  });
+  // A bought tile is removed under the pointer without a mouseout.
+  if (tooltipTile && !tooltipTile.isConnected) hideTooltip();
+  bindUpgradeTooltips(list);
 }
 
-export function updateUpgradeAffordability(state, elements) {
+/**
+ * Apply an affordability delta ({ affordable, unaffordable } upgrade ids) to the tiles.
+ */
+export function applyUpgradeAffordability(delta, elements) {
   const list = elements?.upgradesList || document.getElementById('upgrades-list');
-  if (!list) return;
-
-  for (const item of list.querySelectorAll('.upgrade-tile')) {
-    const id = item.dataset.upgrade;
-    const upgrade = Upgrades.getById(id);
-    if (!upgrade) continue;
-
-    const canAfford = state.dataPoints >= upgrade.cost;
-    item.classList.toggle('affordable', canAfford);
-    item.classList.toggle('locked', !canAfford);
+  if (!list || !delta) return;
+
+  for (const [upgradeIds, canAfford] of [[delta.affordable, true], [delta.unaffordable, false]]) {
+    for (const upgradeId of upgradeIds || []) {
+      const item = list.querySelector(`[data-upgrade="${upgradeId}"]`);
+      const parts = item && tileParts.get(item);
+      if (!parts || parts.canAfford === canAfford) continue;
+
+      parts.canAfford = canAfford;
+      item.classList.toggle('affordable', canAfford);
+      item.classList.toggle('locked', !canAfford);
+    }
   }
 }
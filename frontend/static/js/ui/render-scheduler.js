@@ -0,0 +1,98 @@
+const DEFAULT_LOW_PRIORITY_INTERVAL_MS = 250;
+
+/**
+ * Change-driven DOM writes for the per-frame UI update.
+ *
+ * Every write is keyed by element and property and compared against the last value
+ * committed there, so a frame where nothing visible changed touches no DOM. Panels
+ * that do not need frame accuracy (effect timers, prestige hint) run on a low-priority
+ * lane at `lowPriorityIntervalMs`.
+ */
+export function createRenderScheduler(options = {}) {
+  // element -> Map(property key -> last committed value)
+  const committed = new WeakMap();
+  const counters = { writes: 0, skipped: 0 };
+
+  let lowPriorityIntervalMs = options.lowPriorityIntervalMs ?? DEFAULT_LOW_PRIORITY_INTERVAL_MS;
+  let lastLowPriorityAt = -Infinity;
+
+  function commit(element, key, value, apply) {
+    if (!element) return false;
+
+    let values = committed.get(element);
+    if (!values) {
+      values = new Map();
+      committed.set(element, values);
+    }
+    if (values.has(key) && values.get(key) === value) {
+      counters.skipped += 1;
+      return false;
+    }
+
+    values.set(key, value);
+    apply();
+    counters.writes += 1;
+    return true;
+  }
+
+  function setText(element, text) {
+    return commit(element, 'text', text, () => {
+      element.textContent = text;
+    });
+  }
+
+  function setStyle(element, property, value) {
+    return commit(element, `style:${property}`, value, () => {
+      element.style[property] = value;
+    });
+  }
+
+  function setAttribute(element, name, value) {
+    return commit(element, `attr:${name}`, value, () => {
+      element.setAttribute(name, value);
+    });
+  }
+
+  function toggleClass(element, className, enabled) {
+    const on = Boolean(enabled);
+    return commit(element, `class:${className}`, on, () => {
+      element.classList.toggle(className, on);
+    });
+  }
+
+  /**
+   * Whether the low-priority lane should run this frame; starts a new interval if so.
+   */
+  function isLowPriorityDue(now = performance.now()) {
+    if (now - lastLowPriorityAt < lowPriorityIntervalMs) return false;
+    lastLowPriorityAt = now;
+    return true;
+  }
+
+  /**
+   * Run the low-priority lane on the next frame, e.g. after a full render.
+   */
+  function requestLowPriority() {
+    lastLowPriorityAt = -Infinity;
+  }
+
+  function setLowPriorityInterval(ms) {
+    const value = Number(ms);
+    if (Number.isFinite(value) && value >= 0) lowPriorityIntervalMs = value;
+  }
+
+  function getCounters() {
+    return { ...counters, lowPriorityIntervalMs };
+  }
+
+  return {
+    setText,
+    setStyle,
+    setAttribute,
+    toggleClass,
+    isLowPriorityDue,
+    requestLowPriority,
+    setLowPriorityInterval,
+    getCounters,
+  };
+}
@@ -3,8 +3,10 @@ import * as Utils from '../infra/number-formatters.js';
 
 import { bindDomEvents } from './dom-bindings.js';
 import { handleModalAction } from './modal-actions.js';
+import { createClickParticles } from './overlays/click-particles.js';
 import { renderActiveEffectsBar } from './overlays/effects-bar.js';
 import { createUiFeedback } from './overlays/ui-feedback.js';
+import { createRenderScheduler } from './render-scheduler.js';
 
 import {
   renderBuildingsPanel,
@@ -12,7 +14,7 @@ import {
 } from './panels/buildings-panel.js';
 import {
   renderUpgradesBar,
-  updateUpgradeAffordability as updateUpgradeAffordabilityPanel,
+  applyUpgradeAffordability as applyUpgradeAffordabilityPanel,
 } from './panels/upgrades-bar.js';
 import { renderAchievementsPanel } from './panels/achievements-panel.js';
 import { createStatsModal } from './panels/stats-modal.js';
@@ -26,12 +28,21 @@ const UI = (() => {
   let elements = {};
   let activePanel = null;
   let feedback = null;
+  let particles = null;
   let areEventsBound = false;
+  const scheduler = createRenderScheduler();
 
   function setGameApi(api) {
     gameApi = api;
   }
 
+  // UI timers run on the game loop's frame scheduler once it is attached.
+  function scheduleUiTimer(key, delayMs, callback) {
+    return gameApi?.schedule
+      ? gameApi.schedule(key, delayMs, callback)
+      : setTimeout(callback, delayMs);
+  }
+
   function init(state) {
     cacheElements();
 
@@ -41,9 +52,14 @@ const UI = (() => {
         getState: () => gameApi?.getState?.() || null,
         renderAchievements: (currentState) => renderAchievements(currentState),
         showModal,
+        schedule: scheduleUiTimer,
       });
     }
 
+    if (!particles && elements.particleContainer) {
+      particles = createClickParticles({ container: elements.particleContainer, schedule: scheduleUiTimer });
+    }
+
     if (!areEventsBound) {
       bindDomEvents(elements, {
         onClickTarget: (x, y) => gameApi?.handleClick?.(x, y),
@@ -148,7 +164,7 @@ const UI = (() => {
   }
 
   function showSettingsModal() {
-    const modal = createSettingsModal();
+    const modal = createSettingsModal(gameApi?.getState?.()?.settings);
     showModal(modal.title, modal.html);
   }
 
@@ -178,45 +194,58 @@ const UI = (() => {
     renderPrestigeButton(state);
     renderActiveEffects(state);
     updateAllText();
+    scheduler.requestLowPriority();
   }
 
+  /**
+   * Per-frame refresh. Writes go through the render scheduler, so only values whose
+   * formatted text or class state changed reach the DOM.
+   */
   function update(state) {
-    if (elements.dataCounter) {
-      elements.dataCounter.textContent = Utils.formatNumber(state.dataPoints);
-    }
-
-    if (elements.dpsDisplay) {
-      elements.dpsDisplay.textContent = `${Utils.formatDps(state.dps)} ${Lang.t('per_second')}`;
-    }
+    scheduler.setText(elements.dataCounter, Utils.formatNumber(state.dataPoints));
+    scheduler.setText(elements.dpsDisplay, `${Utils.formatDps(state.dps)} ${Lang.t('per_second')}`);
 
     if (elements.clickPowerDisplay) {
       const clickValue = gameApi?.calculateClickValue?.() || 1;
-      elements.clickPowerDisplay.textContent = `${Utils.formatDps(clickValue)} ${Lang.t('click_power')}`;
+      scheduler.setText(elements.clickPowerDisplay, `${Utils.formatDps(clickValue)} ${Lang.t('click_power')}`);
     }
 
     if (elements.innovationDisplay) {
       const visible = state.totalInnovationEarned > 0 || state.innovationPoints > 0;
-      elements.innovationDisplay.style.display = visible ? 'flex' : 'none';
+      scheduler.setStyle(elements.innovationDisplay, 'display', visible ? 'flex' : 'none');
       if (visible) {
-        elements.innovationDisplay.textContent = `${INNOVATION_ICON} ${state.innovationPoints}`;
+        scheduler.setText(elements.innovationDisplay, `${INNOVATION_ICON} ${state.innovationPoints}`);
       }
     }
 
     updateBuildingAffordability(state);
-    updateUpgradeAffordability(state);
+
+    if (scheduler.isLowPriorityDue()) updateLowPriority(state);
+  }
+
+  /**
+   * Panels that only need a few updates per second: effect timers and the prestige hint.
+   */
+  function updateLowPriority(state) {
     renderActiveEffects(state);
 
     const previewPoints = gameApi?.getInnovationPointsPreview?.() || 0;
     if (elements.btnPrestige) {
+      scheduler.toggleClass(elements.btnPrestige, 'has-points', previewPoints > 0);
       if (previewPoints > 0) {
-        elements.btnPrestige.classList.add('has-points');
-        elements.btnPrestige.title = `+${previewPoints} ${Lang.t('innovation_points')}`;
-      } else {
-        elements.btnPrestige.classList.remove('has-points');
+        scheduler.setAttribute(elements.btnPrestige, 'title', `+${previewPoints} ${Lang.t('innovation_points')}`);
       }
     }
   }
 
+  function setLowPriorityInterval(ms) {
+    scheduler.setLowPriorityInterval(ms);
+  }
+
+  function getRenderCounters() {
+    return { ...scheduler.getCounters(), particles: particles?.getCounters() || null };
+  }
+
   function renderBuildings(state) {
     renderBuildingsPanel(state, elements, {
       getBuildingDiscount: () => gameApi?.getBuildingDiscount?.() || 1,
@@ -230,11 +259,16 @@ const UI = (() => {
   }
 
   function renderUpgrades(state) {
-    renderUpgradesBar(state, elements);
+    renderUpgradesBar(state, elements, {
+      getAvailableUpgrades: () => gameApi?.getAvailableUpgrades?.(),
+    });
   }
 
-  function updateUpgradeAffordability(state) {
-    updateUpgradeAffordabilityPanel(state, elements);
+  /**
+   * Toggle only the upgrade tiles whose affordability the simulation reported as flipped.
+   */
+  function applyUpgradeAffordability(delta) {
+    applyUpgradeAffordabilityPanel(delta, elements);
   }
 
   function renderAchievements(state) {
@@ -264,8 +298,8 @@ const UI = (() => {
     feedback?.showBugReport(onFix);
   }
 
-  function showOfflineModal(dataEarned, secondsAway) {
-    feedback?.showOfflineModal(dataEarned, secondsAway);
+  function showOfflineModal(dataEarned, secondsAway, summary) {
+    feedback?.showOfflineModal(dataEarned, secondsAway, summary);
   }
 
   function showPrestigeAnimation() {
@@ -277,7 +311,16 @@ const UI = (() => {
   }
 
   function createParticle(x, y, text, color) {
-    Utils.createParticle(x, y, text, color);
+    if (particles) particles.spawn(x, y, text, color);
+    else Utils.createParticle(x, y, text, color);
+  }
+
+  /**
+   * Pooled feedback for a click batch: `positions` are x, y pairs, `count` clicks
+   * earned `valuePerClick` each.
+   */
+  function showClickParticles(positions, count, valuePerClick) {
+    particles?.showClicks(positions, count, valuePerClick);
   }
 
   function showToast(message, type, duration) {
@@ -309,6 +352,7 @@ const UI = (() => {
     update,
     renderBuildings,
     renderUpgrades,
+    applyUpgradeAffordability,
     renderAchievements,
     renderPrestige: renderPrestigeButton,
     showModal,
@@ -316,6 +360,7 @@ const UI = (() => {
     showToast,
     showSettingsModal,
     createParticle,
+    showClickParticles,
     animateClick,
     showSaveIndicator,
     showAchievement,
@@ -324,6 +369,8 @@ const UI = (() => {
     showOfflineModal,
     showPrestigeAnimation,
     updateAllText,
+    setLowPriorityInterval,
+    getRenderCounters,
   };
 })();
 
@@ -333,6 +380,7 @@ export const renderAll = UI.renderAll;
 export const update = UI.update;
 export const renderBuildings = UI.renderBuildings;
 export const renderUpgrades = UI.renderUpgrades;
+export const applyUpgradeAffordability = UI.applyUpgradeAffordability;
 export const renderAchievements = UI.renderAchievements;
 export const renderPrestige = UI.renderPrestige;
 export const showModal = UI.showModal;
@@ -340,6 +388,7 @@ export const closeModal = UI.closeModal;
 export const showToast = UI.showToast;
 export const showSettingsModal = UI.showSettingsModal;
 export const createParticle = UI.createParticle;
+export const showClickParticles = UI.showClickParticles;
 export const animateClick = UI.animateClick;
 export const showSaveIndicator = UI.showSaveIndicator;
 export const showAchievement = UI.showAchievement;
@@ -348,4 +397,6 @@ export const showBugReport = UI.showBugReport;
 export const showOfflineModal = UI.showOfflineModal;
 export const showPrestigeAnimation = UI.showPrestigeAnimation;
 export const updateAllText = UI.updateAllText;
+export const setLowPriorityInterval = UI.setLowPriorityInterval;
+export const getRenderCounters = UI.getRenderCounters;
 export default UI;
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+from playwright.sync_api import Page
+
+CONTENT_JSON = Path(__file__).resolve().parents[2] / 'frontend' / 'static' / 'data' / 'content.json'
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def expected_groups(definitions, positions_by_key):
+    return {key: [definitions[position]['id'] for position in positions] for key, positions in positions_by_key.items()}
+
+
+def test_contract_js_lookups_follow_the_precomputed_indexes(page: Page):
+    wait_ready(page)
+    content = json.loads(CONTENT_JSON.read_text(encoding='utf-8'))
+    indexes = content['indexes']
+
+    live = page.evaluate("""(keys) => {
+        const ids = (list) => list.map((definition) => definition.id);
+        const lookup = (getter, idList) => Object.fromEntries(idList.map((id) => [id, getter(id)?.id ?? null]));
+        const groups = (getter, groupKeys) => Object.fromEntries(groupKeys.map((key) => [key, ids(getter(key))]));
+        return {
+            buildingsById: lookup(window.Buildings.getById, keys.buildingsById),
+            upgradesById: lookup(window.Upgrades.getById, keys.upgradesById),
+            achievementsById: lookup(window.Achievements.getById, keys.achievementsById),
+            prestigeUpgradesById: lookup(window.Prestige.getUpgradeById, keys.prestigeUpgradesById),
+            upgradesByEffectType: groups(window.Upgrades.getByEffectType, keys.upgradesByEffectType),
+            upgradesByTarget: groups(window.Upgrades.getByTarget, keys.upgradesByTarget),
+            upgradesByRequirementType: groups(window.Upgrades.getByRequirementType, keys.upgradesByRequirementType),
+            unknownGroup: ids(window.Upgrades.getByEffectType('no_such_type')),
+        };
+    }""", {name: list(index) for name, index in indexes.items()})
+
+    for name in ('buildingsById', 'upgradesById', 'achievementsById', 'prestigeUpgradesById'):
+        assert live[name] == {key: key for key in indexes[name]}, name
+    assert live['upgradesByEffectType'] == expected_groups(content['upgrades'], indexes['upgradesByEffectType'])
+    assert live['upgradesByTarget'] == expected_groups(content['upgrades'], indexes['upgradesByTarget'])
+    assert live['upgradesByRequirementType'] == expected_groups(content['upgrades'], indexes['upgradesByRequirementType'])
+    assert live['unknownGroup'] == []
+
+
+def test_contract_content_indexes_are_read_only(page: Page):
+    wait_ready(page)
+
+    results = page.evaluate("""() => {
+        const attempt = (write) => {
+            try {
+                write();
+                return 'written';
+            } catch (error) {
+                return error.name;
+            }
+        };
+        const group = window.Upgrades.getByEffectType('click_mult');
+        return {
+            groupFrozen: Object.isFrozen(group),
+            groupPush: attempt(() => group.push({ id: 'extra' })),
+            emptyFrozen: Object.isFrozen(window.Upgrades.getByEffectType('no_such_type')),
+        };
+    }""")
+
+    assert results == {'groupFrozen': True, 'groupPush': 'TypeError', 'emptyFrozen': True}
@@ -0,0 +1,46 @@
+from starlette.testclient import TestClient
+
+from backend.routes import negotiate_language
+from main import app
+
+client = TestClient(app)
+
+
+def test_index_answers_if_none_match_with_304():
+    first = client.get("/", headers={"Accept-Language": "es-CO,es;q=0.9"})
+    assert first.status_code == 200
+    assert first.headers["vary"] == "Accept-Language"
+    assert first.headers["cache-control"] == "no-cache"
+    assert '<html lang="es">' in first.text
+
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    repeat = client.get("/", headers={"Accept-Language": "es", "If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+
+def test_index_etag_differs_per_language():
+    spanish = client.get("/", headers={"Accept-Language": "es"})
+    english = client.get("/", headers={"Accept-Language": "en-US,en;q=0.9"})
+    assert '<html lang="en">' in english.text
+    assert spanish.headers["etag"] != english.headers["etag"]
+
+    stale = client.get("/", headers={"Accept-Language": "en", "If-None-Match": spanish.headers["etag"]})
+    assert stale.status_code == 200
+
+
+def test_config_supports_conditional_get():
+    first = client.get("/api/config")
+    assert first.json()["tick_rate_ms"] == 33
+
+    repeat = client.get("/api/config", headers={"If-None-Match": first.headers["etag"]})
+    assert repeat.status_code == 304
+
+
+def test_negotiate_language_falls_back_to_default():
+    assert negotiate_language(None) == "es"
+    assert negotiate_language("fr-FR, en;q=0.5") == "en"
+    assert negotiate_language("en;q=0.4, es;q=0.8") == "es"
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from backend.config import CONTENT_DATA_PATH, CONTENT_SOURCE_DIR
+from backend.content import ContentError, build, build_indexes, load_sources, render
+
+
+def test_generated_content_is_up_to_date():
+    # Fails when frontend/content changed without running `python -m backend.content`.
+    assert CONTENT_DATA_PATH.read_bytes() == render(load_sources(CONTENT_SOURCE_DIR))
+
+
+def test_indexes_point_at_matching_definitions():
+    content = json.loads(CONTENT_DATA_PATH.read_text(encoding="utf-8"))
+    indexes = content["indexes"]
+
+    for key, index in [
+        ("buildings", "buildingsById"),
+        ("upgrades", "upgradesById"),
+        ("achievements", "achievementsById"),
+        ("prestigeUpgrades", "prestigeUpgradesById"),
+    ]:
+        assert {content[key][position]["id"]: position for position in indexes[index].values()} == indexes[index]
+        assert len(indexes[index]) == len(content[key])
+
+    for target, positions in indexes["upgradesByTarget"].items():
+        for position in positions:
+            effect = content["upgrades"][position]["effect"]
+            assert target == effect.get("target") or target in effect.get("targets", [])
+
+    for kind, positions in indexes["upgradesByEffectType"].items():
+        assert {content["upgrades"][p]["effect"]["type"] for p in positions} == {kind}
+
+    for kind, positions in indexes["upgradesByRequirementType"].items():
+        assert {content["upgrades"][p]["requirement"]["type"] for p in positions} == {kind}
+
+
+def test_build_writes_output(tmp_path):
+    output = tmp_path / "data" / "content.json"
+    data = build(CONTENT_SOURCE_DIR, output)
+
+    assert output.read_bytes() == data
+
+
+def minimal_content():
+    return {
+        "buildings": [{"id": "intern"}],
+        "upgrades": [
+            {
+                "id": "u1",
+                "effect": {"type": "building_mult", "target": "intern", "value": 2},
+                "requirement": {"type": "building_count", "target": "intern", "value": 1},
+            }
+        ],
+        "achievements": [],
+        "prestigeUpgrades": [],
+    }
+
+
+def test_build_indexes_rejects_unknown_references():
+    content = minimal_content()
+    content["upgrades"][0]["effect"]["target"] = "robot"
+
+    with pytest.raises(ContentError, match="robot"):
+        build_indexes(content)
+
+
+def test_build_indexes_rejects_duplicate_ids():
+    content = minimal_content()
+    content["buildings"].append({"id": "intern"})
+
+    with pytest.raises(ContentError, match="duplicate building"):
+        build_indexes(content)
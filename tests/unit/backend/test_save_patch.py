@@ -0,0 +1,21 @@
+from backend.save_patch import apply_merge_patch
+
+
+def test_merge_patch_rfc7386_examples():
+    assert apply_merge_patch({"a": "b"}, {"a": "c"}) == {"a": "c"}
+    assert apply_merge_patch({"a": "b"}, {"b": "c"}) == {"a": "b", "b": "c"}
+    assert apply_merge_patch({"a": "b"}, {"a": None}) == {}
+    assert apply_merge_patch({"a": ["b"]}, {"a": "c"}) == {"a": "c"}
+    assert apply_merge_patch({"a": {"b": "c"}}, {"a": {"b": "d", "c": None}}) == {"a": {"b": "d"}}
+    assert apply_merge_patch({"e": None}, {"a": 1}) == {"e": None, "a": 1}
+    assert apply_merge_patch([1, 2], {"a": {"bb": {"ccc": None}}}) == {"a": {"bb": {}}}
+
+
+def test_merge_patch_does_not_mutate_and_shares_untouched_subtrees():
+    upgrades = ["click_1", "intern_1"]
+    target = {"dataPoints": 1, "stats": {"totalClicks": 1}, "upgrades": upgrades}
+    result = apply_merge_patch(target, {"stats": {"totalClicks": 2}})
+
+    assert target["stats"] == {"totalClicks": 1}
+    assert result["stats"] == {"totalClicks": 2}
+    assert result["upgrades"] is upgrades
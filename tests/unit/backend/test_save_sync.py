@@ -0,0 +1,145 @@
+import asyncio
+import sqlite3
+
+import pytest
+from starlette.testclient import TestClient
+
+from backend import routes
+from backend.saves import SaveConflictError, SaveStore
+from main import app
+
+PLAYER = "player-0001"
+
+
+def test_save_store_coalesces_writes_into_one_flush(tmp_path):
+    async def scenario():
+        store = SaveStore(tmp_path / "saves.sqlite3", flush_interval=60)
+        await store.start()
+        for points in range(5):
+            await store.put(PLAYER, {"dataPoints": points})
+        await store.put("player-0002", {"dataPoints": 7})
+        assert store.pending_count == 2
+
+        assert await store.flush() == 2
+        assert await store.flush() == 0
+        await store.stop()
+
+    asyncio.run(scenario())
+
+    connection = sqlite3.connect(tmp_path / "saves.sqlite3")
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    rows = dict(connection.execute("SELECT player_id, version FROM saves").fetchall())
+    assert rows == {PLAYER: 5, "player-0002": 1}
+
+
+def test_save_store_rejects_stale_versions_and_survives_restart(tmp_path):
+    async def scenario():
+        store = SaveStore(tmp_path / "saves.sqlite3", cache_size=1)
+        first = await store.put(PLAYER, {"dataPoints": 1})
+        await store.put(PLAYER, {"dataPoints": 2}, expected_version=first.version)
+        with pytest.raises(SaveConflictError) as conflict:
+            await store.put(PLAYER, {"dataPoints": 3}, expected_version=first.version)
+        assert conflict.value.current_version == 2
+        await store.stop()
+
+        reopened = SaveStore(tmp_path / "saves.sqlite3")
+        record = await reopened.get(PLAYER)
+        await reopened.stop()
+        return record
+
+    record = asyncio.run(scenario())
+    assert record.version == 2
+    assert record.data == {"dataPoints": 2}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(routes, "save_store", SaveStore(tmp_path / "saves.sqlite3"))
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_save_api_round_trip_with_etags(client):
+    assert client.get(f"/api/saves/{PLAYER}").status_code == 404
+
+    created = client.put(f"/api/saves/{PLAYER}", json={"dataPoints": 10})
+    assert created.status_code == 200
+    assert created.json() == {"version": 1}
+    etag = created.headers["etag"]
+
+    fetched = client.get(f"/api/saves/{PLAYER}")
+    assert fetched.json() == {"dataPoints": 10}
+    assert fetched.headers["etag"] == etag
+
+    unchanged = client.get(f"/api/saves/{PLAYER}", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+
+    updated = client.put(f"/api/saves/{PLAYER}", json={"dataPoints": 20}, headers={"If-Match": etag})
+    assert updated.json() == {"version": 2}
+
+    stale = client.put(f"/api/saves/{PLAYER}", json={"dataPoints": 30}, headers={"If-Match": etag})
+    assert stale.status_code == 412
+    assert stale.headers["etag"] == '"2"'
+
+
+def test_save_api_validates_input(client):
+    assert client.put("/api/saves/bad id", json={}).status_code == 400
+    assert client.put(f"/api/saves/{PLAYER}", json=[1, 2]).status_code == 400
+    oversized = {"blob": "x" * (300 * 1024)}
+    assert client.put(f"/api/saves/{PLAYER}", json=oversized).status_code == 413
+
+
+def test_save_store_persists_deltas_and_compacts_to_snapshots(tmp_path):
+    path = tmp_path / "saves.sqlite3"
+
+    async def scenario():
+        store = SaveStore(path, snapshot_every=3)
+        base = await store.put(PLAYER, {"dataPoints": 0, "stats": {"totalClicks": 0}, "upgrades": ["click_1"]})
+        await store.flush()
+        second = await store.patch(PLAYER, {"dataPoints": 5, "stats": {"totalClicks": 1}}, base.version)
+        await store.patch(PLAYER, {"stats": {"totalClicks": 2}}, second.version)
+        await store.flush()
+        await store.stop()
+
+    asyncio.run(scenario())
+    connection = sqlite3.connect(path)
+    assert connection.execute("SELECT version FROM saves").fetchall() == [(1,)]
+    assert connection.execute("SELECT version FROM save_deltas ORDER BY version").fetchall() == [(2,), (3,)]
+
+    async def reload_and_compact():
+        store = SaveStore(path, snapshot_every=3)
+        record = await store.get(PLAYER)
+        assert record.deltas_since_snapshot == 2
+        compacted = await store.patch(PLAYER, {"dataPoints": None}, record.version)
+        await store.stop()
+        return record, compacted
+
+    record, compacted = asyncio.run(reload_and_compact())
+    assert record.data == {"dataPoints": 5, "stats": {"totalClicks": 2}, "upgrades": ["click_1"]}
+    assert compacted.data == {"stats": {"totalClicks": 2}, "upgrades": ["click_1"]}
+    assert connection.execute("SELECT version FROM saves").fetchall() == [(4,)]
+    assert connection.execute("SELECT COUNT(*) FROM save_deltas").fetchone() == (0,)
+
+
+def test_save_api_accepts_merge_patches(client):
+    created = client.put(f"/api/saves/{PLAYER}", json={"dataPoints": 1, "stats": {"totalClicks": 1}})
+    patch_headers = {"Content-Type": "application/merge-patch+json"}
+
+    missing_base = client.patch(f"/api/saves/{PLAYER}", json={"dataPoints": 2}, headers=patch_headers)
+    assert missing_base.status_code == 428
+
+    patched = client.patch(
+        f"/api/saves/{PLAYER}",
+        json={"stats": {"totalClicks": 2}},
+        headers={**patch_headers, "If-Match": created.headers["etag"]},
+    )
+    assert patched.json() == {"version": 2}
+    assert client.get(f"/api/saves/{PLAYER}").json() == {"dataPoints": 1, "stats": {"totalClicks": 2}}
+
+    stale = client.patch(
+        f"/api/saves/{PLAYER}",
+        json={"dataPoints": 3},
+        headers={**patch_headers, "If-Match": created.headers["etag"]},
+    )
+    assert stale.status_code == 412
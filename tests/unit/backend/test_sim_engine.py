@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from backend.sim import BatchState, Engine, SimulationConfig, load_content, simulate
+from backend.sim.engine import bulk_cost, building_cost, innovation_points, max_affordable
+
+
+@pytest.fixture(scope="module")
+def content():
+    return load_content()
+
+
+@pytest.fixture(scope="module")
+def engine(content):
+    return Engine(content)
+
+
+def single_run(content, buildings=(), upgrades=(), prestige=(), **fields):
+    state = BatchState.new(content, 1)
+    for building_id, count in dict(buildings).items():
+        state.buildings[0, content.building_index(building_id)] = count
+    for upgrade_id in upgrades:
+        state.upgrades[0, content.upgrade_index(upgrade_id)] = True
+    for upgrade_id in prestige:
+        state.prestige_upgrades[0, content.prestige_index(upgrade_id)] = True
+    for name, value in fields.items():
+        getattr(state, name)[0] = value
+    return state
+
+
+def test_cost_helpers_match_number_formatters():
+    # Values produced by Utils.* in infra/number-formatters.js.
+    assert building_cost(20, 0, 1.18) == 20
+    assert building_cost(150, 5, 1.18) == 344
+    assert bulk_cost(1500, 4, 9, 1.18) == 55510
+    assert max_affordable(18, 3, 1e6, 1.18) == (52, 898348)
+    assert max_affordable(150, 0, 149, 1.18) == (0, 0)
+    # No safety cap: late-game Max purchases are not truncated at 10,000 units.
+    assert max_affordable(1, 0, 1e300, 1.01)[0] == 68959
+
+
+def test_innovation_points_formula():
+    assert innovation_points([0, 999_999_999, 1e9, 4e9, 8.99e9]).tolist() == [0, 0, 1, 2, 2]
+
+
+def test_dps_and_click_value_match_economy_js(content, engine):
+    state = single_run(
+        content,
+        buildings={"intern": 25, "laptop": 12, "junior": 7, "senior": 3, "server": 1},
+        upgrades=[upgrade["id"] for upgrade in content.upgrades[::2]],
+        prestige=["p_click_boost", "p_production_1", "p_building_discount"],
+        total_innovation_earned=7,
+    )
+    for achievement_id in ["prod_1", "prod_2", "click_1", "build_1"]:
+        state.achievements[0, content.achievement_index(achievement_id)] = True
+
+    # recalculateDps / calculateClickValue on the same state in the browser.
+    assert engine.recalculate_dps(state)[0] == pytest.approx(64769.371875)
+    assert engine.click_value(state)[0] == pytest.approx(671.69371875)
+
+
+def test_building_discount_applies_to_next_costs(content, engine):
+    state = single_run(content, buildings={"intern": 3}, prestige=["p_building_discount"])
+    costs = engine.next_building_costs(state)[0]
+
+    assert costs[content.building_index("intern")] == np.ceil(20 * 0.9 * 1.18**3)
+    assert costs[content.building_index("laptop")] == 135
+
+
+def test_upgrade_requirements(content, engine):
+    state = single_run(content, total_clicks=100)
+    available = {content.upgrades[i]["id"] for i in np.flatnonzero(engine.unlocked_upgrades(state)[0])}
+    assert "click_1" in available
+
+    state.upgrades[0, content.upgrade_index("click_1")] = True
+    available = {content.upgrades[i]["id"] for i in np.flatnonzero(engine.unlocked_upgrades(state)[0])}
+    assert "click_1" not in available
+
+
+def test_prestige_resets_run_but_keeps_achievements(content, engine):
+    state = single_run(
+        content,
+        buildings={"intern": 10},
+        prestige=["p_start_bonus"],
+        total_data_all_time=4e9,
+        data_points=5e8,
+    )
+    state.achievements[0, 0] = True
+
+    prestiged = engine.prestige(state, np.array([True]))
+
+    assert prestiged.tolist() == [True]
+    assert state.total_innovation_earned[0] == 2
+    assert state.innovation_points[0] == 2
+    assert state.buildings.sum() == 0
+    assert state.data_points[0] == 100
+    assert state.achievements[0, 0]
+    # Nothing left to gain, so a second prestige is refused.
+    assert engine.prestige(state, np.array([True])).tolist() == [False]
+
+
+def test_simulate_batch_is_deterministic_and_progresses():
+    config = SimulationConfig(runs=64, duration_seconds=1800, click_rate_spread=2.0, seed=7)
+    first = simulate(config)
+    second = simulate(config)
+
+    assert np.array_equal(first.state.total_data_all_time, second.state.total_data_all_time)
+    assert (first.state.dps > 0).all()
+    assert (first.state.buildings.sum(axis=1) > 0).all()
+    assert first.summary()["runs"] == 64
+
+
+def test_simulate_with_prestige_policy():
+    result = simulate(SimulationConfig(runs=16, duration_seconds=4 * 3600, prestige_at_points=5, seed=1))
+
+    assert (result.state.times_prestiged > 0).all()
+    assert (result.state.prestige_upgrades.any(axis=1)).all()
+
+
+def test_config_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        SimulationConfig(buy_policy="random")
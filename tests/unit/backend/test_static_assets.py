@@ -0,0 +1,68 @@
+import gzip
+
+import brotli
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from backend.static_build import build, content_hash
+from backend.static_files import PrecompressedStaticFiles, accepted_encodings, load_manifest
+
+STYLE = b"body { color: #9ac31c; }\n" * 200
+
+
+def make_client(tmp_path):
+    source = tmp_path / "src"
+    (source / "css").mkdir(parents=True)
+    (source / "css" / "style.css").write_bytes(STYLE)
+    (source / "tiny.txt").write_bytes(b"x")
+
+    output = tmp_path / "out"
+    manifest = build(source, output)
+    load_manifest.cache_clear()
+    app = Starlette(routes=[Mount("/static", PrecompressedStaticFiles(directory=output))])
+    return TestClient(app), manifest
+
+
+def test_static_build_writes_hashed_and_compressed_copies(tmp_path):
+    _, manifest = make_client(tmp_path)
+    hashed = manifest["css/style.css"]
+
+    assert hashed == f"css/style.{content_hash(STYLE)}.css"
+    assert (tmp_path / "out" / hashed).read_bytes() == STYLE
+    assert brotli.decompress((tmp_path / "out" / f"{hashed}.br").read_bytes()) == STYLE
+    assert gzip.decompress((tmp_path / "out" / f"{hashed}.gz").read_bytes()) == STYLE
+    # Incompressible files are left without variants.
+    assert not (tmp_path / "out" / "tiny.txt.br").exists()
+
+
+def test_static_files_negotiates_encoding_and_cache_headers(tmp_path):
+    client, manifest = make_client(tmp_path)
+    hashed_url = f"/static/{manifest['css/style.css']}"
+
+    br = client.get(hashed_url, headers={"Accept-Encoding": "gzip, br"})
+    assert br.status_code == 200
+    assert br.headers["content-encoding"] == "br"
+    assert br.headers["content-type"].startswith("text/css")
+    assert br.headers["vary"] == "Accept-Encoding"
+    assert "immutable" in br.headers["cache-control"]
+    assert br.content == STYLE
+
+    gz = client.get(hashed_url, headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.content == STYLE
+
+    plain = client.get("/static/css/style.css", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["cache-control"] == "no-cache"
+
+    revalidated = client.get(
+        "/static/css/style.css",
+        headers={"Accept-Encoding": "identity", "If-None-Match": plain.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+
+def test_accepted_encodings_respects_quality_values():
+    assert accepted_encodings("br;q=0.8, gzip;q=0, *") == {"br", "*"}
+    assert accepted_encodings(None) == set()
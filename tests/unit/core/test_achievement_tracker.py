@@ -0,0 +1,32 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_building_purchase_unlocks_building_achievement(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate('window.__SUMMAN_TEST_API__.setState({ dataPoints: 100 })')
+
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SET_BUY_AMOUNT', amount: 1 })")
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'BUY_BUILDING', buildingId: 'intern' })")
+    page.wait_for_function("() => window.__SUMMAN_TEST_API__.getState().achievements.includes('build_1')")
+
+
+def test_ticks_do_not_rescan_achievements(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+
+    before = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().achievements')
+    page.wait_for_timeout(500)
+    after = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().achievements')
+
+    checks = after['checks'] - before['checks']
+    assert checks > 0
+    assert after['rebuilds'] == before['rebuilds']
+    # One threshold per scalar stat group per tick while nothing unlocks.
+    assert after['thresholdsTested'] - before['thresholdsTested'] <= checks * 4
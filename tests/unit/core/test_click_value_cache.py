@@ -0,0 +1,53 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_cached_click_value_follows_every_change(page: Page):
+    wait_ready(page)
+
+    steps = page.evaluate("""
+        async () => {
+            const { createSimulation } = await import('/static/js/core/simulation.js');
+            const Economy = await import('/static/js/core/economy.js');
+            const { createDefaultState } = await import('/static/js/infra/save-repository.js');
+
+            const simulation = createSimulation({ tickRateMs: 33 });
+            const state = createDefaultState();
+            state.dataPoints = 1e12;
+            state.stats.totalClicks = 100;
+            state.stats.totalDataEarned = 1e6;
+            simulation.load(state);
+
+            const steps = [];
+            const record = (label) => steps.push({
+                label,
+                cached: simulation.calculateClickValue(),
+                fresh: Economy.calculateClickValue(structuredClone(simulation.getState())),
+            });
+            record('start');
+            simulation.buyUpgrade('click_1');
+            record('click upgrade');
+            simulation.buyUpgrade('click_5');
+            simulation.buyBuilding('intern');
+            record('dps changed');
+            simulation.addActiveEffect('click_mult', 7, 100);
+            record('effect added');
+            simulation.runSteps(10);
+            record('effect expired');
+            return steps;
+        }
+    """)
+
+    for step in steps:
+        assert step['cached'] == step['fresh'], step['label']
+
+    values = [step['cached'] for step in steps]
+    assert values[1] > values[0]
+    assert values[2] > values[1]
+    assert values[3] > values[2]
+    assert values[4] < values[3]
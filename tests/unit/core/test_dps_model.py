@@ -0,0 +1,61 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_incremental_dps_matches_full_recalculation(page: Page):
+    wait_ready(page)
+
+    # Drives a standalone simulation, whose DPS goes through dps-model.js, and compares
+    # it with Economy.recalculateDps on a copy after every operation.
+    result = page.evaluate("""
+        async () => {
+            const { createSimulation } = await import('/static/js/core/simulation.js');
+            const Economy = await import('/static/js/core/economy.js');
+            const Buildings = await import('/static/js/content/buildings.js');
+            const Prestige = await import('/static/js/content/prestige-upgrades.js');
+            const { createDefaultState } = await import('/static/js/infra/save-repository.js');
+
+            let seed = 7;
+            const rand = () => {
+                seed = (seed * 1103515245 + 12345) % 2147483648;
+                return seed / 2147483648;
+            };
+            const pick = (list) => list[Math.floor(rand() * list.length)];
+
+            const simulation = createSimulation();
+            const state = createDefaultState();
+            state.dataPoints = 1e40;
+            state.stats.totalDataEarned = 1e40;
+            state.innovationPoints = 1e9;
+            simulation.load(state);
+
+            const mismatches = [];
+            for (let i = 0; i < 400; i += 1) {
+                const roll = rand();
+                if (roll < 0.5) {
+                    simulation.buyBuilding(pick(Buildings.getAll()).id);
+                } else if (roll < 0.75) {
+                    const available = simulation.getAvailableUpgrades();
+                    if (available.length > 0) simulation.buyUpgrade(pick(available).id);
+                } else if (roll < 0.9) {
+                    simulation.buyPrestigeUpgrade(pick(Prestige.getUpgrades()).id);
+                } else {
+                    simulation.addActiveEffect('production_mult', 1 + Math.floor(rand() * 4), 60000);
+                }
+                const live = simulation.getState();
+                const fresh = Economy.recalculateDps(structuredClone(live));
+                if (live.dps !== fresh) mismatches.push({ step: i, live: live.dps, fresh });
+            }
+            const final = simulation.getState();
+            return { mismatches, upgrades: final.upgrades.length, prestigeUpgrades: final.prestigeUpgrades.length };
+        }
+    """)
+
+    assert result['mismatches'] == []
+    assert result['upgrades'] > 0
+    assert result['prestigeUpgrades'] > 0
@@ -0,0 +1,74 @@
+import json
+
+from playwright.sync_api import Page, Route
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_long_gap_is_credited_as_one_catch_up(page: Page):
+    wait_ready(page)
+
+    result = page.evaluate("""
+        async () => {
+            const { createFixedClock } = await import('/static/js/core/fixed-clock.js');
+            let steps = 0;
+            let caughtUpSec = 0;
+            const clock = createFixedClock({
+                stepMs: 33,
+                maxSteppedMs: 5000,
+                onStep: () => { steps += 1; },
+                onCatchUp: (elapsedSec) => { caughtUpSec += elapsedSec; },
+            });
+            clock.advance(1000);
+            const shortSteps = clock.advance(1100);
+            const stepsBeforeGap = steps;
+            const gapSteps = clock.advance(61100);
+            return { shortSteps, gapSteps, stepsBeforeGap, steps, caughtUpSec };
+        }
+    """)
+
+    assert result['shortSteps'] == 3
+    # A 60 s gap is one catch-up call plus a single whole step, not ~1800 steps.
+    assert result['gapSteps'] == 1
+    credited = result['caughtUpSec'] + (result['steps'] - result['stepsBeforeGap']) * 0.033
+    assert abs(credited - 60) < 0.033 * 2
+
+
+def test_simulation_catch_up_credits_the_gap(page: Page):
+    wait_ready(page)
+
+    played = page.evaluate("""
+        async () => {
+            const { createSimulation } = await import('/static/js/core/simulation.js');
+            const { createDefaultState } = await import('/static/js/infra/save-repository.js');
+            const simulation = createSimulation({ tickRateMs: 33 });
+            const state = createDefaultState();
+            state.buildings.intern = 10;
+            simulation.load(state);
+            simulation.advance(1000);
+            const before = simulation.getState().stats.playTimeSeconds;
+            simulation.advance(61000);
+            return simulation.getState().stats.playTimeSeconds - before;
+        }
+    """)
+
+    assert abs(played - 60) < 0.033
+
+
+def test_server_config_sets_tick_and_render_rates(page: Page):
+    def serve_config(route: Route):
+        route.fulfill(
+            status=200,
+            content_type='application/json',
+            body=json.dumps({'tick_rate_ms': 50, 'render_interval_ms': 100}),
+        )
+
+    page.route('**/api/config', serve_config)
+    wait_ready(page)
+
+    page.wait_for_function('() => window.__SUMMAN_TEST_API__.getPerfCounters().clock.stepMs === 50')
+    assert page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().renderIntervalMs') == 100
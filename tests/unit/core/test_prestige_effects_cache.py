@@ -0,0 +1,37 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_prestige_effects_are_reused_between_frames(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+
+    before = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().prestigeEffects')
+    page.wait_for_timeout(500)
+    after = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().prestigeEffects')
+
+    assert after['hits'] > before['hits']
+    assert after['recomputes'] == before['recomputes']
+
+
+def test_replacing_prestige_upgrades_refreshes_discount(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("""
+        window.__SUMMAN_TEST_API__.setState({
+            dataPoints: 100,
+            prestigeUpgrades: ['p_building_discount']
+        })
+    """)
+
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SET_BUY_AMOUNT', amount: 1 })")
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'BUY_BUILDING', buildingId: 'intern' })")
+
+    state = page.evaluate('window.__SUMMAN_TEST_API__.getState()')
+    assert state['buildings'].get('intern') == 1
+    assert int(state['dataPoints']) == 82
@@ -49,3 +49,27 @@ def test_progression_buy_max_respects_bulk_math(page: Page):
     state = page.evaluate('window.__SUMMAN_TEST_API__.getState()')
     assert (state['buildings'].get('intern') or 0) == 3
     assert int(state['dataPoints']) == 28
+
+
+def test_progression_buy_max_with_late_game_budget(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("""
+        window.__SUMMAN_TEST_API__.setState({
+            dataPoints: 1e300,
+            stats: {
+                ...window.__SUMMAN_TEST_API__.getState().stats,
+                totalDataEarned: 1e300,
+                totalDataAllTime: 1e300
+            }
+        })
+    """)
+
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SET_BUY_AMOUNT', amount: -1 })")
+    bought = page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'BUY_BUILDING', buildingId: 'intern' })")
+
+    state = page.evaluate('window.__SUMMAN_TEST_API__.getState()')
+    owned = state['buildings'].get('intern') or 0
+    assert bought is True
+    assert owned > 4000
+    assert 0 <= state['dataPoints'] < 20 * 1.18 ** owned
@@ -0,0 +1,37 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_recorded_session_replays_to_the_same_state(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate('window.__SUMMAN_TEST_API__.setState({ dataPoints: 500 })')
+    page.evaluate('window.__SUMMAN_TEST_API__.startRecording()')
+
+    for _ in range(20):
+        page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'CLICK', x: 100, y: 100 })")
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'BUY_BUILDING', buildingId: 'intern' })")
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'BUY_BUILDING', buildingId: 'intern' })")
+    page.wait_for_timeout(500)
+
+    # Stop and read the live state in one task, so no simulation tick lands in between.
+    stopped = page.evaluate("""
+        async () => {
+            const api = window.__SUMMAN_TEST_API__;
+            const size = await api.stopRecording();
+            return { size, state: JSON.parse(JSON.stringify(api.getState())) };
+        }
+    """)
+    assert stopped['size'] > 0
+    live = stopped['state']
+    replayed = page.evaluate('window.__SUMMAN_TEST_API__.replayRecording()')
+
+    assert replayed['commands'] >= 3
+    assert replayed['buildings'] == live['buildings']
+    assert replayed['totalClicks'] == live['stats']['totalClicks']
+    assert replayed['dataPoints'] == live['dataPoints']
@@ -0,0 +1,39 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_seeded_streams_repeat_and_stay_independent(page: Page):
+    wait_ready(page)
+
+    page.evaluate('window.__SUMMAN_TEST_API__.seedRng(1234)')
+    first = page.evaluate("window.__SUMMAN_TEST_API__.drawRandom('goldenReward', 5)")
+
+    page.evaluate('window.__SUMMAN_TEST_API__.seedRng(1234)')
+    page.evaluate("window.__SUMMAN_TEST_API__.drawRandom('ui', 50)")
+    second = page.evaluate("window.__SUMMAN_TEST_API__.drawRandom('goldenReward', 5)")
+
+    assert first == second
+    assert all(0 <= value < 1 for value in first)
+
+
+def test_stream_positions_survive_save_and_load(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate('window.__SUMMAN_TEST_API__.seedRng(99)')
+    page.evaluate("window.__SUMMAN_TEST_API__.drawRandom('randomEvent', 3)")
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SAVE' })")
+
+    saved = page.evaluate("JSON.parse(localStorage.getItem('summan_clicker_save')).rng")
+    assert saved['seed'] == 99
+    expected = page.evaluate("window.__SUMMAN_TEST_API__.drawRandom('randomEvent', 3)")
+
+    page.reload()
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    restored = page.evaluate('window.__SUMMAN_TEST_API__.getRngState()')
+    assert restored['seed'] == 99
+    assert page.evaluate("window.__SUMMAN_TEST_API__.drawRandom('randomEvent', 3)") == expected
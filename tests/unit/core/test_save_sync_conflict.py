@@ -0,0 +1,77 @@
+import json
+
+from playwright.sync_api import Page, Route
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def serve_remote_save(page: Page, remote: dict, version: int):
+    """Answer GET with `remote` at `version`; record PUTs and accept them."""
+    uploads = []
+
+    def handle(route: Route):
+        request = route.request
+        if request.method == 'GET':
+            route.fulfill(status=200, content_type='application/json', body=json.dumps(remote),
+                          headers={'ETag': f'"{version}"'})
+            return
+        uploads.append({'method': request.method, 'if_match': request.headers.get('if-match')})
+        route.fulfill(status=200, content_type='application/json', body=json.dumps({'version': version + 1}),
+                      headers={'ETag': f'"{version + 1}"'})
+
+    page.route('**/api/saves/*', handle)
+    return uploads
+
+
+def push_current_state(page: Page):
+    return page.evaluate("""
+        async () => {
+            const SaveSync = await import('/static/js/infra/save-sync.js');
+            return SaveSync.push(window.__SUMMAN_TEST_API__.getState());
+        }
+    """)
+
+
+def remote_copy(page: Page, total_data_all_time: float, data_points: float):
+    remote = page.evaluate('JSON.parse(JSON.stringify(window.__SUMMAN_TEST_API__.getState()))')
+    remote['stats']['totalDataAllTime'] = total_data_all_time
+    remote['dataPoints'] = data_points
+    return remote
+
+
+def test_server_save_behind_is_overwritten_with_its_version(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate('window.__SUMMAN_TEST_API__.setState({ stats: { ...window.__SUMMAN_TEST_API__.getState().stats, totalDataAllTime: 500 } })')
+    uploads = serve_remote_save(page, remote_copy(page, 10, 10), 7)
+
+    assert push_current_state(page) is True
+    assert uploads == [{'method': 'PUT', 'if_match': '"7"'}]
+
+
+def test_server_save_ahead_waits_for_the_player(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    uploads = serve_remote_save(page, remote_copy(page, 1e9, 12345), 7)
+    page.on('dialog', lambda dialog: dialog.accept())
+
+    assert push_current_state(page) is False
+    # Accepting the prompt loads the server's save; nothing was uploaded over it.
+    page.wait_for_function('() => window.__SUMMAN_TEST_API__.getState().dataPoints === 12345')
+    assert uploads == []
+
+
+def test_keeping_the_local_game_overwrites_on_purpose(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    uploads = serve_remote_save(page, remote_copy(page, 1e9, 12345), 7)
+    page.on('dialog', lambda dialog: dialog.dismiss())
+
+    assert push_current_state(page) is False
+    page.wait_for_timeout(200)
+    assert uploads == [{'method': 'PUT', 'if_match': '"7"'}]
+    assert page.evaluate('window.__SUMMAN_TEST_API__.getState().dataPoints') != 12345
@@ -0,0 +1,35 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_event_deadlines_survive_save_and_load(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SAVE' })")
+
+    saved = page.evaluate("JSON.parse(localStorage.getItem('summan_clicker_save')).timers")
+    assert saved['goldenData'] > 0
+    assert saved['randomEvent'] > 0
+
+    page.reload()
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SAVE' })")
+
+    restored = page.evaluate("JSON.parse(localStorage.getItem('summan_clicker_save')).timers")
+    assert restored == saved
+
+
+def test_effect_expires_through_its_timer(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ activeEffects: [{ type: 'production_mult', multiplier: 2, endTime: Date.now() + 200 }] })")
+
+    page.wait_for_function('() => window.__SUMMAN_TEST_API__.getState().activeEffects.length === 0')
+    timers = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().effectTimers')
+    assert timers['fired'] >= 1
+    assert timers['pending'] == 0
@@ -0,0 +1,66 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page, url='http://127.0.0.1:8000'):
+    page.goto(url)
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_worker_mode_mirrors_clicks_and_purchases(page: Page):
+    wait_ready(page, 'http://127.0.0.1:8000/?worker=1')
+    assert page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().engine') == 'worker'
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    # setState edits the mirror; recalculateDps sends it back to the worker as a LOAD.
+    page.evaluate('window.__SUMMAN_TEST_API__.setState({ dataPoints: 1000 })')
+    page.wait_for_function('() => window.__SUMMAN_TEST_API__.getState().dataPoints >= 1000')
+
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'CLICK', x: 100, y: 100 })")
+    page.wait_for_function('() => window.__SUMMAN_TEST_API__.getState().stats.totalClicks === 1')
+
+    bought = page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'BUY_BUILDING', buildingId: 'intern' })")
+    assert bought is True
+    state = page.evaluate('window.__SUMMAN_TEST_API__.getState()')
+    assert state['buildings']['intern'] == 1
+    assert state['dataPoints'] < 1000
+    assert state['dps'] > 0
+
+    missing = page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'BUY_BUILDING', buildingId: 'no_such_building' })")
+    assert missing is False
+
+
+def test_snapshot_round_trip(page: Page):
+    wait_ready(page)
+
+    result = page.evaluate("""
+        async () => {
+            const { encodeSnapshot, applySnapshot, SNAPSHOT_LENGTH } = await import('/static/js/core/simulation-snapshot.js');
+            const { createDefaultState } = await import('/static/js/infra/save-repository.js');
+
+            const source = createDefaultState();
+            Object.assign(source, { dataPoints: 1234.5, dps: 67.25, lastTickTime: 1700000000123 });
+            Object.assign(source.stats, {
+                totalDataEarned: 1e20,
+                totalDataAllTime: 2e20,
+                totalClicks: 42,
+                totalClicksAllTime: 420,
+                playTimeSeconds: 3600.5,
+                highestDps: 99,
+            });
+            const numbers = encodeSnapshot(source, 8.5);
+
+            const target = createDefaultState();
+            const clickValue = applySnapshot(target, numbers);
+            return {
+                length: numbers.length,
+                expected: SNAPSHOT_LENGTH,
+                clickValue,
+                same: ['dataPoints', 'dps', 'lastTickTime'].every((key) => target[key] === source[key])
+                    && JSON.stringify(target.stats) === JSON.stringify(source.stats),
+            };
+        }
+    """)
+
+    assert result['length'] == result['expected']
+    assert result['clickValue'] == 8.5
+    assert result['same'] is True
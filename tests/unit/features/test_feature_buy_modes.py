@@ -32,3 +32,43 @@ def test_feature_buy_max(page: Page):
     page.click('.building-item[data-building="intern"]')
     owned = page.evaluate("window.__SUMMAN_TEST_API__.getState().buildings['intern'] || 0")
     assert owned > 0
+
+
+def test_feature_buy_mode_affordability_tracks_price(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ dataPoints: 100, stats: { ...window.__SUMMAN_TEST_API__.getState().stats, totalDataEarned: 100, totalDataAllTime: 100 } })")
+    intern = '.building-item[data-building="intern"]'
+
+    page.click('button[data-amount="1"]')
+    page.wait_for_selector(f'{intern}.affordable')
+
+    # 10 interns cost far more than 100.
+    page.click('button[data-amount="10"]')
+    page.wait_for_selector(f'{intern}.locked')
+
+    # Max only needs the next unit to be affordable.
+    page.click('button[data-amount="-1"]')
+    page.wait_for_selector(f'{intern}.affordable')
+
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ dataPoints: 5 })")
+    page.wait_for_selector(f'{intern}.locked')
+
+
+def test_feature_purchase_keeps_building_row_node(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ dataPoints: 1000, stats: { ...window.__SUMMAN_TEST_API__.getState().stats, totalDataEarned: 1000, totalDataAllTime: 1000 } })")
+    page.evaluate("""
+        window.__rowBeforePurchase = document.querySelector('.building-item[data-building="intern"]');
+    """)
+
+    page.click('button[data-amount="1"]')
+    page.click('.building-item[data-building="intern"]')
+
+    same_node = page.evaluate("""
+        document.querySelector('.building-item[data-building="intern"]') === window.__rowBeforePurchase
+    """)
+    owned_text = page.text_content('.building-item[data-building="intern"] .building-owned')
+    assert same_node
+    assert owned_text == '1'
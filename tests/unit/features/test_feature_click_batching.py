@@ -0,0 +1,73 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_feature_burst_of_clicks_is_applied_as_one_batch(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    before = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().clicks')
+
+    page.evaluate("""
+        () => {
+            const orb = document.getElementById('click-orb');
+            for (let i = 0; i < 60; i += 1) {
+                orb.dispatchEvent(new MouseEvent('click', { bubbles: true, clientX: 10, clientY: 10 }));
+            }
+        }
+    """)
+    page.wait_for_function('() => window.__SUMMAN_TEST_API__.getState().stats.totalClicks === 60')
+
+    after = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().clicks')
+    assert after['clicks'] - before['clicks'] == 60
+    assert after['batches'] - before['batches'] == 1
+    assert after['particles'] - before['particles'] <= 8
+    assert page.evaluate('window.__SUMMAN_TEST_API__.getState().dataPoints') >= 60
+
+
+def test_feature_sustained_clicking_keeps_particle_nodes_flat(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+
+    for _ in range(10):
+        page.evaluate("""
+            () => {
+                const orb = document.getElementById('click-orb');
+                for (let i = 0; i < 20; i += 1) {
+                    orb.dispatchEvent(new MouseEvent('click', { bubbles: true, clientX: 10, clientY: 10 }));
+                }
+            }
+        """)
+        page.wait_for_timeout(50)
+
+    particles = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().render.particles')
+    nodes = page.locator('#particle-container .click-particle').count()
+    assert nodes == particles['poolSize']
+    assert nodes <= 24
+    assert particles['aggregatedLabels'] > 0
+    assert page.locator('#click-target .click-ring').count() <= 1
+
+
+def test_feature_pending_click_sum_is_shown_when_clicking_stops(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+
+    for total in (30, 60):
+        page.evaluate("""
+            () => {
+                const orb = document.getElementById('click-orb');
+                for (let i = 0; i < 30; i += 1) {
+                    orb.dispatchEvent(new MouseEvent('click', { bubbles: true, clientX: 10, clientY: 10 }));
+                }
+            }
+        """)
+        page.wait_for_function(f'() => window.__SUMMAN_TEST_API__.getState().stats.totalClicks === {total}')
+
+    # Nothing is clicked from here on; the last sum still gets its label.
+    page.wait_for_function('() => window.__SUMMAN_TEST_API__.getPerfCounters().render.particles.pendingValue === 0')
+    particles = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().render.particles')
+    assert particles['aggregatedLabels'] >= 1
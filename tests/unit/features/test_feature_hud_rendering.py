@@ -0,0 +1,28 @@
+from playwright.sync_api import Page
+
+
+def wait_ready(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+
+
+def test_feature_static_screen_skips_dom_writes(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.wait_for_timeout(300)
+
+    before = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().render')
+    page.wait_for_timeout(500)
+    after = page.evaluate('window.__SUMMAN_TEST_API__.getPerfCounters().render')
+
+    assert after['writes'] == before['writes']
+    assert after['skipped'] > before['skipped']
+
+
+def test_feature_hud_still_updates_on_change(page: Page):
+    wait_ready(page)
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ dataPoints: 1234 })")
+
+    page.wait_for_function("() => document.getElementById('data-counter').textContent === (1234).toLocaleString()")
@@ -8,3 +8,115 @@ def test_feature_offline_progress_modal(page: Page):
 
     page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SHOW_OFFLINE_MODAL', dataEarned: 250, secondsAway: 120 })")
     assert page.locator('#modal-overlay.active').count() == 1
+
+
+def test_feature_offline_modal_itemizes_summary(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__')
+
+    page.evaluate("""
+        window.__SUMMAN_TEST_API__.dispatch({
+            type: 'SHOW_OFFLINE_MODAL',
+            dataEarned: 300,
+            secondsAway: 120,
+            summary: {
+                rate: 0.5,
+                segments: [{ seconds: 60, dps: 4, data: 120 }, { seconds: 60, dps: 6, data: 180 }],
+                expiredEffects: [{ type: 'production_mult', multiplier: 2, endTime: 0 }],
+                achievements: ['prod_1'],
+            },
+        })
+    """)
+    assert page.locator('#modal-overlay.active .offline-breakdown .stat-row').count() == 5
+
+
+def test_feature_week_away_settles_on_load(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ buildings: { ...window.__SUMMAN_TEST_API__.getState().buildings, intern: 10 } })")
+
+    page.evaluate("""
+        () => {
+            const state = window.__SUMMAN_TEST_API__.getState();
+            const weekMs = 7 * 24 * 3600 * 1000;
+            state.lastTickTime = Date.now() - weekMs;
+            state.activeEffects = [{ type: 'production_mult', multiplier: 2, endTime: Date.now() - weekMs + 60000 }];
+            localStorage.setItem('summan_clicker_save', JSON.stringify(state));
+        }
+    """)
+    page.reload()
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.wait_for_selector('#modal-overlay.active .offline-breakdown')
+
+    state = page.evaluate('window.__SUMMAN_TEST_API__.getState()')
+    assert state['activeEffects'] == []
+    assert state['stats']['playTimeSeconds'] >= 7 * 24 * 3600
+    assert 'prod_1' in state['achievements']
+
+
+def test_feature_offline_auto_buy_spends_earnings(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SET_OFFLINE_AUTO_BUY', enabled: true })")
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ buildings: { ...window.__SUMMAN_TEST_API__.getState().buildings, intern: 10 } })")
+
+    page.evaluate("""
+        () => {
+            const state = window.__SUMMAN_TEST_API__.getState();
+            state.lastTickTime = Date.now() - 10 * 60 * 1000;
+            localStorage.setItem('summan_clicker_save', JSON.stringify(state));
+        }
+    """)
+    page.reload()
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.wait_for_selector('#modal-overlay.active .offline-breakdown')
+
+    state = page.evaluate('window.__SUMMAN_TEST_API__.getState()')
+    assert state['settings']['offlineAutoBuy'] is True
+    assert state['buildings']['intern'] > 10 or state['buildings'].get('laptop', 0) > 0
+
+
+def test_feature_offline_auto_buy_settles_a_day_within_budget(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SET_OFFLINE_AUTO_BUY', enabled: true })")
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ buildings: { intern: 1 } })")
+
+    page.evaluate("""
+        () => {
+            const state = window.__SUMMAN_TEST_API__.getState();
+            state.lastTickTime = Date.now() - 24 * 3600 * 1000;
+            localStorage.setItem('summan_clicker_save', JSON.stringify(state));
+        }
+    """)
+    page.reload()
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.wait_for_selector('#modal-overlay.active .offline-breakdown')
+
+    # A fallback to the lump-sum settlement would leave the single intern untouched.
+    state = page.evaluate('window.__SUMMAN_TEST_API__.getState()')
+    assert sum(state['buildings'].values()) > 100
+    assert len(state['upgrades']) > 0
+
+
+def test_feature_offline_auto_buy_policy_is_a_setting(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+    assert page.evaluate('window.__SUMMAN_TEST_API__.getState().settings.offlineAutoBuyPolicy') == 'payback'
+
+    assert page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SET_OFFLINE_AUTO_BUY_POLICY', policy: 'cheapest' })")
+    assert not page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SET_OFFLINE_AUTO_BUY_POLICY', policy: 'random' })")
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'SAVE' })")
+
+    page.reload()
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    assert page.evaluate('window.__SUMMAN_TEST_API__.getState().settings.offlineAutoBuyPolicy') == 'cheapest'
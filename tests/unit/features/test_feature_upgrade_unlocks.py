@@ -8,3 +8,16 @@ def test_feature_upgrade_unlocks(page: Page):
 
     page.evaluate("window.__SUMMAN_TEST_API__.setState({ dataPoints: 5000, stats: { ...window.__SUMMAN_TEST_API__.getState().stats, totalDataEarned: 5000, totalDataAllTime: 5000, totalClicks: 200 } })")
     assert page.locator('.upgrade-tile').count() > 0
+
+
+def test_feature_upgrade_appears_when_click_crosses_threshold(page: Page):
+    page.goto('http://127.0.0.1:8000')
+    page.wait_for_selector('#click-orb')
+    page.wait_for_function('() => !!window.__SUMMAN_TEST_API__ && window.__SUMMAN_TEST_API__.isReady()')
+    page.evaluate('window.__SUMMAN_TEST_API__.reset()')
+
+    page.evaluate("window.__SUMMAN_TEST_API__.setState({ stats: { ...window.__SUMMAN_TEST_API__.getState().stats, totalDataEarned: 2999.5 } })")
+    assert page.locator('.upgrade-tile[data-upgrade="click_3"]').count() == 0
+
+    page.evaluate("window.__SUMMAN_TEST_API__.dispatch({ type: 'CLICK' })")
+    page.wait_for_selector('.upgrade-tile[data-upgrade="click_3"]')